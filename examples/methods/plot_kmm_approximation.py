@@ -0,0 +1,93 @@
+"""
+Low-rank kernel approximation for Kernel Mean Matching
+======================================================
+
+This example compares the weights estimated by
+:class:`~skada.KMMReweightAdapter` with the exact kernel and with
+low-rank approximations of the kernel (Nystroem landmarks and random
+Fourier features) on a covariate shift dataset.
+"""
+
+# License: BSD 3-Clause
+
+# %% Imports
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from skada import KMMReweightAdapter
+from skada.datasets import make_shifted_datasets
+
+# %%
+# Benchmark of the weight fidelity and of the computational time
+# ---------------------------------------------------------------
+#
+# The exact solver builds the (n_source, n_source) kernel matrix, while the
+# approximated ones only store (n_source, n_components) features and solve
+# the QP on the factored kernel.
+
+RANDOM_SEED = 42
+GAMMA = 1.0
+N_COMPONENTS = 100
+
+methods = [None, "nystroem", "rff"]
+n_samples_list = [25, 50, 100, 200]
+n_source_list = []
+times = {method: [] for method in methods}
+correlations = {method: [] for method in methods[1:]}
+
+for n_samples in n_samples_list:
+    X, y, sample_domain = make_shifted_datasets(
+        n_samples_source=n_samples,
+        n_samples_target=n_samples,
+        noise=0.1,
+        random_state=RANDOM_SEED,
+    )
+    n_source_list.append(np.sum(sample_domain >= 0))
+
+    weights = {}
+    for method in methods:
+        adapter = KMMReweightAdapter(
+            gamma=GAMMA,
+            approximation=method,
+            n_components=N_COMPONENTS,
+            random_state=RANDOM_SEED,
+        )
+        start = time.time()
+        adapter.fit(X, sample_domain=sample_domain)
+        times[method].append(time.time() - start)
+        weights[method] = adapter.source_weights_
+
+    for method in methods[1:]:
+        correlations[method].append(np.corrcoef(weights[None], weights[method])[0, 1])
+
+    print(
+        f"n_source={n_source_list[-1]:5d} | "
+        + " | ".join(f"{str(method)}: {times[method][-1]:.2f}s" for method in methods)
+    )
+
+# %%
+# Plot of the results
+# -------------------
+
+labels = {None: "Exact", "nystroem": "Nystroem", "rff": "Random Fourier"}
+
+figure, axes = plt.subplots(1, 2, figsize=(10, 4))
+for method in methods:
+    axes[0].loglog(n_source_list, times[method], "o-", label=labels[method])
+axes[0].set_xlabel("Number of source samples")
+axes[0].set_ylabel("Fit time (s)")
+axes[0].set_title("Computational time")
+axes[0].legend()
+
+for method in methods[1:]:
+    axes[1].semilogx(n_source_list, correlations[method], "o-", label=labels[method])
+axes[1].set_xlabel("Number of source samples")
+axes[1].set_ylabel("Correlation with exact weights")
+axes[1].set_title("Weight fidelity")
+axes[1].set_ylim(0, 1.05)
+axes[1].legend()
+
+plt.tight_layout()
+plt.show()
@@ -0,0 +1,133 @@
+"""
+Comparison of the QP solvers for Kernel Mean Matching
+=====================================================
+
+This example compares the solvers available in :func:`~skada.utils.qp_solve`
+on the quadratic programs of :class:`~skada.KMMReweightAdapter`: the SLSQP
+solver of scipy, the Frank-Wolfe algorithm and an ADMM solver in the style of
+OSQP. The exact kernel is used for the small problems and a Nystroem
+approximation of the kernel for problems up to 50k variables.
+"""
+
+# License: BSD 3-Clause
+
+# %% Imports
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+from sklearn.kernel_approximation import Nystroem
+
+from skada import KMMReweightAdapter
+from skada.datasets import make_shifted_datasets
+
+# %%
+# Quality of the weights
+# ----------------------
+#
+# The solvers are compared with the squared MMD between the reweighted source
+# and the target distributions, estimated with a common Nystroem feature map
+# so that it can be computed for any number of samples.
+
+RANDOM_SEED = 42
+GAMMA = 1.0
+
+
+def squared_mmd(features, weights, sample_domain):
+    """Squared MMD between the reweighted source and the target."""
+    source_mean = weights @ features[sample_domain >= 0] / weights.sum()
+    target_mean = features[sample_domain < 0].mean(axis=0)
+    return np.sum((source_mean - target_mean) ** 2)
+
+
+def run_benchmark(n_variables_list, solvers, approximation=None):
+    """Fit KMM with each solver and return the fit times and the MMDs."""
+    times = {solver: [] for solver in solvers}
+    mmds = {solver: [] for solver in solvers}
+    for n_variables in n_variables_list:
+        # make_shifted_datasets draws 8 samples per requested sample
+        X, y, sample_domain = make_shifted_datasets(
+            n_samples_source=n_variables // 8,
+            n_samples_target=n_variables // 8,
+            noise=0.1,
+            random_state=RANDOM_SEED,
+        )
+        features = Nystroem(
+            gamma=GAMMA, n_components=200, random_state=RANDOM_SEED
+        ).fit_transform(X)
+        for solver in solvers:
+            adapter = KMMReweightAdapter(
+                gamma=GAMMA,
+                solver=solver,
+                approximation=approximation,
+                random_state=RANDOM_SEED,
+            )
+            start = time.time()
+            adapter.fit(X, sample_domain=sample_domain)
+            times[solver].append(time.time() - start)
+            mmds[solver].append(
+                squared_mmd(features, adapter.source_weights_, sample_domain)
+            )
+        print(
+            f"n_variables={n_variables:6d} | "
+            + " | ".join(
+                f"{solver}: {times[solver][-1]:.2f}s, MMD^2={mmds[solver][-1]:.2e}"
+                for solver in solvers
+            )
+        )
+    return times, mmds
+
+
+# %%
+# Exact kernel
+# ------------
+#
+# SLSQP scales badly with the number of variables and is only run on the
+# smallest problem.
+
+exact_sizes = [200, 1000, 5000]
+exact_results = {"scipy": run_benchmark(exact_sizes[:1], ["scipy"])}
+exact_results["fw-admm"] = run_benchmark(exact_sizes, ["frank-wolfe", "admm"])
+
+# %%
+# Low-rank kernel
+# ---------------
+#
+# With a Nystroem approximation the kernel matrix is never materialized: the
+# Frank-Wolfe iterations only need products with the kernel and the ADMM
+# linear systems are solved with the Woodbury identity.
+
+low_rank_sizes = [1000, 5000, 20000, 50000]
+low_rank_times, low_rank_mmds = run_benchmark(
+    low_rank_sizes, ["frank-wolfe", "admm"], approximation="nystroem"
+)
+
+# %%
+# Plot of the results
+# -------------------
+
+figure, axes = plt.subplots(1, 2, figsize=(10, 4))
+scipy_times, scipy_mmds = exact_results["scipy"]
+exact_times, exact_mmds = exact_results["fw-admm"]
+axes[0].loglog(exact_sizes[:1], scipy_times["scipy"], "o", label="SLSQP (exact)")
+axes[1].semilogx(exact_sizes[:1], scipy_mmds["scipy"], "o", label="SLSQP (exact)")
+for solver, label in [("frank-wolfe", "Frank-Wolfe"), ("admm", "ADMM")]:
+    axes[0].loglog(exact_sizes, exact_times[solver], "o-", label=f"{label} (exact)")
+    axes[0].loglog(
+        low_rank_sizes, low_rank_times[solver], "s--", label=f"{label} (Nystroem)"
+    )
+    axes[1].semilogx(exact_sizes, exact_mmds[solver], "o-", label=f"{label} (exact)")
+    axes[1].semilogx(
+        low_rank_sizes, low_rank_mmds[solver], "s--", label=f"{label} (Nystroem)"
+    )
+axes[0].set_xlabel("Number of variables")
+axes[0].set_ylabel("Fit time (s)")
+axes[0].set_title("Computational time")
+axes[0].legend()
+axes[1].set_xlabel("Number of variables")
+axes[1].set_ylabel("Squared MMD after reweighting")
+axes[1].set_title("Quality of the weights")
+axes[1].legend()
+
+plt.tight_layout()
+plt.show()
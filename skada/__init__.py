@@ -64,7 +64,7 @@ from ._ot import (
 from .transformers import SubsampleTransformer, DomainStratifiedSubsampleTransformer
 from ._self_labeling import DASVMClassifier
 from ._pipeline import make_da_pipeline
-from .utils import source_target_split, per_domain_split
+from .utils import DomainIndex, source_target_split, per_domain_split
 
 
 # make sure that the usage of the library is not possible
@@ -139,4 +139,5 @@ __all__ = [
 
     "source_target_split",
     "per_domain_split",
+    "DomainIndex",
 ]
@@ -3,14 +3,17 @@
 # License: BSD 3-Clause
 
 
+import time
 import warnings
 
 import numpy as np
 import ot
+import scipy.sparse as sp
 from sklearn.base import clone
 from sklearn.linear_model import LinearRegression, LogisticRegression
 from sklearn.preprocessing import OneHotEncoder
 from sklearn.svm import SVC
+from sklearn.utils import check_random_state
 from sklearn.utils.metaestimators import available_if
 from sklearn.utils.validation import check_is_fitted
 
@@ -20,9 +23,15 @@ from .base import BaseAdapter, DAEstimator
 from .utils import check_X_y_domain, per_domain_split, source_target_split
 
 
-def get_jdot_class_cost_matrix(Ys, Xt, estimator=None, metric="multinomial"):
+def get_jdot_class_cost_matrix(
+    Ys, Xt, estimator=None, metric="multinomial", dtype=None, chunk_size=None
+):
     """Cost matrix for joint distribution optimal transport classification problem.
 
+    The cost matrix is computed with matrix products (or by blocks of source
+    samples for the hinge loss with soft labels) so that the memory used is
+    the one of the output.
+
     Parameters
     ----------
     Ys : array-like of shape (n_samples,n_classes)
@@ -37,6 +46,13 @@ def get_jdot_class_cost_matrix(Ys, Xt, estimator=None, metric="multinomial"):
     metric : str, default='multinomial'
         The metric to use for the cost matrix. Can be 'multinomial' for cross-entropy
         cost/ multinomial logistic regression or 'hinge' for hinge cost (SVM/SVC).
+    dtype : data-type, default=None
+        Data type of the cost matrix (e.g. np.float32 to halve the memory). If
+        None, float64 is used.
+    chunk_size : int, default=None
+        Number of source samples processed at once by the blocked hinge
+        cost, only used when `Ys` is not one hot encoded. If None, the blocks
+        are chosen to use at most the memory of the output.
 
     Returns
     -------
@@ -50,35 +66,52 @@ def get_jdot_class_cost_matrix(Ys, Xt, estimator=None, metric="multinomial"):
          Systems (NIPS), 2017.
 
     """
+    dtype = np.float64 if dtype is None else dtype
+
     if estimator is None:
-        M = np.ones((Ys.shape[0], Xt.shape[0])) * 10
+        M = np.full((Ys.shape[0], Xt.shape[0]), 10, dtype=dtype)
         return M
 
+    Ys = np.asarray(Ys, dtype=dtype)
     if metric == "multinomial":
         if hasattr(estimator, "predict_log_proba"):
             Yt_pred = estimator.predict_log_proba(Xt)
-            M = -np.sum(Ys[:, None, :] * Yt_pred[None, :, :], 2)
         elif hasattr(estimator, "predict_proba"):
-            Yt_pred = estimator.predict_proba(Xt)
-            M = -np.sum(Ys[:, None, :] * np.log(Yt_pred[None, :, :] + 1e-16), 2)
+            Yt_pred = np.log(estimator.predict_proba(Xt) + 1e-16)
         else:
             raise ValueError(
                 "Estimator must have predict_proba or predict_log_proba"
                 " method for cce loss"
             )
+        M = -(Ys @ Yt_pred.astype(dtype).T)
 
     elif metric == "hinge":
-        Ys = 2 * Ys - 1  # make Y -1/1 for hinge loss
-
         if hasattr(estimator, "decision_function"):
             Yt_pred = estimator.decision_function(Xt)
             if len(Yt_pred.shape) == 1:
                 Yt_pred = np.repeat(Yt_pred.reshape(-1, 1), 2, axis=1)
-            M = np.maximum(0, 1 - Ys[:, None, :] * Yt_pred[None, :, :]).sum(2)
+            Yt_pred = Yt_pred.astype(dtype)
         else:
             raise ValueError(
                 "Estimator must have decision_function method for hinge loss"
             )
+
+        if np.all((Ys == 0) | (Ys == 1)):
+            # with Y in {-1, 1}, max(0, 1 - y * p) is max(0, 1 - p) for the
+            # positive classes and max(0, 1 + p) for the negative ones
+            M = Ys @ np.maximum(0, 1 - Yt_pred).T
+            M += (1 - Ys) @ np.maximum(0, 1 + Yt_pred).T
+        else:
+            Ys = 2 * Ys - 1  # make Y -1/1 for hinge loss
+            n_samples, n_classes = Ys.shape
+            if chunk_size is None:
+                chunk_size = max(1, n_samples // n_classes)
+            M = np.empty((n_samples, Xt.shape[0]), dtype=dtype)
+            for start in range(0, n_samples, chunk_size):
+                block = slice(start, start + chunk_size)
+                M[block] = np.maximum(
+                    0, 1 - Ys[block, None, :] * Yt_pred[None, :, :]
+                ).sum(2)
     else:
         raise ValueError("Unknown metric")
 
@@ -196,6 +229,160 @@ def get_tgt_loss_jdot_class(Xh, yh, wh, estimator, metric="multinomial"):
     return loss
 
 
+def _mean_sqeuclidean(Xs, Xt):
+    """Mean of the squared euclidean distances between Xs and Xt in O(n)."""
+    return (
+        np.mean(np.sum(Xs**2, axis=1))
+        + np.mean(np.sum(Xt**2, axis=1))
+        - 2 * np.mean(Xs, axis=0) @ np.mean(Xt, axis=0)
+    )
+
+
+def _get_minibatches(n_samples_source, n_samples_target, batch_size, rng):
+    """Split shuffled source and target indices in the same number of batches.
+
+    The number of batches is set by the largest domain. The samples of a
+    domain with fewer samples than batches are cycled over several shuffles
+    so that no batch is empty.
+    """
+    n_batches = int(np.ceil(max(n_samples_source, n_samples_target) / batch_size))
+
+    def split(n_samples):
+        n_cycles = int(np.ceil(n_batches / n_samples))
+        idx = np.concatenate([rng.permutation(n_samples) for _ in range(n_cycles)])
+        return np.array_split(idx, n_batches)
+
+    return list(zip(split(n_samples_source), split(n_samples_target)))
+
+
+def _solve_ot(M, a, b, reg=None, warmstart=None):
+    """Solve the OT problem of a JDOT iteration.
+
+    The exact problem is solved with the network simplex, which cannot be
+    warm started. The entropic problem is solved with Sinkhorn iterations
+    initialized with `warmstart`, the log scalings of the solution of the
+    previous iteration (`sol.log["warmstart"]`).
+    """
+    if reg is None:
+        return ot.solve(M, a, b)
+
+    plan, log = ot.sinkhorn(a, b, M, reg, warmstart=warmstart, log=True)
+    log["warmstart"] = (np.log(log["u"]), np.log(log["v"]))
+    value = np.sum(M * plan)
+    return ot.utils.OTResult(
+        value=value,
+        value_linear=value,
+        plan=plan,
+        log=log,
+        backend=ot.backend.get_backend(M),
+    )
+
+
+def _solve_minibatch_ot(
+    Xs,
+    Xt,
+    a,
+    b,
+    feature_scale,
+    label_cost,
+    alpha,
+    use_label_cost,
+    batches,
+    reg=None,
+    warmstart=None,
+):
+    """OT between source/target minibatches for JDOT.
+
+    Each pair of batches is matched with an OT solver and the batch plans
+    are gathered in a sparse (n_samples_source, n_samples_target) plan whose
+    target marginal is `b`. Only (batch_size, batch_size) cost matrices are
+    computed.
+
+    Parameters
+    ----------
+    Xs : array-like of shape (n_samples, n_features)
+        Source domain samples.
+    Xt : array-like of shape (m_samples, n_features)
+        Target domain samples.
+    a : array-like of shape (n_samples,)
+        Source domain weights summing to 1.
+    b : array-like of shape (m_samples,)
+        Target domain weights summing to 1.
+    feature_scale : float
+        Normalization of the feature cost.
+    label_cost : callable
+        Function returning the label cost matrix between the source indices
+        and the target indices given as arguments.
+    alpha : float
+        The trade-off parameter between the feature and label loss.
+    use_label_cost : bool
+        If False, the plans are computed on the feature cost only but the
+        label cost is still included in the returned value.
+    batches : list of tuples
+        Pairs of source and target indices, see `_get_minibatches`.
+    reg : float, default=None
+        Entropic regularization, exact OT if None.
+    warmstart : list, default=None
+        Warm start of each batch for the entropic solver, given by
+        `sol.log["warmstart"]` of the previous call.
+
+    Returns
+    -------
+    sol : OTResult
+        The OT value and the sparse plan (`sol.sparse_plan`).
+    """
+    if warmstart is None:
+        warmstart = [None] * len(batches)
+
+    # the mass of a sample is shared by the batches it is drawn in
+    count_s = np.bincount(
+        np.concatenate([idx_s for idx_s, _ in batches]), minlength=Xs.shape[0]
+    )
+    count_t = np.bincount(
+        np.concatenate([idx_t for _, idx_t in batches]), minlength=Xt.shape[0]
+    )
+
+    value = 0
+    rows, cols, data = [], [], []
+    batch_warmstart = []
+    for (idx_s, idx_t), batch_init in zip(batches, warmstart):
+        # the batch carries the target mass of its samples
+        b_batch = b[idx_t] / count_t[idx_t]
+        a_batch = a[idx_s] / count_s[idx_s]
+        a_batch = a_batch * (b_batch.sum() / a_batch.sum())
+
+        Mf = ot.dist(Xs[idx_s], Xt[idx_t]) / feature_scale
+        Ml = label_cost(idx_s, idx_t)
+        if use_label_cost:
+            M = (1 - alpha) * Mf + alpha * Ml
+        else:
+            M = (1 - alpha) * Mf
+
+        sol = _solve_ot(M, a_batch, b_batch, reg=reg, warmstart=batch_init)
+        if reg is not None:
+            batch_warmstart.append(sol.log["warmstart"])
+        T = sol.plan
+        value += np.sum(M * T)
+        if not use_label_cost:
+            value += alpha * np.sum(Ml * T)
+
+        i, j = np.nonzero(T)
+        rows.append(idx_s[i])
+        cols.append(idx_t[j])
+        data.append(T[i, j])
+
+    plan = sp.csr_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(Xs.shape[0], Xt.shape[0]),
+    )
+    return ot.utils.OTResult(
+        value=value,
+        sparse_plan=plan,
+        log={"warmstart": batch_warmstart},
+        backend=ot.backend.get_backend(a),
+    )
+
+
 def solve_jdot_regression(
     base_estimator,
     Xs,
@@ -207,6 +394,10 @@ def solve_jdot_regression(
     n_iter_max=100,
     tol=1e-5,
     verbose=False,
+    batch_size=None,
+    random_state=None,
+    reg=None,
+    log=False,
     **kwargs,
 ):
     """Solve the joint distribution optimal transport regression problem [10]
@@ -244,6 +435,22 @@ def solve_jdot_regression(
         Tolerance for loss variations (OT and mse) stopping iterations.
     verbose: bool
         Print loss along iterations if True.as_integer_ratio
+    batch_size : int, default=None
+        If None, the exact OT problem between all the source and target
+        samples is solved. Otherwise the OT plan is computed with OT
+        between random source and target batches of at most `batch_size`
+        samples, drawn once before the iterations. The memory is then linear
+        in the number of samples and the returned plan is sparse.
+    random_state : int, RandomState instance or None, default=None
+        Determines the random batches when `batch_size` is not None.
+    reg : float, default=None
+        Entropic regularization of the OT problems. If None, exact OT is
+        used. Otherwise the Sinkhorn iterations of each JDOT iteration are
+        warm started with the scalings of the previous one.
+    log : bool, default=False
+        If True, also return a dictionary with the time spent in the OT
+        solver (`ot_times`) and in the estimator fit (`fit_times`) at each
+        iteration.
     kwargs : dict
         Additional parameters to be passed to the base estimator.
 
@@ -257,7 +464,10 @@ def solve_jdot_regression(
     lst_loss_tgt_labels : list
         The list of target labels losses at each iteration.
     sol : object
-        The solution of the OT problem.
+        The solution of the OT problem. When `batch_size` is not None, only
+        the sparse plan (`sparse_plan`) and the value are available.
+    log : dict
+        The per-iteration timings, only returned if `log` is True.
 
     References
     ----------
@@ -268,10 +478,6 @@ def solve_jdot_regression(
     """
     estimator = clone(base_estimator)
 
-    # compute feature distance matrix
-    Mf = ot.dist(Xs, Xt)
-    Mf = Mf / Mf.mean()
-
     nt = Xt.shape[0]
     if ws is None:
         a = np.ones((len(ys),)) / len(ys)
@@ -283,37 +489,81 @@ def solve_jdot_regression(
         b = wt / wt.sum()
         kwargs["sample_weight"] = wt  # add it as sample_weight for fit
 
+    if batch_size is None:
+        # compute feature distance matrix
+        Mf = ot.dist(Xs, Xt)
+        Mf = Mf / Mf.mean()
+    else:
+        # the batches are kept fixed so that the alternate optimization
+        # converges as in the exact case
+        batches = _get_minibatches(
+            Xs.shape[0], nt, batch_size, check_random_state(random_state)
+        )
+        feature_scale = _mean_sqeuclidean(Xs, Xt)
+
     lst_loss_ot = []
     lst_loss_tgt_labels = []
-    y_pred = 0
-    Ml = ot.dist(ys.reshape(-1, 1), np.zeros((nt, 1)))
+    y_pred = np.zeros(nt)
+    if batch_size is None:
+        Ml = ot.dist(ys.reshape(-1, 1), np.zeros((nt, 1)))
 
+    def label_cost(idx_s, idx_t):
+        return ot.dist(ys[idx_s].reshape(-1, 1), y_pred[idx_t].reshape(-1, 1))
+
+    log_dict = {"ot_times": [], "fit_times": []}
+    warmstart = None
     for i in range(n_iter_max):
-        if i > 0:
-            # update the cost matrix
-            M = (1 - alpha) * Mf + alpha * Ml
+        start = time.perf_counter()
+        if batch_size is not None:
+            sol = _solve_minibatch_ot(
+                Xs,
+                Xt,
+                a,
+                b,
+                feature_scale,
+                label_cost,
+                alpha,
+                i > 0,
+                batches,
+                reg=reg,
+                warmstart=warmstart,
+            )
+            T = sol.sparse_plan
+            loss_ot = sol.value
         else:
-            M = (1 - alpha) * Mf
+            if i > 0:
+                # update the cost matrix
+                M = (1 - alpha) * Mf + alpha * Ml
+            else:
+                M = (1 - alpha) * Mf
 
-        # sole OT problem
-        sol = ot.solve(M, a, b)
+            # sole OT problem
+            sol = _solve_ot(M, a, b, reg=reg, warmstart=warmstart)
 
-        T = sol.plan
-        loss_ot = sol.value
+            T = sol.plan
+            loss_ot = sol.value
 
-        if i == 0:
-            loss_ot += alpha * np.sum(Ml * T)
+            if i == 0:
+                loss_ot += alpha * np.sum(Ml * T)
+
+        if reg is not None:
+            # the cost changes slowly between iterations
+            warmstart = sol.log["warmstart"]
+        log_dict["ot_times"].append(time.perf_counter() - start)
 
         lst_loss_ot.append(loss_ot)
 
         # compute the transported labels
-        yth = ys.T.dot(T) / b
+        yth = T.T.dot(ys) / b
 
         # fit the estimator
+        start = time.perf_counter()
         estimator.fit(Xt, yth, **kwargs)
         y_pred = estimator.predict(Xt)
+        log_dict["fit_times"].append(time.perf_counter() - start)
 
-        Ml = ot.dist(ys.reshape(-1, 1), y_pred.reshape(-1, 1))
+        if batch_size is None:
+            Ml = ot.dist(ys.reshape(-1, 1), y_pred.reshape(-1, 1))
 
         # compute the loss
         loss_tgt_labels = np.mean((yth - y_pred) ** 2)
@@ -334,6 +584,8 @@ def solve_jdot_regression(
         if i == n_iter_max - 1:
             warnings.warn("Maximum number of iterations reached.")
 
+    if log:
+        return estimator, lst_loss_ot, lst_loss_tgt_labels, sol, log_dict
     return estimator, lst_loss_ot, lst_loss_tgt_labels, sol
 
 
@@ -350,6 +602,10 @@ def solve_jdot_classification(
     tol=1e-5,
     verbose=False,
     thr_weights=1e-6,
+    batch_size=None,
+    random_state=None,
+    reg=None,
+    log=False,
     **kwargs,
 ):
     """Solve the joint distribution optimal transport classification problem [10]
@@ -396,6 +652,22 @@ def solve_jdot_classification(
         Print loss along iterations if True.as_integer_ratio
     thr_weights : float, default=1e-6
         The relative threshold for the weights
+    batch_size : int, default=None
+        If None, the exact OT problem between all the source and target
+        samples is solved. Otherwise the OT plan is computed with OT
+        between random source and target batches of at most `batch_size`
+        samples, drawn once before the iterations. The memory is then linear
+        in the number of samples and the returned plan is sparse.
+    random_state : int, RandomState instance or None, default=None
+        Determines the random batches when `batch_size` is not None.
+    reg : float, default=None
+        Entropic regularization of the OT problems. If None, exact OT is
+        used. Otherwise the Sinkhorn iterations of each JDOT iteration are
+        warm started with the scalings of the previous one.
+    log : bool, default=False
+        If True, also return a dictionary with the time spent in the OT
+        solver (`ot_times`) and in the estimator fit (`fit_times`) at each
+        iteration.
     kwargs : dict
         Additional parameters to be passed to the base estimator.
 
@@ -408,7 +680,10 @@ def solve_jdot_classification(
     lst_loss_tgt_labels : list
         The list of target labels losses at each iteration.
     sol : object
-        The solution of the OT problem.
+        The solution of the OT problem. When `batch_size` is not None, only
+        the sparse plan (`sparse_plan`) and the value are available.
+    log : dict
+        The per-iteration timings, only returned if `log` is True.
 
     References
     ----------
@@ -419,10 +694,6 @@ def solve_jdot_classification(
     """
     estimator = clone(base_estimator)
 
-    # compute feature distance matrix
-    Mf = ot.dist(Xs, Xt)
-    Mf = Mf / Mf.mean()
-
     nt = Xt.shape[0]
     if ws is None:
         a = np.ones((len(ys),)) / len(ys)
@@ -433,29 +704,73 @@ def solve_jdot_classification(
     else:
         b = wt / wt.sum()
 
+    if batch_size is None:
+        # compute feature distance matrix
+        Mf = ot.dist(Xs, Xt)
+        Mf = Mf / Mf.mean()
+    else:
+        # the batches are kept fixed so that the alternate optimization
+        # converges as in the exact case
+        batches = _get_minibatches(
+            Xs.shape[0], nt, batch_size, check_random_state(random_state)
+        )
+        feature_scale = _mean_sqeuclidean(Xs, Xt)
+
     encoder = OneHotEncoder(sparse_output=False)
     Ys = encoder.fit_transform(ys.reshape(-1, 1))
     labels = encoder.categories_[0]
 
     lst_loss_ot = []
     lst_loss_tgt_labels = []
-    Ml = get_jdot_class_cost_matrix(ys, Xt, None, metric=metric)
+    if batch_size is None:
+        Ml = get_jdot_class_cost_matrix(ys, Xt, None, metric=metric)
+
+    def label_cost(idx_s, idx_t):
+        # constant cost before the first fit of the estimator
+        return get_jdot_class_cost_matrix(
+            Ys[idx_s], Xt[idx_t], estimator if i > 0 else None, metric=metric
+        )
 
+    log_dict = {"ot_times": [], "fit_times": []}
+    warmstart = None
     for i in range(n_iter_max):
-        if i > 0:
-            # update the cost matrix
-            M = (1 - alpha) * Mf + alpha * Ml
+        start = time.perf_counter()
+        if batch_size is not None:
+            sol = _solve_minibatch_ot(
+                Xs,
+                Xt,
+                a,
+                b,
+                feature_scale,
+                label_cost,
+                alpha,
+                i > 0,
+                batches,
+                reg=reg,
+                warmstart=warmstart,
+            )
+            T = sol.sparse_plan
+            loss_ot = sol.value
         else:
-            M = (1 - alpha) * Mf
+            if i > 0:
+                # update the cost matrix
+                M = (1 - alpha) * Mf + alpha * Ml
+            else:
+                M = (1 - alpha) * Mf
 
-        # sole OT problem
-        sol = ot.solve(M, a, b)
+            # sole OT problem
+            sol = _solve_ot(M, a, b, reg=reg, warmstart=warmstart)
 
-        T = sol.plan
-        loss_ot = sol.value
+            T = sol.plan
+            loss_ot = sol.value
+
+            if i == 0:
+                loss_ot += alpha * np.sum(Ml * T)
 
-        if i == 0:
-            loss_ot += alpha * np.sum(Ml * T)
+        if reg is not None:
+            # the cost changes slowly between iterations
+            warmstart = sol.log["warmstart"]
+        log_dict["ot_times"].append(time.perf_counter() - start)
 
         lst_loss_ot.append(loss_ot)
 
@@ -466,9 +781,12 @@ def solve_jdot_classification(
         Xh, yh, wh = get_data_jdot_class(Xt, Yth, labels, thr_weights=thr_weights)
 
         # fit the estimator
+        start = time.perf_counter()
         estimator.fit(Xh, yh, sample_weight=wh, **kwargs)
+        log_dict["fit_times"].append(time.perf_counter() - start)
 
-        Ml = get_jdot_class_cost_matrix(Ys, Xt, estimator, metric=metric)
+        if batch_size is None:
+            Ml = get_jdot_class_cost_matrix(Ys, Xt, estimator, metric=metric)
 
         # compute the losses
         loss_tgt_labels = (
@@ -494,6 +812,8 @@ def solve_jdot_classification(
         if i == n_iter_max - 1:
             warnings.warn("Maximum number of iterations reached.")
 
+    if log:
+        return estimator, lst_loss_ot, lst_loss_tgt_labels, sol, log_dict
     return estimator, lst_loss_ot, lst_loss_tgt_labels, sol
 
 
@@ -525,6 +845,15 @@ class JDOTRegressor(DAEstimator):
         Tolerance for loss variations (OT and mse) stopping iterations.
     verbose: bool
         Print loss along iterations if True.as_integer_ratio
+    batch_size : int, default=None
+        If not None, the OT plan is computed with OT between random
+        source and target batches of at most `batch_size` samples so that the
+        (n_samples_source, n_samples_target) matrices are never computed.
+    random_state : int, RandomState instance or None, default=None
+        Determines the random batches when `batch_size` is not None.
+    reg : float, default=None
+        Entropic regularization of the OT problems, exact OT if None. The
+        Sinkhorn iterations are warm started from one iteration to the next.
 
     Attributes
     ----------
@@ -535,7 +864,11 @@ class JDOTRegressor(DAEstimator):
     lst_loss_tgt_labels_ : list
         The list of target labels losses at each iteration.
     sol_ : object
-        The solution of the OT problem.
+        The solution of the OT problem. When `batch_size` is not None, only
+        the sparse plan (`sparse_plan`) and the value are available.
+    log_ : dict
+        The time spent in the OT solver (`ot_times`) and in the estimator fit
+        (`fit_times`) at each iteration.
 
     References
     ----------
@@ -552,6 +885,9 @@ class JDOTRegressor(DAEstimator):
         n_iter_max=100,
         tol=1e-5,
         verbose=False,
+        batch_size=None,
+        random_state=None,
+        reg=None,
         **kwargs,
     ):
         if base_estimator is None:
@@ -561,7 +897,7 @@ class JDOTRegressor(DAEstimator):
                 base_estimator, "predict"
             ):
                 raise ValueError(
-                    "base_estimator must be a regressor with" " fit and predict methods"
+                    "base_estimator must be a regressor with fit and predict methods"
                 )
         self.base_estimator = base_estimator
         self.kwargs = kwargs
@@ -569,6 +905,9 @@ class JDOTRegressor(DAEstimator):
         self.n_iter_max = n_iter_max
         self.tol = tol
         self.verbose = verbose
+        self.batch_size = batch_size
+        self.random_state = random_state
+        self.reg = reg
 
     def fit(self, X, y=None, sample_domain=None, *, sample_weight=None):
         """Fit adaptation parameters"""
@@ -587,10 +926,20 @@ class JDOTRegressor(DAEstimator):
             n_iter_max=self.n_iter_max,
             tol=self.tol,
             verbose=self.verbose,
+            batch_size=self.batch_size,
+            random_state=self.random_state,
+            reg=self.reg,
+            log=True,
             **self.kwargs,
         )
 
-        self.estimator_, self.lst_loss_ot_, self.lst_loss_tgt_labels_, self.sol_ = res
+        (
+            self.estimator_,
+            self.lst_loss_ot_,
+            self.lst_loss_tgt_labels_,
+            self.sol_,
+            self.log_,
+        ) = res
 
     def predict(self, X, sample_domain=None, *, sample_weight=None):
         """Predict using the model"""
@@ -649,6 +998,15 @@ class JDOTClassifier(DAEstimator):
         Print loss along iterations if True.as_integer_ratio
     thr_weights : float, default=1e-6
         The relative threshold for the weights
+    batch_size : int, default=None
+        If not None, the OT plan is computed with OT between random
+        source and target batches of at most `batch_size` samples so that the
+        (n_samples_source, n_samples_target) matrices are never computed.
+    random_state : int, RandomState instance or None, default=None
+        Determines the random batches when `batch_size` is not None.
+    reg : float, default=None
+        Entropic regularization of the OT problems, exact OT if None. The
+        Sinkhorn iterations are warm started from one iteration to the next.
 
     Attributes
     ----------
@@ -659,7 +1017,11 @@ class JDOTClassifier(DAEstimator):
     lst_loss_tgt_labels_ : list
         The list of target labels losses at each iteration.
     sol_ : object
-        The solution of the OT problem.
+        The solution of the OT problem. When `batch_size` is not None, only
+        the sparse plan (`sparse_plan`) and the value are available.
+    log_ : dict
+        The time spent in the OT solver (`ot_times`) and in the estimator fit
+        (`fit_times`) at each iteration.
 
     References
     ----------
@@ -678,6 +1040,9 @@ class JDOTClassifier(DAEstimator):
         tol=1e-5,
         verbose=False,
         thr_weights=1e-6,
+        batch_size=None,
+        random_state=None,
+        reg=None,
         **kwargs,
     ):
         if base_estimator is None:
@@ -687,7 +1052,7 @@ class JDOTClassifier(DAEstimator):
                 base_estimator, "predict"
             ):
                 raise ValueError(
-                    "base_estimator must be a regressor with" " fit and predict methods"
+                    "base_estimator must be a regressor with fit and predict methods"
                 )
         self.base_estimator = base_estimator
         self.kwargs = kwargs
@@ -697,6 +1062,9 @@ class JDOTClassifier(DAEstimator):
         self.tol = tol
         self.verbose = verbose
         self.thr_weights = thr_weights
+        self.batch_size = batch_size
+        self.random_state = random_state
+        self.reg = reg
 
     def fit(self, X, y=None, sample_domain=None, *, sample_weight=None):
         """Fit adaptation parameters"""
@@ -717,10 +1085,20 @@ class JDOTClassifier(DAEstimator):
             tol=self.tol,
             verbose=self.verbose,
             thr_weights=self.thr_weights,
+            batch_size=self.batch_size,
+            random_state=self.random_state,
+            reg=self.reg,
+            log=True,
             **self.kwargs,
         )
 
-        self.estimator_, self.lst_loss_ot_, self.lst_loss_tgt_labels_, self.sol_ = res
+        (
+            self.estimator_,
+            self.lst_loss_ot_,
+            self.lst_loss_tgt_labels_,
+            self.sol_,
+            self.log_,
+        ) = res
 
     def predict(self, X, sample_domain=None, *, sample_weight=None, allow_source=False):
         """Predict using the model"""
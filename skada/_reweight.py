@@ -12,17 +12,31 @@ from abc import abstractmethod
 
 import numpy as np
 import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator
 from scipy.stats import multivariate_normal
+from sklearn.kernel_approximation import Nystroem, RBFSampler
 from sklearn.linear_model import LogisticRegression
-from sklearn.metrics.pairwise import KERNEL_PARAMS, pairwise_distances, pairwise_kernels
+from sklearn.metrics.pairwise import (
+    KERNEL_PARAMS,
+    euclidean_distances,
+    pairwise_distances,
+    pairwise_kernels,
+)
 from sklearn.model_selection import check_cv
 from sklearn.neighbors import KernelDensity, KNeighborsClassifier
 from sklearn.svm import SVC
-from sklearn.utils import check_random_state
+from sklearn.utils import check_random_state, gen_batches
+from sklearn.utils.parallel import Parallel, delayed
 from sklearn.utils.validation import check_is_fitted
 
 from ._pipeline import make_da_pipeline
-from ._utils import Y_Type, _estimate_covariance, _find_y_type
+from ._utils import (
+    Y_Type,
+    _estimate_covariance,
+    _find_y_type,
+    _fingerprint,
+    _RandomProjectionForest,
+)
 from .base import BaseAdapter, clone
 from .utils import (
     check_X_domain,
@@ -35,6 +49,30 @@ from .utils import (
 EPS = np.finfo(float).eps
 
 
+def _batched_matvec(A, x):
+    """Batched matrix-vector products `A[i] @ x[i]`."""
+    return np.matmul(A, x[:, :, None])[:, :, 0]
+
+
+def _low_rank_kernel_operator(features):
+    """Kernel matrix `features @ features.T` as a linear operator.
+
+    Matrix-vector products cost O(n_samples * n_components) and the
+    (n_samples, n_samples) matrix is never built. The features are kept in
+    the `factor` attribute for the solvers that exploit the low rank.
+    """
+
+    def matvec(x):
+        return features @ (features.T @ x)
+
+    n_samples = features.shape[0]
+    operator = LinearOperator(
+        (n_samples, n_samples), matvec=matvec, rmatvec=matvec, dtype=features.dtype
+    )
+    operator.factor = features
+    return operator
+
+
 class BaseReweightAdapter(BaseAdapter):
     """Base class for the adapter that yields weights for samples.
 
@@ -76,7 +114,100 @@ class BaseReweightAdapter(BaseAdapter):
         return X, dict(sample_weight=weights)
 
 
-class DensityReweightAdapter(BaseReweightAdapter):
+class _BatchedReweightMixin:
+    """Mixin for the reweighting adapters computing the weights by batches.
+
+    The adapters should provide `_compute_source_weights`, which gives the
+    unnormalized weights of a batch of source samples, and can override
+    `_normalize_weights` when the normalization needs all the weights.
+    """
+
+    def compute_weights_batches(self, batches, out=None):
+        """Compute the weights of samples given as a stream of batches.
+
+        Only the weights are kept in memory, so that the batches can be
+        read lazily (e.g. from a generator or from a memory-mapped array).
+
+        Parameters
+        ----------
+        batches : iterable of tuples (X, sample_domain)
+            Batches of data with shape (n_samples_batch, n_features) and
+            their domain labels with shape (n_samples_batch,).
+        out : array-like, shape (n_samples,), default=None
+            Preallocated buffer in which the weights are written. Its length
+            should match the total number of samples in the batches.
+
+        Returns
+        -------
+        weights : array-like, shape (n_samples,)
+            The weights of the samples (same as out if given).
+        """
+        check_is_fitted(self)
+        batches = (
+            check_X_domain(X, sample_domain, allow_source=True)
+            for X, sample_domain in batches
+        )
+        return self._fill_weights(batches, out=out)
+
+    def _compute_batched_weights(self, X, sample_domain, out=None):
+        """Compute the weights of X by batches of `batch_size` samples."""
+        check_is_fitted(self)
+        X, sample_domain = check_X_domain(X, sample_domain, allow_source=True)
+        n_samples = X.shape[0]
+        batch_size = self.batch_size or max(n_samples, 1)
+        batches = (
+            (X[start : start + batch_size], sample_domain[start : start + batch_size])
+            for start in range(0, n_samples, batch_size)
+        )
+        return self._fill_weights(batches, out=out)
+
+    def _fill_weights(self, batches, out=None):
+        weights, source_idx = [], []
+        start = 0
+        for X_batch, sample_domain_batch in batches:
+            batch_source_idx = extract_source_indices(sample_domain_batch)
+            stop = start + X_batch.shape[0]
+            if out is None:
+                batch_weights = np.zeros(X_batch.shape[0])
+                weights.append(batch_weights)
+            elif stop > out.shape[0]:
+                raise ValueError(
+                    "`out` has %d samples, which is less than the number of "
+                    "samples given" % out.shape[0]
+                )
+            else:
+                batch_weights = out[start:stop]
+                batch_weights[~batch_source_idx] = 0
+            if batch_source_idx.any():
+                batch_weights[batch_source_idx] = self._compute_source_weights(
+                    X_batch[batch_source_idx]
+                )
+            source_idx.append(batch_source_idx)
+            start = stop
+
+        if out is None:
+            weights = np.concatenate(weights) if weights else np.zeros(0)
+        elif start != out.shape[0]:
+            raise ValueError(
+                "`out` has %d samples, got %d samples" % (out.shape[0], start)
+            )
+        else:
+            weights = out
+        source_idx = (
+            np.concatenate(source_idx) if source_idx else np.zeros(0, dtype=bool)
+        )
+        return self._normalize_weights(weights, source_idx)
+
+    @abstractmethod
+    def _compute_source_weights(self, X_source):
+        """Weights of a batch of source samples before normalization."""
+
+    def _normalize_weights(self, weights, source_idx):
+        """Normalize in-place the weights once all the batches are done."""
+        return weights
+
+
+class DensityReweightAdapter(_BatchedReweightMixin, BaseReweightAdapter):
     """Adapter based on re-weighting samples using density estimation.
 
     Parameters
@@ -84,6 +215,9 @@ class DensityReweightAdapter(BaseReweightAdapter):
     weight_estimator : estimator object, optional
         The estimator to use to estimate the densities of source and target
         observations. If None, a KernelDensity estimator is used.
+    batch_size : int, default=None
+        Number of samples processed at once when computing the weights.
+        If None, all the samples are processed at once.
 
     Attributes
     ----------
@@ -93,9 +227,10 @@ class DensityReweightAdapter(BaseReweightAdapter):
         The estimator object fitted on the target data.
     """
 
-    def __init__(self, weight_estimator=None):
+    def __init__(self, weight_estimator=None, batch_size=None):
         super().__init__()
         self.weight_estimator = weight_estimator or KernelDensity()
+        self.batch_size = batch_size
 
     def fit(self, X, y=None, *, sample_domain=None):
         """Fit adaptation parameters.
@@ -125,29 +260,31 @@ class DensityReweightAdapter(BaseReweightAdapter):
         self.weight_estimator_target_ = target_estimator
         return self
 
-    def compute_weights(self, X, y=None, *, sample_domain=None, **params):
-        check_is_fitted(self)
-        X, sample_domain = check_X_domain(X, sample_domain, allow_source=True)
-        source_idx = extract_source_indices(sample_domain)
-        (source_idx,) = np.where(source_idx)
-        ws = self.weight_estimator_source_.score_samples(X[source_idx])
-        wt = self.weight_estimator_target_.score_samples(X[source_idx])
-        source_weights = np.exp(wt - ws)
-
-        if source_weights.mean() != 0:
-            source_weights /= source_weights.mean()
+    def compute_weights(self, X, y=None, *, sample_domain=None, out=None, **params):
+        return self._compute_batched_weights(X, sample_domain, out=out)
+
+    def _compute_source_weights(self, X_source):
+        ws = self.weight_estimator_source_.score_samples(X_source)
+        wt = self.weight_estimator_target_.score_samples(X_source)
+        return np.exp(wt - ws)
+
+    def _normalize_weights(self, weights, source_idx):
+        n_source = np.count_nonzero(source_idx)
+        if n_source == 0:
+            return weights
+        mean = weights.sum() / n_source
+        if mean != 0:
+            weights /= mean
         else:
             warnings.warn("All weights are zero. Using uniform weights.")
-            source_weights = np.ones_like(source_weights) / len(source_weights)
-
-        weights = np.zeros(X.shape[0], dtype=source_weights.dtype)
-        weights[source_idx] = source_weights
+            weights[source_idx] = 1 / n_source
         return weights
 
 
 def DensityReweight(
     base_estimator=None,
     weight_estimator=None,
+    batch_size=None,
 ):
     """Density re-weighting pipeline adapter and estimator.
 
@@ -158,6 +295,9 @@ def DensityReweight(
     weight_estimator : estimator object, optional
         The estimator to use to estimate the densities of source and target
         observations. If None, a KernelDensity estimator is used.
+    batch_size : int, default=None
+        Number of samples processed at once when computing the weights.
+        If None, all the samples are processed at once.
 
     Returns
     -------
@@ -168,12 +308,14 @@ def DensityReweight(
         base_estimator = LogisticRegression().set_fit_request(sample_weight=True)
 
     return make_da_pipeline(
-        DensityReweightAdapter(weight_estimator=weight_estimator),
+        DensityReweightAdapter(
+            weight_estimator=weight_estimator, batch_size=batch_size
+        ),
         base_estimator,
     )
 
 
-class GaussianReweightAdapter(BaseReweightAdapter):
+class GaussianReweightAdapter(_BatchedReweightMixin, BaseReweightAdapter):
     """Gaussian approximation re-weighting method.
 
     See [1]_ for details.
@@ -187,6 +329,9 @@ class GaussianReweightAdapter(BaseReweightAdapter):
           - None: no shrinkage.
           - 'auto': automatic shrinkage using the Ledoit-Wolf lemma.
           - float between 0 and 1: fixed shrinkage parameter.
+    batch_size : int, default=None
+        Number of samples processed at once when computing the weights.
+        If None, all the samples are processed at once.
 
     Attributes
     ----------
@@ -206,9 +351,10 @@ class GaussianReweightAdapter(BaseReweightAdapter):
             In Journal of Statistical Planning and Inference, 2000.
     """
 
-    def __init__(self, reg="auto"):
+    def __init__(self, reg="auto", batch_size=None):
         super().__init__()
         self.reg = reg
+        self.batch_size = batch_size
 
     def fit(self, X, y=None, *, sample_domain=None):
         """Fit adaptation parameters.
@@ -236,26 +382,23 @@ class GaussianReweightAdapter(BaseReweightAdapter):
         self.cov_target_ = _estimate_covariance(X_target, shrinkage=self.reg)
         return self
 
-    def compute_weights(self, X, y=None, *, sample_domain=None, **params):
-        check_is_fitted(self)
-        X, sample_domain = check_X_domain(X, sample_domain, allow_source=True)
-        source_idx = extract_source_indices(sample_domain)
-        (source_idx,) = np.where(source_idx)
+    def compute_weights(self, X, y=None, *, sample_domain=None, out=None, **params):
+        return self._compute_batched_weights(X, sample_domain, out=out)
+
+    def _compute_source_weights(self, X_source):
         gaussian_target = multivariate_normal.pdf(
-            X[source_idx], self.mean_target_, self.cov_target_
+            X_source, self.mean_target_, self.cov_target_
         )
         gaussian_source = multivariate_normal.pdf(
-            X[source_idx], self.mean_source_, self.cov_source_
+            X_source, self.mean_source_, self.cov_source_
         )
-        source_weights = gaussian_target / gaussian_source
-        weights = np.zeros(X.shape[0], dtype=source_weights.dtype)
-        weights[source_idx] = source_weights
-        return weights
+        return gaussian_target / gaussian_source
 
 
 def GaussianReweight(
     base_estimator=None,
     reg="auto",
+    batch_size=None,
 ):
     """Gaussian approximation re-weighting pipeline adapter and estimator.
 
@@ -272,6 +415,9 @@ def GaussianReweight(
           - None: no shrinkage.
           - 'auto': automatic shrinkage using the Ledoit-Wolf lemma.
           - float between 0 and 1: fixed shrinkage parameter.
+    batch_size : int, default=None
+        Number of samples processed at once when computing the weights.
+        If None, all the samples are processed at once.
 
     Returns
     -------
@@ -289,12 +435,12 @@ def GaussianReweight(
         base_estimator = LogisticRegression().set_fit_request(sample_weight=True)
 
     return make_da_pipeline(
-        GaussianReweightAdapter(reg=reg),
+        GaussianReweightAdapter(reg=reg, batch_size=batch_size),
         base_estimator,
     )
 
 
-class DiscriminatorReweightAdapter(BaseReweightAdapter):
+class DiscriminatorReweightAdapter(_BatchedReweightMixin, BaseReweightAdapter):
     """Gaussian approximation re-weighting method.
 
     See [1]_ for details.
@@ -304,6 +450,9 @@ class DiscriminatorReweightAdapter(BaseReweightAdapter):
     domain_classifier : sklearn classifier, optional
         Classifier used to predict the domains. If None, a
         LogisticRegression is used.
+    batch_size : int, default=None
+        Number of samples processed at once when computing the weights.
+        If None, all the samples are processed at once.
 
     Attributes
     ----------
@@ -317,9 +466,10 @@ class DiscriminatorReweightAdapter(BaseReweightAdapter):
            In Journal of Statistical Planning and Inference, 2000.
     """
 
-    def __init__(self, domain_classifier=None):
+    def __init__(self, domain_classifier=None, batch_size=None):
         super().__init__()
         self.domain_classifier = domain_classifier or LogisticRegression()
+        self.batch_size = batch_size
 
     def fit(self, X, y=None, sample_domain=None):
         """Fit adaptation parameters.
@@ -348,23 +498,22 @@ class DiscriminatorReweightAdapter(BaseReweightAdapter):
         self.domain_classifier_ = domain_classifier
         return self
 
-    def compute_weights(self, X, y=None, *, sample_domain=None, **params):
-        check_is_fitted(self)
-        X, sample_domain = check_X_domain(X, sample_domain, allow_source=True)
-        source_idx = extract_source_indices(sample_domain)
-        # xxx(okachaiev): it seems to me that would work without np.where
-        # as we only use this array for indexing
-        (source_idx,) = np.where(source_idx)
-        probas = self.domain_classifier_.predict_proba(X[source_idx])[:, 1]
+    def compute_weights(self, X, y=None, *, sample_domain=None, out=None, **params):
+        return self._compute_batched_weights(X, sample_domain, out=out)
+
+    def _compute_source_weights(self, X_source):
+        probas = self.domain_classifier_.predict_proba(X_source)[:, 1]
         probas = np.clip(probas, EPS, 1.0)
-        source_weights = (1 - probas) / probas
-        source_weights /= source_weights.mean()
-        weights = np.zeros(X.shape[0], dtype=source_weights.dtype)
-        weights[source_idx] = source_weights
+        return (1 - probas) / probas
+
+    def _normalize_weights(self, weights, source_idx):
+        n_source = np.count_nonzero(source_idx)
+        if n_source > 0:
+            weights /= weights.sum() / n_source
         return weights
 
 
-def DiscriminatorReweight(base_estimator=None, domain_classifier=None):
+def DiscriminatorReweight(base_estimator=None, domain_classifier=None, batch_size=None):
     """Discriminator re-weighting pipeline adapter and estimator.
 
     see [1]_ for details.
@@ -376,6 +525,9 @@ def DiscriminatorReweight(base_estimator=None, domain_classifier=None):
     domain_classifier : sklearn classifier, optional
         Classifier used to predict the domains. If None, a
         LogisticRegression is used.
+    batch_size : int, default=None
+        Number of samples processed at once when computing the weights.
+        If None, all the samples are processed at once.
 
     Returns
     -------
@@ -393,12 +545,14 @@ def DiscriminatorReweight(base_estimator=None, domain_classifier=None):
         base_estimator = LogisticRegression().set_fit_request(sample_weight=True)
 
     return make_da_pipeline(
-        DiscriminatorReweightAdapter(domain_classifier=domain_classifier),
+        DiscriminatorReweightAdapter(
+            domain_classifier=domain_classifier, batch_size=batch_size
+        ),
         base_estimator,
     )
 
 
-class KLIEPReweightAdapter(BaseReweightAdapter):
+class KLIEPReweightAdapter(_BatchedReweightMixin, BaseReweightAdapter):
     """Kullback-Leibler Importance Estimation Procedure (KLIEPReweight).
 
     The idea of KLIEPReweight is to find an importance estimate w(x) such that
@@ -426,6 +580,15 @@ class KLIEPReweightAdapter(BaseReweightAdapter):
     random_state : int, RandomState instance or None, default=None
         Determines random number generation for dataset creation. Pass an int
         for reproducible output across multiple function calls.
+    n_jobs : int, default=None
+        The number of parallel jobs used to evaluate the cross validation
+        folds when several gammas are given.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
+        ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
+        for more details.
+    batch_size : int, default=None
+        Number of samples processed at once when computing the weights.
+        If None, all the samples are processed at once.
 
     Attributes
     ----------
@@ -452,6 +615,8 @@ class KLIEPReweightAdapter(BaseReweightAdapter):
         tol=1e-6,
         max_iter=1000,
         random_state=None,
+        n_jobs=None,
+        batch_size=None,
     ):
         super().__init__()
         self.gamma = gamma
@@ -460,6 +625,8 @@ class KLIEPReweightAdapter(BaseReweightAdapter):
         self.tol = tol
         self.max_iter = max_iter
         self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.batch_size = batch_size
 
     def fit(self, X, y=None, sample_domain=None, **kwargs):
         """Fit adaptation parameters.
@@ -498,71 +665,110 @@ class KLIEPReweightAdapter(BaseReweightAdapter):
     def _weights_optimization(self, gamma, X_source, X_target):
         """Optimization loop."""
         rng = check_random_state(self.random_state)
-        n_targets = len(X_target)
-        n_centers = np.min((n_targets, self.n_centers))
-
-        centers = X_target[rng.choice(np.arange(n_targets), n_centers)]
+        centers = self._sample_centers(X_target, rng)
         A = pairwise_kernels(X_target, centers, metric="rbf", gamma=gamma)
         b = pairwise_kernels(X_source, centers, metric="rbf", gamma=gamma)
         b = np.mean(b, axis=0)
 
-        alpha = np.ones(n_centers)
-        obj = np.sum(np.log(A @ alpha))
+        alpha = self._batched_weights_optimization(A[None], b[None])[0]
+
+        return alpha, centers
+
+    def _sample_centers(self, X_target, rng):
+        n_targets = len(X_target)
+        n_centers = np.min((n_targets, self.n_centers))
+        return X_target[rng.choice(np.arange(n_targets), n_centers)]
+
+    def _batched_weights_optimization(self, A, b):
+        """Optimization loop run jointly for a batch of kernels.
+
+        Each problem of the batch is stopped independently as soon as its
+        objective has converged.
+
+        Parameters
+        ----------
+        A : array-like, shape (n_problems, n_targets, n_centers)
+            Kernels between the target data and the centers.
+        b : array-like, shape (n_problems, n_centers)
+            Mean kernels between the source data and the centers.
+
+        Returns
+        -------
+        alpha : array-like, shape (n_problems, n_centers)
+            Solutions of the optimization problems.
+        """
+        n_problems, _, n_centers = A.shape
+        alpha = np.ones((n_problems, n_centers))
+        b_norm = np.sum(b * b, axis=1, keepdims=True)
+        obj = np.sum(np.log(_batched_matvec(A, alpha)), axis=1)
+        active = np.ones(n_problems, dtype=bool)
         for _ in range(self.max_iter):
-            old_obj = obj
-            alpha += EPS * A.T @ (1 / (A @ alpha))
-            alpha += (1 - b @ alpha) * b / (b @ b)
-            alpha = (alpha > 0) * alpha
-            alpha /= b @ alpha
-            obj = np.sum(np.log(A @ alpha + EPS))
-            if np.abs(obj - old_obj) < self.tol:
+            new_alpha = alpha + EPS * _batched_matvec(
+                A.transpose(0, 2, 1), 1 / _batched_matvec(A, alpha)
+            )
+            new_alpha += (1 - np.sum(b * new_alpha, axis=1, keepdims=True)) * b / b_norm
+            new_alpha = (new_alpha > 0) * new_alpha
+            new_alpha /= np.sum(b * new_alpha, axis=1, keepdims=True)
+            new_obj = np.sum(np.log(_batched_matvec(A, new_alpha) + EPS), axis=1)
+            alpha = np.where(active[:, None], new_alpha, alpha)
+            converged = np.abs(new_obj - obj) < self.tol
+            obj = np.where(active, new_obj, obj)
+            active &= ~converged
+            if not active.any():
                 break
         else:
             warnings.warn("Maximum iteration reached before convergence.")
 
-        return alpha, centers
+        return alpha
 
     def _likelihood_cross_validation(self, gammas, X_source, X_target):
         """Compute the likelihood cross validation.
 
-        Used to choose the best parameter for the kernel.
+        Used to choose the best parameter for the kernel. The squared
+        distances to the centers are computed once per fold and shared
+        by all the gammas, whose optimization problems are solved jointly.
         """
-        log_liks = []
-        # xxx(okachaiev): should this be done when fitting?
-        rng = check_random_state(self.random_state)
-        index = np.arange(len(X_target))
-        rng.shuffle(index)
         cv = check_cv(self.cv)
-        for this_gamma in gammas:
-            this_log_lik = []
-            for train, test in cv.split(X_target):
-                alpha, centers = self._weights_optimization(
-                    this_gamma,
-                    X_source,
-                    X_target[train],
-                )
-                A = pairwise_kernels(
-                    X_target[test], centers, metric="rbf", gamma=this_gamma
-                )
-                weights = A @ alpha
-                this_log_lik.append(np.mean(np.log(weights + EPS)))
-            log_liks.append(np.mean(this_log_lik))
+        log_liks = Parallel(n_jobs=self.n_jobs)(
+            delayed(self._fold_log_likelihoods)(
+                np.asarray(gammas, dtype=float), X_source, X_target, train, test
+            )
+            for train, test in cv.split(X_target)
+        )
+        log_liks = np.mean(log_liks, axis=0)
         best_gamma_ = gammas[np.argmax(log_liks)]
 
         return best_gamma_
 
-    def compute_weights(self, X, y=None, *, sample_domain=None, **params):
-        check_is_fitted(self)
-        X, sample_domain = check_X_domain(X, sample_domain, allow_source=True)
-        source_idx = extract_source_indices(sample_domain)
-        (source_idx,) = np.where(source_idx)
+    def _fold_log_likelihoods(self, gammas, X_source, X_target, train, test):
+        """Test log-likelihood of every gamma on one cross validation fold."""
+        rng = check_random_state(self.random_state)
+        centers = self._sample_centers(X_target[train], rng)
+        gammas = gammas[:, None, None]
+
+        D_source = euclidean_distances(X_source, centers, squared=True)
+        # the mean over the source samples is done per gamma to
+        # keep the memory bounded by one (n_source, n_centers) block
+        b = np.stack([np.exp(-gamma * D_source).mean(axis=0) for gamma in gammas])
+        del D_source
+
+        D_target = euclidean_distances(X_target, centers, squared=True)
+        A_train = np.exp(-gammas * D_target[train])
+        alpha = self._batched_weights_optimization(A_train, b)
+        del A_train
+
+        A_test = np.exp(-gammas * D_target[test])
+        weights = _batched_matvec(A_test, alpha)
+        return np.mean(np.log(weights + EPS), axis=1)
+
+    def compute_weights(self, X, y=None, *, sample_domain=None, out=None, **params):
+        return self._compute_batched_weights(X, sample_domain, out=out)
+
+    def _compute_source_weights(self, X_source):
         A = pairwise_kernels(
-            X[source_idx], self.centers_, metric="rbf", gamma=self.best_gamma_
+            X_source, self.centers_, metric="rbf", gamma=self.best_gamma_
         )
-        source_weights = A @ self.alpha_
-        weights = np.zeros(X.shape[0], dtype=source_weights.dtype)
-        weights[source_idx] = source_weights
-        return weights
+        return A @ self.alpha_
 
     def _auto_scale_gammas(self, gamma, X):
         if isinstance(gamma, str):
@@ -587,6 +793,8 @@ def KLIEPReweight(
     tol=1e-6,
     max_iter=1000,
     random_state=None,
+    n_jobs=None,
+    batch_size=None,
 ):
     """KLIEPReweight pipeline adapter and estimator.
 
@@ -613,6 +821,15 @@ def KLIEPReweight(
     random_state : int, RandomState instance or None, default=None
         Determines random number generation for dataset creation. Pass an int
         for reproducible output across multiple function calls.
+    n_jobs : int, default=None
+        The number of parallel jobs used to evaluate the cross validation
+        folds when several gammas are given.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
+        ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
+        for more details.
+    batch_size : int, default=None
+        Number of samples processed at once when computing the weights.
+        If None, all the samples are processed at once.
 
     Returns
     -------
@@ -635,6 +852,8 @@ def KLIEPReweight(
             tol=tol,
             max_iter=max_iter,
             random_state=random_state,
+            n_jobs=n_jobs,
+            batch_size=batch_size,
         ),
         base_estimator,
     )
@@ -672,7 +891,8 @@ class NearestNeighborReweightAdapter(BaseReweightAdapter):
         showing the impact of the `weights` parameter on the decision
         boundary.
 
-    algorithm : {'auto', 'ball_tree', 'kd_tree', 'brute'}, default='auto'
+    algorithm : {'auto', 'ball_tree', 'kd_tree', 'brute', 'rp_forest'}, \
+            default='auto'
         Algorithm used to compute the nearest neighbors:
 
         - 'ball_tree' will use :class:`BallTree`
@@ -680,15 +900,18 @@ class NearestNeighborReweightAdapter(BaseReweightAdapter):
         - 'brute' will use a brute-force search.
         - 'auto' will attempt to decide the most appropriate algorithm
           based on the values passed to :meth:`fit` method.
+        - 'rp_forest' will use an approximate search with a forest of
+          random projection trees, suited for high-dimensional data where
+          exact trees degrade. Only the euclidean metric is supported.
 
         Note: fitting on sparse input will override the setting of
         this parameter, using brute force.
 
     leaf_size : int, default=30
-        Leaf size passed to BallTree or KDTree.  This can affect the
-        speed of the construction and query, as well as the memory
-        required to store the tree.  The optimal value depends on the
-        nature of the problem.
+        Leaf size passed to BallTree, KDTree or to the random projection
+        trees.  This can affect the speed of the construction and query,
+        as well as the memory required to store the tree.  The optimal
+        value depends on the nature of the problem.
 
     p : float, default=2
         Power parameter for the Minkowski metric. When p = 1, this is equivalent
@@ -724,6 +947,25 @@ class NearestNeighborReweightAdapter(BaseReweightAdapter):
         for more details.
         Doesn't affect :meth:`fit` method.
 
+    n_trees : int, default=10
+        Number of random projection trees when `algorithm='rp_forest'`.
+
+    batch_size : int, default=None
+        Number of target samples queried at once when computing the
+        weights. If None, all the target samples are queried at once.
+
+    random_state : int, RandomState instance or None, default=None
+        Determines random number generation for the random projection
+        trees when `algorithm='rp_forest'`.
+
+    Attributes
+    ----------
+    `estimator_` : object
+        The nearest neighbors index fitted on the source data.
+    `source_fingerprint_` : str
+        Hash of the source data used in :meth:`fit`. The fitted index is
+        reused when computing the weights of the same source data.
+
     References
     ----------
     .. [24] Nearest neighbor-based importance weighting.
@@ -742,6 +984,9 @@ class NearestNeighborReweightAdapter(BaseReweightAdapter):
         metric_params=None,
         n_jobs=None,
         laplace_smoothing=False,
+        n_trees=10,
+        batch_size=None,
+        random_state=None,
     ):
         super().__init__()
         self.n_neighbors = n_neighbors
@@ -753,6 +998,9 @@ class NearestNeighborReweightAdapter(BaseReweightAdapter):
         self.metric_params = metric_params
         self.n_jobs = n_jobs
         self.laplace_smoothing = laplace_smoothing
+        self.n_trees = n_trees
+        self.batch_size = batch_size
+        self.random_state = random_state
         self.base_estimator = KNeighborsClassifier(
             n_neighbors=self.n_neighbors,
             weights=self.weights,
@@ -784,37 +1032,84 @@ class NearestNeighborReweightAdapter(BaseReweightAdapter):
         X, sample_domain = check_X_domain(X, sample_domain)
         X_source, X_target = source_target_split(X, sample_domain=sample_domain)
         self.X_source_fit = X_source
-        indices_source = np.arange(X_source.shape[0])
-
-        self.estimator_ = clone(self.base_estimator)
-        self.estimator_.fit(X_source, indices_source)
+        self.source_fingerprint_ = _fingerprint(X_source)
+        self.estimator_ = self._fit_estimator(X_source)
+        self._estimator_cache = None
 
         return self
 
-    def _get_weights(self, Xs, Xt):
-        indices_source = np.arange(Xs.shape[0])
+    def _fit_estimator(self, X_source):
+        if self.algorithm == "rp_forest":
+            if self.metric not in ("euclidean", "minkowski") or (
+                self.metric == "minkowski" and self.p != 2
+            ):
+                raise ValueError(
+                    "`algorithm='rp_forest'` only supports the euclidean metric"
+                )
+            estimator = _RandomProjectionForest(
+                n_trees=self.n_trees,
+                leaf_size=self.leaf_size,
+                random_state=self.random_state,
+            )
+            return estimator.fit(X_source)
         estimator = clone(self.base_estimator)
-        estimator.fit(Xs, indices_source)
-        predictions = estimator.predict(Xt)
+        return estimator.fit(X_source, np.arange(X_source.shape[0]))
 
-        unique, counts = np.unique(predictions, return_counts=True)
-        weights = np.ones(Xs.shape[0]) * float(self.laplace_smoothing)
-        weights[unique] += counts
+    def _get_estimator(self, X_source):
+        """Nearest neighbors index of the source data.
+
+        The index fitted in :meth:`fit` (or in the last call with other
+        source data) is reused when the fingerprints of the data match.
+        """
+        fingerprint = _fingerprint(X_source)
+        if fingerprint == self.source_fingerprint_:
+            return self.estimator_
+        if self._estimator_cache is None or self._estimator_cache[0] != fingerprint:
+            self._estimator_cache = (fingerprint, self._fit_estimator(X_source))
+        return self._estimator_cache[1]
+
+    def _predict(self, estimator, Xt):
+        """Index of the source sample voted by the neighbors of each target."""
+        if self.algorithm != "rp_forest":
+            return estimator.predict(Xt)
+        dist, ind = estimator.kneighbors(Xt, n_neighbors=self.n_neighbors)
+        if self.weights in (None, "uniform"):
+            # all the neighbors have distinct labels, the vote is a tie
+            # and the smallest label is kept as in KNeighborsClassifier
+            return np.where(ind >= 0, ind, np.iinfo(ind.dtype).max).min(axis=1)
+        with np.errstate(divide="ignore"):
+            weights = 1 / dist if self.weights == "distance" else self.weights(dist)
+        return ind[np.arange(ind.shape[0]), np.argmax(weights, axis=1)]
+
+    def _get_weights(self, estimator, n_source, Xt):
+        batch_size = self.batch_size or max(Xt.shape[0], 1)
+        if self.algorithm == "rp_forest":
+            parallel = Parallel(n_jobs=self.n_jobs, prefer="threads")
+        else:
+            # queries of sklearn neighbors are already run with `n_jobs`
+            parallel = Parallel(n_jobs=None)
+        counts = parallel(
+            delayed(self._count_neighbors)(estimator, n_source, Xt[batch])
+            for batch in gen_batches(Xt.shape[0], batch_size)
+        )
+        weights = np.ones(n_source) * float(self.laplace_smoothing)
+        for batch_counts in counts:
+            weights += batch_counts
         return weights
 
+    def _count_neighbors(self, estimator, n_source, Xt):
+        return np.bincount(self._predict(estimator, Xt), minlength=n_source)
+
     def compute_weights(self, X, y=None, *, sample_domain=None, **params):
+        check_is_fitted(self)
         X, sample_domain = check_X_domain(X, sample_domain, allow_source=True)
         source_idx = extract_source_indices(sample_domain)
-        # xxx(okachaiev): do we need np.where here?
-        (source_idx,) = np.where(source_idx)
-        indices_source = np.arange(X[source_idx].shape[0])
-        if np.array_equal(self.X_source_fit, X[source_idx]):
-            estimator = self.estimator_
-        else:
-            estimator = clone(self.base_estimator)
-            estimator.fit(X[source_idx], indices_source)
+        X_source = X[source_idx]
+        estimator = self._get_estimator(X_source)
         weights = np.ones(X.shape[0])
-        weights[source_idx] = self._get_weights(X[source_idx], X[~source_idx])
+        weights[source_idx] = self._get_weights(
+            estimator, X_source.shape[0], X[~source_idx]
+        )
         return weights
 
 
@@ -829,6 +1124,9 @@ def NearestNeighborReweight(
     metric_params=None,
     n_jobs=None,
     laplace_smoothing=False,
+    n_trees=10,
+    batch_size=None,
+    random_state=None,
 ):
     """Density re-weighting pipeline adapter and estimator.
 
@@ -867,7 +1165,8 @@ def NearestNeighborReweight(
         showing the impact of the `weights` parameter on the decision
         boundary.
 
-    algorithm : {'auto', 'ball_tree', 'kd_tree', 'brute'}, default='auto'
+    algorithm : {'auto', 'ball_tree', 'kd_tree', 'brute', 'rp_forest'}, \
+            default='auto'
         Algorithm used to compute the nearest neighbors:
 
         - 'ball_tree' will use :class:`BallTree`
@@ -875,15 +1174,18 @@ def NearestNeighborReweight(
         - 'brute' will use a brute-force search.
         - 'auto' will attempt to decide the most appropriate algorithm
           based on the values passed to :meth:`fit` method.
+        - 'rp_forest' will use an approximate search with a forest of
+          random projection trees, suited for high-dimensional data where
+          exact trees degrade. Only the euclidean metric is supported.
 
         Note: fitting on sparse input will override the setting of
         this parameter, using brute force.
 
     leaf_size : int, default=30
-        Leaf size passed to BallTree or KDTree.  This can affect the
-        speed of the construction and query, as well as the memory
-        required to store the tree.  The optimal value depends on the
-        nature of the problem.
+        Leaf size passed to BallTree, KDTree or to the random projection
+        trees.  This can affect the speed of the construction and query,
+        as well as the memory required to store the tree.  The optimal
+        value depends on the nature of the problem.
 
     p : float, default=2
         Power parameter for the Minkowski metric. When p = 1, this is equivalent
@@ -919,6 +1221,17 @@ def NearestNeighborReweight(
         for more details.
         Doesn't affect :meth:`fit` method.
 
+    n_trees : int, default=10
+        Number of random projection trees when `algorithm='rp_forest'`.
+
+    batch_size : int, default=None
+        Number of target samples queried at once when computing the
+        weights. If None, all the target samples are queried at once.
+
+    random_state : int, RandomState instance or None, default=None
+        Determines random number generation for the random projection
+        trees when `algorithm='rp_forest'`.
+
     Returns
     -------
     pipeline : sklearn pipeline
@@ -944,6 +1257,9 @@ def NearestNeighborReweight(
             metric_params=metric_params,
             n_jobs=n_jobs,
             laplace_smoothing=laplace_smoothing,
+            n_trees=n_trees,
+            batch_size=batch_size,
+            random_state=random_state,
         ),
         base_estimator,
     )
@@ -981,7 +1297,21 @@ class KMMReweightAdapter(BaseReweightAdapter):
     smooth_weights : bool, default=False
         If True, the weights are "smoothed" using the kernel function.
     solver : string, default='frank-wolfe'
-        Available solvers : ['frank-wolfe', 'scipy'].
+        Available solvers : ['frank-wolfe', 'scipy', 'admm'].
+    approximation : {None, 'nystroem', 'rff'}, default=None
+        Low-rank approximation of the kernel. If None, the exact
+        (n_samples_source, n_samples_source) kernel matrix is computed.
+        If 'nystroem', the kernel is approximated with Nystroem landmarks
+        sampled from the source and target data. If 'rff', random Fourier
+        features are used (only available for the 'rbf' kernel).
+        With an approximation the QP is solved on the factored kernel so
+        that the memory is linear in the number of source samples (use
+        the 'frank-wolfe' or 'admm' solver to benefit from it).
+    n_components : int, default=100
+        Rank of the kernel approximation. Ignored if `approximation` is None.
+    random_state : int, RandomState instance or None, default=None
+        Determines random number generation for the kernel approximation.
+        Pass an int for reproducible output across multiple function calls.
 
     Attributes
     ----------
@@ -989,6 +1319,12 @@ class KMMReweightAdapter(BaseReweightAdapter):
         The learned source weights.
     `X_source_` : array-like, shape (n_samples, n_features)
         The source data.
+    `kernel_approx_` : object
+        The fitted kernel approximation (only if `approximation` is not None).
+    `weighted_source_features_` : array-like, shape (n_components,)
+        Approximate kernel features of the source data summed with the
+        learned weights, used to smooth the weights of new samples
+        (only if `approximation` is not None).
 
     References
     ----------
@@ -1009,6 +1345,9 @@ class KMMReweightAdapter(BaseReweightAdapter):
         max_iter=1000,
         smooth_weights=False,
         solver="frank-wolfe",
+        approximation=None,
+        n_components=100,
+        random_state=None,
     ):
         super().__init__()
         self.kernel = kernel
@@ -1021,6 +1360,9 @@ class KMMReweightAdapter(BaseReweightAdapter):
         self.max_iter = max_iter
         self.smooth_weights = smooth_weights
         self.solver = solver
+        self.approximation = approximation
+        self.n_components = n_components
+        self.random_state = random_state
 
         if kernel not in KERNEL_PARAMS:
             kernel_list = str(list(KERNEL_PARAMS.keys()))
@@ -1028,6 +1370,17 @@ class KMMReweightAdapter(BaseReweightAdapter):
                 "`kernel` argument should be included in %s,"
                 " got '%s'" % (kernel_list, str(kernel))
             )
+        approximation_list = [None, "nystroem", "rff"]
+        if approximation not in approximation_list:
+            raise ValueError(
+                "`approximation` argument should be included in %s,"
+                " got '%s'" % (str(approximation_list), str(approximation))
+            )
+        if approximation == "rff" and kernel != "rbf":
+            raise ValueError(
+                "`approximation='rff'` is only available for the 'rbf' kernel,"
+                " got '%s'" % str(kernel)
+            )
 
     def fit(self, X, y=None, *, sample_domain=None):
         """Fit adaptation parameters.
@@ -1051,32 +1404,66 @@ class KMMReweightAdapter(BaseReweightAdapter):
         )
         X_source, X_target = source_target_split(X, sample_domain=sample_domain)
 
+        if self.approximation is not None:
+            self.kernel_approx_ = self._fit_kernel_approx(X)
         self.source_weights_ = self._weights_optimization(X_source, X_target)
         self.X_source_ = X_source
+        if self.approximation is not None:
+            self.weighted_source_features_ = (
+                self.kernel_approx_.transform(X_source).T @ self.source_weights_
+            )
 
         return self
 
+    def _fit_kernel_approx(self, X):
+        """Fit the low-rank kernel approximation"""
+        if self.approximation == "nystroem":
+            kernel_approx = Nystroem(
+                kernel=self.kernel,
+                gamma=self.gamma,
+                degree=self.degree,
+                coef0=self.coef0,
+                n_components=min(self.n_components, X.shape[0]),
+                random_state=self.random_state,
+            )
+        else:
+            # same default as the 'rbf' kernel of `pairwise_kernels`
+            gamma = self.gamma if self.gamma is not None else 1.0 / X.shape[1]
+            kernel_approx = RBFSampler(
+                gamma=gamma,
+                n_components=self.n_components,
+                random_state=self.random_state,
+            )
+        return kernel_approx.fit(X)
+
     def _weights_optimization(self, X_source, X_target):
         """Weight optimization"""
-        Kss = pairwise_kernels(
-            X_source,
-            metric=self.kernel,
-            filter_params=True,
-            gamma=self.gamma,
-            degree=self.degree,
-            coef0=self.coef0,
-        )
-        Kst = pairwise_kernels(
-            X_source,
-            X_target,
-            metric=self.kernel,
-            filter_params=True,
-            gamma=self.gamma,
-            degree=self.degree,
-            coef0=self.coef0,
-        )
-        Ns = Kss.shape[0]
-        kappa = Ns * Kst.mean(axis=1)
+        Ns = X_source.shape[0]
+        if self.approximation is None:
+            Kss = pairwise_kernels(
+                X_source,
+                metric=self.kernel,
+                filter_params=True,
+                gamma=self.gamma,
+                degree=self.degree,
+                coef0=self.coef0,
+            )
+            Kst = pairwise_kernels(
+                X_source,
+                X_target,
+                metric=self.kernel,
+                filter_params=True,
+                gamma=self.gamma,
+                degree=self.degree,
+                coef0=self.coef0,
+            )
+            kappa = Ns * Kst.mean(axis=1)
+        else:
+            # Kss ~ Phi_s Phi_s^T is never materialized
+            Phi_s = self.kernel_approx_.transform(X_source)
+            Phi_t = self.kernel_approx_.transform(X_target)
+            Kss = _low_rank_kernel_operator(Phi_s)
+            kappa = Ns * Phi_s @ Phi_t.mean(axis=0)
 
         if self.eps is None:
             eps = (np.sqrt(Ns) - 1) / np.sqrt(Ns)
@@ -1108,6 +1495,11 @@ class KMMReweightAdapter(BaseReweightAdapter):
 
         if np.array_equal(self.X_source_, X[source_idx]) and not self.smooth_weights:
             source_weights = self.source_weights_
+        elif self.approximation is not None:
+            source_weights = (
+                self.kernel_approx_.transform(X[source_idx])
+                @ self.weighted_source_features_
+            )
         else:
             K = pairwise_kernels(
                 X[source_idx],
@@ -1137,6 +1529,9 @@ def KMMReweight(
     max_iter=1000,
     smooth_weights=False,
     solver="frank-wolfe",
+    approximation=None,
+    n_components=100,
+    random_state=None,
 ):
     """KMMReweight pipeline adapter and estimator.
 
@@ -1167,7 +1562,18 @@ def KMMReweight(
         If True, the weights are "smoothed" using the kernel function.
         Pipeline containing the KMMReweight adapter and the base estimator.
     solver : string, default='frank-wolfe'
-        Available solvers : ['frank-wolfe', 'scipy'].
+        Available solvers : ['frank-wolfe', 'scipy', 'admm'].
+    approximation : {None, 'nystroem', 'rff'}, default=None
+        Low-rank approximation of the kernel. If None, the exact
+        (n_samples_source, n_samples_source) kernel matrix is computed.
+        If 'nystroem', the kernel is approximated with Nystroem landmarks
+        sampled from the source and target data. If 'rff', random Fourier
+        features are used (only available for the 'rbf' kernel).
+    n_components : int, default=100
+        Rank of the kernel approximation. Ignored if `approximation` is None.
+    random_state : int, RandomState instance or None, default=None
+        Determines random number generation for the kernel approximation.
+        Pass an int for reproducible output across multiple function calls.
 
     Returns
     -------
@@ -1194,6 +1600,9 @@ def KMMReweight(
             max_iter=max_iter,
             smooth_weights=smooth_weights,
             solver=solver,
+            approximation=approximation,
+            n_components=n_components,
+            random_state=random_state,
         ),
         base_estimator,
     )
@@ -1223,6 +1632,8 @@ class MMDTarSReweightAdapter(BaseReweightAdapter):
         Tolerance for the stopping criterion in the optimization.
     max_iter : int, default=1000
         Number of maximum iteration before stopping the optimization.
+    solver : string, default='scipy'
+        Available solvers : ['scipy', 'admm'].
 
     Attributes
     ----------
@@ -1239,12 +1650,13 @@ class MMDTarSReweightAdapter(BaseReweightAdapter):
             In ICML, 2013.
     """
 
-    def __init__(self, gamma, reg=1e-10, tol=1e-6, max_iter=1000):
+    def __init__(self, gamma, reg=1e-10, tol=1e-6, max_iter=1000, solver="scipy"):
         super().__init__()
         self.gamma = gamma
         self.reg = reg
         self.tol = tol
         self.max_iter = max_iter
+        self.solver = solver
 
     def _weights_optimization(self, X_source, X_target, y_source):
         """Weight optimization"""
@@ -1296,7 +1708,15 @@ class MMDTarSReweightAdapter(BaseReweightAdapter):
             ]
         )
 
-        outputs = qp_solve(Q=P, c=q, A=A, b=b, tol=self.tol, max_iter=self.max_iter)
+        outputs = qp_solve(
+            Q=P,
+            c=q,
+            A=A,
+            b=b,
+            tol=self.tol,
+            max_iter=self.max_iter,
+            solver=self.solver,
+        )
         alpha = outputs[0]
 
         weights = (R @ alpha).flatten()
@@ -1368,6 +1788,7 @@ def MMDTarSReweight(
     reg=1e-10,
     tol=1e-6,
     max_iter=1000,
+    solver="scipy",
 ):
     """Target shift reweighting using MMD.
 
@@ -1385,6 +1806,8 @@ def MMDTarSReweight(
         Tolerance for the stopping criterion in the optimization.
     max_iter : int, default=1000
         Number of maximum iteration before stopping the optimization.
+    solver : string, default='scipy'
+        Available solvers : ['scipy', 'admm'].
 
     Returns
     -------
@@ -1400,6 +1823,8 @@ def MMDTarSReweight(
         base_estimator = SVC().set_fit_request(sample_weight=True)
 
     return make_da_pipeline(
-        MMDTarSReweightAdapter(gamma=gamma, reg=reg, tol=tol, max_iter=max_iter),
+        MMDTarSReweightAdapter(
+            gamma=gamma, reg=reg, tol=tol, max_iter=max_iter, solver=solver
+        ),
         base_estimator,
     )
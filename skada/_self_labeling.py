@@ -45,6 +45,11 @@ class DASVMClassifier(DAEstimator):
     save_indices : Bool
         True if this object should remembers all the values of
             `index_source_deleted` and `index_target_added`
+    warm_start : Bool
+        If True and the base estimator exposes the indices of its support
+        vectors (`support_`, as SVC), each self-labeling round is only fitted
+        on the support vectors of the previous round and on the samples that
+        were not in its training set, instead of all the training samples.
 
     References
     ----------
@@ -74,6 +79,7 @@ class DASVMClassifier(DAEstimator):
         max_iter=1_000,
         save_estimators=False,
         save_indices=False,
+        warm_start=False,
         **kwargs,
     ):
         super().__init__()
@@ -84,6 +90,7 @@ class DASVMClassifier(DAEstimator):
         self.max_iter = max_iter
         self.save_estimators = save_estimators
         self.save_indices = save_indices
+        self.warm_start = warm_start
         self.k = k
 
     def _find_points_next_step(self, indices_list, d, cond_array):
@@ -94,18 +101,12 @@ class DASVMClassifier(DAEstimator):
         # We should take k points for each of the c classes,
         # depending on the values of d
         condition = np.logical_and(~indices_list, cond_array)
-        for _ in range(min(self.k, math.ceil(sum(condition) / self.n_class))):
-            idx = np.unique(np.argmax(d[condition], axis=0))
-            # We need to get all those indices to be take into account
-            # the fact that the some previous points weren't in the list
-            for ll in range(condition.shape[0]):
-                if ~condition[ll]:
-                    idx[idx >= ll] += 1
-
-            # We finally only need to change the list
-            for ll in idx:
-                # indices_list[l] is False at that point
-                indices_list[ll] = True
+        # `condition` and `d` do not change between the k rounds, which all
+        # select the same points
+        if min(self.k, math.ceil(np.count_nonzero(condition) / self.n_class)) > 0:
+            idx = np.argmax(d[condition], axis=0)
+            # map the indices among the candidates to indices in the list
+            indices_list[np.flatnonzero(condition)[idx]] = True
 
     def _get_X_y(
         self, new_estimator, index_target_added, index_source_deleted, Xs, Xt, ys
@@ -123,7 +124,7 @@ class DASVMClassifier(DAEstimator):
 
     def _get_decision(self, new_estimator, X, indices_list):
         """Look at the points that have either not been discarded or not been added."""
-        if sum(~indices_list) > 0:
+        if np.count_nonzero(~indices_list) > 0:
             df = new_estimator.decision_function(X[~indices_list])
             # df.ndim allows us to know if we are in the
             # `binary` case or the `multiclass` one
@@ -131,7 +132,7 @@ class DASVMClassifier(DAEstimator):
             decisions[~indices_list] = df
             decisions = np.array([-decisions + 1, decisions + 1]).T
         else:
-            decisions = np.ones(X.shape[0])
+            decisions = np.ones((X.shape[0], self.n_class))
         return decisions
 
     def fit(self, X, y=None, sample_domain=None):
@@ -207,27 +208,38 @@ class DASVMClassifier(DAEstimator):
             self.indices_source_deleted.append(np.copy(index_source_deleted))
             self.indices_target_added.append(np.copy(index_target_added))
 
+        # ids of the training samples of the previous round (source samples
+        # are numbered first) and of the samples its estimator was fitted on
+        train_ids = fit_ids = np.arange(n)
+
         i = 0
         for i in range(1, self.max_iter):
-            if sum(in_margin_target) == 0:
+            if not np.any(in_margin_target):
                 break
 
-            old_estimator = new_estimator
             X_train, y_train = self._get_X_y(
                 new_estimator, index_target_added, index_source_deleted, Xs, Xt, ys
             )
+            source_kept = np.flatnonzero(~index_source_deleted)
+            target_added = np.flatnonzero(index_target_added)
+            # labels given to the added target points by the previous estimator
+            old_labels = y_train[source_kept.shape[0] :]
+
+            new_train_ids = np.concatenate((source_kept, n + target_added))
+            keep = self._warm_start_mask(
+                new_estimator, fit_ids, train_ids, new_train_ids, y_train
+            )
+            train_ids, fit_ids = new_train_ids, new_train_ids[keep]
 
             new_estimator = clone(self.base_estimator)
-            new_estimator.fit(X_train, y_train)
+            new_estimator.fit(X_train[keep], y_train[keep])
             if self.save_estimators:
                 self.estimators.append(new_estimator)
 
-            for j in range(len(index_target_added)):
-                if index_target_added[j]:
-                    x = Xt[j]
-                    if new_estimator.predict([x]) != old_estimator.predict([x]):
-                        # index_target_added[j] should be True
-                        index_target_added[j] = False
+            # discard the added target points whose label changed
+            if target_added.shape[0] > 0:
+                new_labels = new_estimator.predict(Xt[target_added])
+                index_target_added[target_added[new_labels != old_labels]] = False
 
             decisions_source = self._get_decision(
                 new_estimator, Xs, index_source_deleted
@@ -257,8 +269,7 @@ class DASVMClassifier(DAEstimator):
                 self.indices_source_deleted.append(np.copy(index_source_deleted))
                 self.indices_target_added.append(np.copy(index_target_added))
 
-        old_estimator = new_estimator
-        X_train, y_train = Xt, old_estimator.predict(Xt)
+        X_train, y_train = Xt, new_estimator.predict(Xt)
 
         new_estimator = clone(self.base_estimator)
         new_estimator.fit(X_train, y_train)
@@ -273,6 +284,22 @@ class DASVMClassifier(DAEstimator):
 
         return self
 
+    def _warm_start_mask(self, estimator, fit_ids, train_ids, new_train_ids, y):
+        """Mask of the training samples to fit the next round on.
+
+        With `warm_start`, the samples that were in the previous training set
+        without being support vectors of the previous estimator are dropped.
+        """
+        keep = np.ones(new_train_ids.shape[0], dtype=bool)
+        if not self.warm_start or not hasattr(estimator, "support_"):
+            return keep
+        support_ids = fit_ids[estimator.support_]
+        keep = np.isin(new_train_ids, support_ids) | ~np.isin(new_train_ids, train_ids)
+        if np.unique(y[keep]).shape[0] < np.unique(y).shape[0]:
+            # some class would have no sample left
+            keep[:] = True
+        return keep
+
     def predict(self, X, **kwargs):
         """Return predicted value by the fitted estimator for `X`
         `predict` method from the estimator we fitted
@@ -11,13 +11,16 @@ import warnings
 
 import numpy as np
 import scipy.linalg
+from scipy.sparse.linalg import LinearOperator, eigsh, lobpcg
 from sklearn.decomposition import PCA
+from sklearn.kernel_approximation import Nystroem
 from sklearn.metrics.pairwise import pairwise_kernels
 from sklearn.neighbors import KNeighborsClassifier
 from sklearn.svm import SVC
 from sklearn.utils import check_random_state
 
 from ._pipeline import make_da_pipeline
+from ._utils import _transform_by_batch
 from .base import BaseAdapter
 from .utils import (
     check_X_domain,
@@ -28,6 +31,23 @@ from .utils import (
 )
 
 
+def _compress_kernel_projection(X_fit, coef, kernel, n_landmarks, random_state):
+    """Fold the dual coefficients of a kernel projection on landmarks
+
+    The projection K(x, X_fit) @ coef of a new sample x is approximated with
+    the Nystroem approximation K(x, Z) K(Z, Z)^+ K(Z, X_fit) @ coef, where Z
+    is a random subset of `n_landmarks` training samples, so that only the
+    kernel between x and the landmarks is needed.
+    """
+    if n_landmarks is None or n_landmarks >= X_fit.shape[0]:
+        return X_fit, coef
+    rng = check_random_state(random_state)
+    landmarks = X_fit[rng.choice(X_fit.shape[0], n_landmarks, replace=False)]
+    K_landmarks = pairwise_kernels(landmarks, metric=kernel)
+    K_fit = pairwise_kernels(landmarks, X_fit, metric=kernel)
+    return landmarks, scipy.linalg.pinvh(K_landmarks) @ (K_fit @ coef)
+
+
 class SubspaceAlignmentAdapter(BaseAdapter):
     """Domain Adaptation Using Subspace Alignment.
 
@@ -227,6 +247,37 @@ class TransferComponentAnalysisAdapter(BaseAdapter):
     mu : float, default=0.1
         The parameter of the regularization in the optimization
         problem.
+    solver : {'exact', 'lanczos'}, default='exact'
+        Eigensolver of the optimization problem. If 'exact', the dense
+        MMD and centering matrices are built and all the eigenvectors
+        are computed. If 'lanczos', the MMD and centering matrices are
+        applied as rank-one updates and only the `n_components` leading
+        eigenvectors of the symmetric generalized eigenvalue problem are
+        computed with the Lanczos algorithm.
+    approximation : {None, 'nystroem'}, default=None
+        Low-rank approximation of the kernel. If 'nystroem', the kernel
+        is approximated with `n_landmarks` Nystroem landmarks, the
+        (n_samples, n_samples) kernel matrix is never computed and the
+        eigenvalue problem is reduced to a (n_landmarks, n_landmarks)
+        one (`solver` is then ignored).
+    n_landmarks : int, default=100
+        Number of landmarks of the kernel approximation. Ignored if
+        `approximation` is None.
+    n_transform_landmarks : int, default=None
+        Number of training samples kept as landmarks to transform new
+        samples. If None, the kernel between the new samples and all the
+        training samples is computed. Otherwise, the eigenvectors are folded
+        on a random subset of landmarks with the Nystroem approximation.
+        Ignored if `approximation` is not None.
+    batch_size : int, default=None
+        Number of samples transformed at once, to bound the memory used by
+        the kernel of new samples. If None, all the samples are transformed
+        at once.
+    random_state : int, RandomState instance or None, default=None
+        Determines random number generation for the kernel approximation,
+        the initialization of the Lanczos algorithm and the selection of
+        the landmarks.
+        Pass an int for reproducible output across multiple function calls.
 
     Attributes
     ----------
@@ -235,11 +286,23 @@ class TransferComponentAnalysisAdapter(BaseAdapter):
     `X_target_` : array
         Target data used for the optimization problem.
     `K_` : array
-        Kernel distance between the data (source and target).
+        Kernel distance between the data (source and target)
+        (only if `approximation` is None).
     `eigvects_` : array
         Highest n_components eigenvectors of the solution
         of the optimization problem used to project
         in the new subspace.
+    `kernel_approx_` : object
+        The fitted kernel approximation (only if `approximation` is not None).
+    `projection_` : array, shape (n_landmarks, n_components)
+        Eigenvectors folded with the approximate kernel features of the
+        training data (only if `approximation` is not None).
+    `transform_landmarks_` : array, shape (n_transform_landmarks, n_features)
+        Samples used to transform new data (all the training samples if
+        `n_transform_landmarks` is None). Only if `approximation` is None.
+    `transform_coef_` : array, shape (n_transform_landmarks, n_components)
+        Coefficients of the kernel with `transform_landmarks_` giving the
+        projection of new data. Only if `approximation` is None.
 
     References
     ----------
@@ -248,11 +311,41 @@ class TransferComponentAnalysisAdapter(BaseAdapter):
            on Neural Networks, 2011.
     """
 
-    def __init__(self, kernel="rbf", n_components=None, mu=0.1):
+    def __init__(
+        self,
+        kernel="rbf",
+        n_components=None,
+        mu=0.1,
+        solver="exact",
+        approximation=None,
+        n_landmarks=100,
+        n_transform_landmarks=None,
+        batch_size=None,
+        random_state=None,
+    ):
         super().__init__()
         self.kernel = kernel
         self.n_components = n_components
         self.mu = mu
+        self.solver = solver
+        self.approximation = approximation
+        self.n_landmarks = n_landmarks
+        self.n_transform_landmarks = n_transform_landmarks
+        self.batch_size = batch_size
+        self.random_state = random_state
+
+        solver_list = ["exact", "lanczos"]
+        if solver not in solver_list:
+            raise ValueError(
+                "`solver` argument should be included in %s,"
+                " got '%s'" % (str(solver_list), str(solver))
+            )
+        approximation_list = [None, "nystroem"]
+        if approximation not in approximation_list:
+            raise ValueError(
+                "`approximation` argument should be included in %s,"
+                " got '%s'" % (str(approximation_list), str(approximation))
+            )
 
     def fit(self, X, y=None, *, sample_domain=None):
         """Fit adaptation parameters.
@@ -281,12 +374,39 @@ class TransferComponentAnalysisAdapter(BaseAdapter):
             X, sample_domain=sample_domain
         )
 
+        if self.n_components is None:
+            n_components = min(X.shape[0], X.shape[1])
+        else:
+            n_components = self.n_components
+
+        if self.approximation is not None:
+            return self._fit_nystroem(n_components)
+
         Kss = pairwise_kernels(self.X_source_, metric=self.kernel)
         Ktt = pairwise_kernels(self.X_target_, metric=self.kernel)
         Kst = pairwise_kernels(self.X_source_, self.X_target_, metric=self.kernel)
         K = np.block([[Kss, Kst], [Kst.T, Ktt]])
         self.K_ = K
 
+        if self.solver == "lanczos":
+            self.eigvects_ = self._solve_lanczos(K, n_components)
+        else:
+            self.eigvects_ = self._solve_exact(K, n_components)
+
+        (
+            self.transform_landmarks_,
+            self.transform_coef_,
+        ) = _compress_kernel_projection(
+            np.concatenate((self.X_source_, self.X_target_)),
+            self.eigvects_,
+            self.kernel,
+            self.n_transform_landmarks,
+            self.random_state,
+        )
+        return self
+
+    def _solve_exact(self, K, n_components):
+        """Eigenvectors of the dense (I + mu K L K)^-1 K H K"""
         ns = self.X_source_.shape[0]
         nt = self.X_target_.shape[0]
         Lss = 1 / ns**2 * np.ones((ns, ns))
@@ -302,12 +422,87 @@ class TransferComponentAnalysisAdapter(BaseAdapter):
 
         eigvals, eigvects = np.linalg.eigh(solution)
 
-        if self.n_components is None:
-            n_components = min(X.shape[0], X.shape[1])
-        else:
-            n_components = self.n_components
         selected_components = np.argsort(np.abs(eigvals))[::-1][:n_components]
-        self.eigvects_ = np.real(eigvects[:, selected_components])
+        return np.real(eigvects[:, selected_components])
+
+    def _mmd_vector(self):
+        """Vector e such that the MMD matrix is L = e e^T"""
+        ns = self.X_source_.shape[0]
+        nt = self.X_target_.shape[0]
+        return np.concatenate((np.full(ns, 1 / ns), np.full(nt, -1 / nt)))
+
+    def _solve_lanczos(self, K, n_components):
+        """Leading eigenvectors of K H K w = lambda (I + mu K L K) w
+
+        With L = e e^T the right-hand side matrix is a rank-one update of
+        the identity, whose inverse square root
+        B^(-1/2) = I - c u u^T / ||u||^2 (with u = K e) gives an equivalent
+        standard symmetric problem solved with `eigsh`.
+        """
+        n = K.shape[0]
+        u = K @ self._mmd_vector()
+        u_norm2 = u @ u
+        c = 1 - 1 / np.sqrt(1 + self.mu * u_norm2)
+
+        def inv_sqrt_B(v):
+            if u_norm2 == 0:
+                return v
+            return v - np.outer(u, u @ v) * (c / u_norm2)
+
+        def matmat(V):
+            V = inv_sqrt_B(V)
+            KV = K @ V
+            # centering matrix H = I - 1 1^T / n
+            KV -= KV.mean(axis=0)
+            return inv_sqrt_B(K @ KV)
+
+        if n_components < n - 1:
+            operator = LinearOperator(
+                (n, n),
+                matvec=lambda v: matmat(v.reshape(-1, 1)).ravel(),
+                matmat=matmat,
+                dtype=K.dtype,
+            )
+            rng = check_random_state(self.random_state)
+            _, eigvects = eigsh(
+                operator, k=n_components, which="LA", v0=rng.uniform(-1, 1, n)
+            )
+        else:
+            _, eigvects = np.linalg.eigh(matmat(np.identity(n)))
+        eigvects = inv_sqrt_B(eigvects[:, ::-1][:, :n_components])
+        return eigvects / np.linalg.norm(eigvects, axis=0)
+
+    def _fit_nystroem(self, n_components):
+        """Solve the problem on the Nystroem approximation K = Phi Phi^T"""
+        X = np.concatenate((self.X_source_, self.X_target_))
+        self.kernel_approx_ = Nystroem(
+            kernel=self.kernel,
+            n_components=min(self.n_landmarks, X.shape[0]),
+            random_state=self.random_state,
+        ).fit(X)
+        Phi = self.kernel_approx_.transform(X)
+
+        u = Phi @ (Phi.T @ self._mmd_vector())
+        u_norm2 = u @ u
+        # Psi = B^(-1/2) Phi, see `_solve_lanczos`
+        Psi = Phi
+        if u_norm2 > 0:
+            c = 1 - 1 / np.sqrt(1 + self.mu * u_norm2)
+            Psi = Phi - np.outer(u, u @ Phi) * (c / u_norm2)
+        Phi_mean = Phi.mean(axis=0)
+        # Phi^T H Phi
+        C = Phi.T @ Phi - X.shape[0] * np.outer(Phi_mean, Phi_mean)
+        Q, R = np.linalg.qr(Psi)
+        n_components = min(n_components, R.shape[0])
+        _, eigvects = scipy.linalg.eigh(
+            R @ C @ R.T,
+            subset_by_index=[R.shape[0] - n_components, R.shape[0] - 1],
+        )
+        eigvects = Q @ eigvects[:, ::-1]
+        if u_norm2 > 0:
+            eigvects -= np.outer(u, u @ eigvects) * (c / u_norm2)
+        self.eigvects_ = eigvects / np.linalg.norm(eigvects, axis=0)
+        self.projection_ = Phi.T @ self.eigvects_
         return self
 
     def fit_transform(self, X, y=None, *, sample_domain=None, **params):
@@ -357,6 +552,13 @@ class TransferComponentAnalysisAdapter(BaseAdapter):
             allow_multi_source=True,
             allow_multi_target=True,
         )
+        if self.approximation is not None:
+            return _transform_by_batch(
+                lambda X: self.kernel_approx_.transform(X) @ self.projection_,
+                X,
+                self.batch_size,
+            )
+
         X_source, X_target = source_target_split(X, sample_domain=sample_domain)
 
         if np.array_equal(X_source, self.X_source_) and np.array_equal(
@@ -364,15 +566,25 @@ class TransferComponentAnalysisAdapter(BaseAdapter):
         ):
             X_ = (self.K_ @ self.eigvects_)[: X.shape[0]]
         else:
-            Ks = pairwise_kernels(X, self.X_source_, metric=self.kernel)
-            Kt = pairwise_kernels(X, self.X_target_, metric=self.kernel)
-            K = np.concatenate((Ks, Kt), axis=1)
-            X_ = (K @ self.eigvects_)[: X.shape[0]]
+            X_ = _transform_by_batch(self._kernel_transform, X, self.batch_size)
         return X_
 
+    def _kernel_transform(self, X):
+        K = pairwise_kernels(X, self.transform_landmarks_, metric=self.kernel)
+        return K @ self.transform_coef_
+
 
 def TransferComponentAnalysis(
-    base_estimator=None, kernel="rbf", n_components=None, mu=0.1
+    base_estimator=None,
+    kernel="rbf",
+    n_components=None,
+    mu=0.1,
+    solver="exact",
+    approximation=None,
+    n_landmarks=100,
+    n_transform_landmarks=None,
+    batch_size=None,
+    random_state=None,
 ):
     """Domain Adaptation Using Transfer Component Analysis.
 
@@ -391,6 +603,26 @@ def TransferComponentAnalysis(
     mu : float, default=0.1
         The parameter of the regularization in the optimization
         problem.
+    solver : {'exact', 'lanczos'}, default='exact'
+        Eigensolver of the optimization problem. If 'lanczos', only the
+        `n_components` leading eigenvectors are computed, without building
+        the dense MMD and centering matrices.
+    approximation : {None, 'nystroem'}, default=None
+        Low-rank approximation of the kernel with `n_landmarks` Nystroem
+        landmarks.
+    n_landmarks : int, default=100
+        Number of landmarks of the kernel approximation. Ignored if
+        `approximation` is None.
+    n_transform_landmarks : int, default=None
+        Number of training samples kept as landmarks to transform new
+        samples. If None, all the training samples are used.
+    batch_size : int, default=None
+        Number of samples transformed at once. If None, all the samples
+        are transformed at once.
+    random_state : int, RandomState instance or None, default=None
+        Determines random number generation for the kernel approximation,
+        the initialization of the Lanczos algorithm and the selection of
+        the landmarks.
 
     Returns
     -------
@@ -408,7 +640,15 @@ def TransferComponentAnalysis(
 
     return make_da_pipeline(
         TransferComponentAnalysisAdapter(
-            kernel=kernel, n_components=n_components, mu=mu
+            kernel=kernel,
+            n_components=n_components,
+            mu=mu,
+            solver=solver,
+            approximation=approximation,
+            n_landmarks=n_landmarks,
+            n_transform_landmarks=n_transform_landmarks,
+            batch_size=batch_size,
+            random_state=random_state,
         ),
         base_estimator,
     )
@@ -439,10 +679,36 @@ class TransferJointMatchingAdapter(BaseAdapter):
         before the algorithm stops
     verbose : bool, default=False
         If True, print the loss value at each iteration.
+    solver : {'exact', 'lobpcg'}, default='exact'
+        Solver of the generalized eigenvalue problem of each iteration.
+        If 'exact', the `n_components` smallest eigenpairs are computed
+        with a dense solver. If 'lobpcg', the problem is solved with
+        LOBPCG warm-started from the previous iteration, using only
+        products with the kernel matrix.
+    n_transform_landmarks : int, default=None
+        Number of training samples kept as landmarks to transform new
+        samples. If None, the kernel between the new samples and all the
+        training samples is computed. Otherwise, the coefficients are folded
+        on a random subset of landmarks with the Nystroem approximation.
+    batch_size : int, default=None
+        Number of samples transformed at once, to bound the memory used by
+        the kernel of new samples. If None, all the samples are transformed
+        at once.
+    random_state : int, RandomState instance or None, default=None
+        Determines the initialization of the 'lobpcg' solver and the
+        selection of the landmarks.
+        Pass an int for reproducible output across multiple function calls.
 
     Attributes
     ----------
-    None
+    `A_` : array, shape (n_samples, n_components)
+        Coefficients of the projection in the kernel space.
+    `transform_landmarks_` : array, shape (n_transform_landmarks, n_features)
+        Samples used to transform new data (all the training samples if
+        `n_transform_landmarks` is None).
+    `transform_coef_` : array, shape (n_transform_landmarks, n_components)
+        Coefficients of the kernel with `transform_landmarks_` giving the
+        projection of new data.
 
     References
     ----------
@@ -461,6 +727,10 @@ class TransferJointMatchingAdapter(BaseAdapter):
         kernel="rbf",
         tol=0.01,
         verbose=False,
+        solver="exact",
+        n_transform_landmarks=None,
+        batch_size=None,
+        random_state=None,
     ):
         super().__init__()
         self.n_components = n_components
@@ -469,6 +739,17 @@ class TransferJointMatchingAdapter(BaseAdapter):
         self.max_iter = max_iter
         self.tol = tol
         self.verbose = verbose
+        self.solver = solver
+        self.n_transform_landmarks = n_transform_landmarks
+        self.batch_size = batch_size
+        self.random_state = random_state
+
+        solver_list = ["exact", "lobpcg"]
+        if solver not in solver_list:
+            raise ValueError(
+                "`solver` argument should be included in %s,"
+                " got '%s'" % (str(solver_list), str(solver))
+            )
 
     def fit_transform(self, X, y=None, *, sample_domain=None, **params):
         """Predict adaptation (weights, sample or labels).
@@ -525,18 +806,12 @@ class TransferJointMatchingAdapter(BaseAdapter):
             K = self._get_kernel_matrix(X_source, X_target)
             X_ = K @ self.A_
         else:
-            Ks = pairwise_kernels(X, self.X_source_, metric=self.kernel)
-            Kt = pairwise_kernels(X, self.X_target_, metric=self.kernel)
-            K = np.concatenate((Ks, Kt), axis=1)
-            X_ = K @ self.A_
+            X_ = _transform_by_batch(self._kernel_transform, X, self.batch_size)
         return X_
 
-    def _get_mmd_matrix(self, ns, nt, sample_domain):
-        Mss = (1 / (ns**2)) * np.ones((ns, ns))
-        Mtt = (1 / (nt**2)) * np.ones((nt, nt))
-        Mst = -(1 / (ns * nt)) * np.ones((ns, nt))
-        M = np.block([[Mss, Mst], [Mst.T, Mtt]])
-        return M
+    def _kernel_transform(self, X):
+        K = pairwise_kernels(X, self.transform_landmarks_, metric=self.kernel)
+        return K @ self.transform_coef_
 
     def _get_kernel_matrix(self, X_source, X_target):
         Kss = pairwise_kernels(X_source, metric=self.kernel)
@@ -580,25 +855,59 @@ class TransferJointMatchingAdapter(BaseAdapter):
         n = X.shape[0]
         source_mask = extract_source_indices(sample_domain)
 
-        H = np.identity(n) - 1 / n * np.ones((n, n))
         K = self._get_kernel_matrix(X_source, X_target)
-        M = self._get_mmd_matrix(X_source.shape[0], X_target.shape[0], sample_domain)
-        M /= np.linalg.norm(M, ord="fro")
-        G = np.identity(n)
+        # the MMD matrix M = e e^T / ||e e^T||_F is rank-one and the
+        # centering matrix H = I - 1 1^T / n is a rank-one update of the
+        # identity: K M K and K H K are constant over the iterations
+        e = np.concatenate(
+            (
+                np.full(X_source.shape[0], 1 / X_source.shape[0]),
+                np.full(X_target.shape[0], -1 / X_target.shape[0]),
+            )
+        )
+        Ke = K @ e / np.linalg.norm(e)
+        # H K, so that K H K = (H K)^T (H K) since H is a projection
+        HK = K - K.mean(axis=0)
+        del K
+        if self.solver == "exact":
+            KMK = np.outer(Ke, Ke)
+            KHK = HK.T @ HK
+
+            def KHK_dot(A):
+                return KHK @ A
+
+        else:
+
+            def KHK_dot(A):
+                return HK.T @ (HK @ A)
 
         EPS_eigval = 1e-10
+
+        def C_dot(A):
+            return KHK_dot(A) + EPS_eigval * A
+
+        G = np.ones(n)
+        rng = check_random_state(self.random_state)
+        A = None
+
         last_loss = -2 * self.tol
         for i in range(self.max_iter):
             # update A
-            B = K @ M @ K.T + self.tradeoff * G
-            C = K @ H @ K.T
-            B = B + EPS_eigval * np.identity(n)
-            C = C + EPS_eigval * np.identity(n)
-            phi, A = scipy.linalg.eigh(B, C)
+            if self.solver == "exact":
+                B = KMK.copy()
+                B[np.diag_indices(n)] += self.tradeoff * G + EPS_eigval
+                C = KHK.copy()
+                C[np.diag_indices(n)] += EPS_eigval
+                phi, A = scipy.linalg.eigh(B, C, subset_by_index=[0, n_components - 1])
+            else:
+                phi, A = self._solve_lobpcg(
+                    Ke, self.tradeoff * G + EPS_eigval, C_dot, A, n_components, rng
+                )
             phi = phi + EPS_eigval
-            indices = np.argsort(phi)[:n_components]
-            phi, A = phi[indices], A[:, indices]
-            error_eigv = np.linalg.norm(B @ A - C @ A @ np.diag(phi))
+            KMK_A = np.outer(Ke, Ke @ A)
+            CA = C_dot(A)
+            BA = KMK_A + (self.tradeoff * G + EPS_eigval)[:, None] * A
+            error_eigv = np.linalg.norm(BA - CA * phi)
             if error_eigv > 1e-5:
                 warnings.warn(
                     "The solution of the generalized eigenvalue problem "
@@ -610,9 +919,8 @@ class TransferJointMatchingAdapter(BaseAdapter):
             G = np.zeros(n, dtype=np.float64)
             G[A_norms != 0] = 1 / (2 * A_norms[A_norms != 0] + EPS_eigval)
             G[~source_mask] = 1
-            G = np.diag(G)
 
-            loss = np.trace(A.T @ K @ M @ K @ A)
+            loss = np.trace(A.T @ KMK_A)
             reg = (
                 np.sum(np.linalg.norm(A[source_mask], axis=1))
                 + np.linalg.norm(A[~source_mask]) ** 2
@@ -624,7 +932,7 @@ class TransferJointMatchingAdapter(BaseAdapter):
                     f"iter {i}: loss={loss_total:.3e}, loss_mmd={loss:.3e}, "
                     f"reg={reg:.3e}"
                 )
-                mat = A.T @ K @ H @ K.T @ A
+                mat = A.T @ KHK_dot(A)
                 cond = np.allclose(mat, np.identity(n_components))
                 dist = np.linalg.norm(mat - np.identity(n_components))
                 print(f"Constraint satisfaction: {cond}, dist={dist:.3e}")
@@ -636,9 +944,67 @@ class TransferJointMatchingAdapter(BaseAdapter):
                 last_loss = loss_total
 
         self.A_ = A
+        (
+            self.transform_landmarks_,
+            self.transform_coef_,
+        ) = _compress_kernel_projection(
+            np.concatenate((X_source, X_target)),
+            A,
+            self.kernel,
+            self.n_transform_landmarks,
+            self.random_state,
+        )
 
         return self
 
+    def _solve_lobpcg(self, u, d, C_dot, A_init, n_components, rng):
+        """Smallest eigenpairs of (u u^T + diag(d)) a = phi (K H K + eps) a
+
+        With F = diag(d)^(-1/2) (I + w w^T)^(-1/2) and w = diag(d)^(-1/2) u,
+        F F^T is the inverse of the left-hand side matrix and the problem is
+        equivalent to finding the largest eigenpairs of the standard
+        symmetric problem F^T (K H K + eps) F y = phi^(-1) y, with a = F y.
+        """
+        n = u.shape[0]
+        d_inv_sqrt = 1 / np.sqrt(d)
+        w = u * d_inv_sqrt
+        w_norm2 = w @ w
+        # (I + w w^T)^(-1/2) and (I + w w^T)^(1/2)
+        c_inv, c_sqrt = 0, 0
+        if w_norm2 > 0:
+            c_inv = (1 - 1 / np.sqrt(1 + w_norm2)) / w_norm2
+            c_sqrt = (np.sqrt(1 + w_norm2) - 1) / w_norm2
+
+        def F_dot(Y):
+            return d_inv_sqrt[:, None] * (Y - np.outer(w, w @ Y) * c_inv)
+
+        def matmat(Y):
+            Y = Y.reshape(n, -1)
+            FY = C_dot(F_dot(Y))
+            FY = d_inv_sqrt[:, None] * FY
+            return FY - np.outer(w, w @ FY) * c_inv
+
+        operator = LinearOperator((n, n), matvec=matmat, matmat=matmat, dtype=u.dtype)
+        if A_init is None:
+            Y_init = rng.standard_normal((n, n_components))
+        else:
+            # warm start from the eigenvectors of the previous iteration
+            Y_init = np.sqrt(d)[:, None] * A_init
+            Y_init = Y_init + np.outer(w, w @ Y_init) * c_sqrt
+        # lobpcg uses an absolute tolerance on the residuals, estimate the
+        # scale of the eigenvalues to use a relative one
+        Y_init = np.linalg.qr(Y_init)[0]
+        scale = np.max(np.sum(Y_init * matmat(Y_init), axis=0))
+        with warnings.catch_warnings():
+            # lobpcg switches to a dense solver for the small problems
+            warnings.simplefilter("ignore", UserWarning)
+            mu, Y = lobpcg(operator, Y_init, largest=True, tol=1e-8 * scale, maxiter=n)
+        order = np.argsort(mu)[::-1]
+        A = F_dot(Y[:, order])
+        # same normalization as the dense solver: A^T (K H K + eps) A = I
+        A /= np.sqrt(np.sum(A * C_dot(A), axis=0))
+        return 1 / mu[order], A
+
 
 def TransferJointMatching(
     base_estimator=None,
@@ -647,6 +1013,10 @@ def TransferJointMatching(
     kernel="rbf",
     max_iter=100,
     tol=0.01,
+    solver="exact",
+    n_transform_landmarks=None,
+    batch_size=None,
+    random_state=None,
 ):
     """
 
@@ -667,7 +1037,22 @@ def TransferJointMatching(
         fitting.
     kernel : kernel object, default='rbf'
         The kernel computed between data.
-    tol :
+    tol : float, default=0.01
+        The threshold for the differences between losses on two iteration
+        before the algorithm stops
+    solver : {'exact', 'lobpcg'}, default='exact'
+        Solver of the generalized eigenvalue problem of each iteration.
+        If 'lobpcg', the problem is solved with LOBPCG warm-started from
+        the previous iteration.
+    n_transform_landmarks : int, default=None
+        Number of training samples kept as landmarks to transform new
+        samples. If None, all the training samples are used.
+    batch_size : int, default=None
+        Number of samples transformed at once. If None, all the samples
+        are transformed at once.
+    random_state : int, RandomState instance or None, default=None
+        Determines the initialization of the 'lobpcg' solver and the
+        selection of the landmarks.
 
     Returns
     -------
@@ -691,6 +1076,10 @@ def TransferJointMatching(
             kernel=kernel,
             max_iter=max_iter,
             tol=tol,
+            solver=solver,
+            n_transform_landmarks=n_transform_landmarks,
+            batch_size=batch_size,
+            random_state=random_state,
         ),
         base_estimator,
     )
@@ -5,7 +5,9 @@
 #
 # License: BSD 3-Clause
 
+import hashlib
 import logging
+from collections import OrderedDict
 from enum import Enum
 from numbers import Real
 
@@ -18,7 +20,7 @@ from sklearn.covariance import (
     shrunk_covariance,
 )
 from sklearn.preprocessing import StandardScaler
-from sklearn.utils import check_random_state
+from sklearn.utils import check_random_state, gen_batches
 from sklearn.utils.multiclass import type_of_target
 
 _SKLEARN_OLDER_15 = Version(sklearn.__version__) >= Version("1.5.0")
@@ -235,3 +237,214 @@ def _route_params(request, params, caller):
         return request._route_params(params=params, parent=caller, caller=caller)
     else:
         return request._route_params(params=params)
+
+
+def _fingerprint(*arrays):
+    """Content hash of arrays, used as a cache key.
+
+    Hashing the raw buffer is much cheaper than keeping a copy of the
+    data around to compare it with `np.array_equal`.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        if array is None:
+            digest.update(b"None")
+            continue
+        array = np.ascontiguousarray(array)
+        digest.update(str((array.shape, array.dtype.str)).encode())
+        digest.update(array.data)
+    return digest.hexdigest()
+
+
+def _transform_by_batch(transform, X, batch_size=None):
+    """Apply `transform` to X by chunks of `batch_size` samples"""
+    if batch_size is None or batch_size >= X.shape[0]:
+        return transform(X)
+    return np.concatenate(
+        [transform(X[batch]) for batch in gen_batches(X.shape[0], batch_size)]
+    )
+
+
+class _LRUCache:
+    """Bounded cache discarding the least recently used entries first.
+
+    The entries are not pickled, so that the copies of an object holding
+    the cache, e.g. in the workers of a parallel search, start empty.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        return {"_entries": OrderedDict()}
+
+    def get(self, key):
+        """Return the entry of key, or None if it is not cached."""
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def set(self, key, value, maxsize):
+        """Cache the entry of key, keeping at most `maxsize` entries."""
+        if maxsize > 0:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+        while len(self._entries) > max(maxsize, 0):
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all the entries."""
+        self._entries.clear()
+
+
+class _RandomProjectionForest:
+    """Approximate nearest neighbors index based on random projection trees.
+
+    Each tree recursively splits the data with the hyperplane equidistant
+    to two randomly selected points until the leaves contain at most
+    `leaf_size` samples. The neighbors of a query are searched exactly
+    among the samples sharing a leaf with it in at least one of the trees.
+    Only the euclidean distance is supported.
+
+    Parameters
+    ----------
+    n_trees : int, default=10
+        Number of trees. More trees give more accurate neighbors.
+    leaf_size : int, default=30
+        Maximum number of samples in a leaf.
+    random_state : int, RandomState instance or None, default=None
+        Determines random number generation for the hyperplanes.
+    """
+
+    def __init__(self, n_trees=10, leaf_size=30, random_state=None):
+        self.n_trees = n_trees
+        self.leaf_size = leaf_size
+        self.random_state = random_state
+
+    def fit(self, X, y=None):
+        X = np.asarray(X, dtype=np.float64)
+        rng = check_random_state(self.random_state)
+        self._fit_X = X
+        self.trees_ = [self._build_tree(X, rng) for _ in range(self.n_trees)]
+        return self
+
+    def _build_tree(self, X, rng):
+        # nodes are stored in flat lists, leaves have a child index of -1
+        normals, offsets, children, leaves = [], [], [], []
+        stack = [(0, np.arange(X.shape[0]))]
+        normals.append(None)
+        offsets.append(0.0)
+        children.append(None)
+        while stack:
+            node, idx = stack.pop()
+            if len(idx) <= max(self.leaf_size, 1):
+                children[node] = (-1, len(leaves))
+                leaves.append(idx)
+                continue
+            a, b = rng.choice(idx, 2, replace=False)
+            normal = X[a] - X[b]
+            offset = normal @ (X[a] + X[b]) / 2
+            side = X[idx] @ normal > offset
+            if side.all() or not side.any():
+                # duplicated points, split at random
+                side = rng.permutation(len(idx)) < len(idx) // 2
+            normals[node], offsets[node] = normal, offset
+            left, right = len(children), len(children) + 1
+            children[node] = (left, right)
+            normals.extend([None, None])
+            offsets.extend([0.0, 0.0])
+            children.extend([None, None])
+            stack.append((left, idx[~side]))
+            stack.append((right, idx[side]))
+        return normals, offsets, children, leaves
+
+    def _query_leaves(self, tree, X):
+        """Index of the leaf of each sample of X."""
+        normals, offsets, children, _ = tree
+        leaf_of = np.empty(X.shape[0], dtype=np.intp)
+        stack = [(0, np.arange(X.shape[0]))]
+        while stack:
+            node, idx = stack.pop()
+            left, right = children[node]
+            if left == -1:
+                leaf_of[idx] = right
+                continue
+            side = X[idx] @ normals[node] > offsets[node]
+            stack.append((left, idx[~side]))
+            stack.append((right, idx[side]))
+        return leaf_of
+
+    def kneighbors(self, X, n_neighbors=1):
+        """Find the approximate K-neighbors of the samples of X.
+
+        Parameters
+        ----------
+        X : array-like, shape (n_queries, n_features)
+            The query samples.
+        n_neighbors : int, default=1
+            Number of neighbors to return.
+
+        Returns
+        -------
+        dist : array, shape (n_queries, n_neighbors)
+            Euclidean distances to the neighbors, `np.inf` if less than
+            `n_neighbors` candidates were found.
+        ind : array, shape (n_queries, n_neighbors)
+            Indices of the neighbors in the fitted data, -1 if less than
+            `n_neighbors` candidates were found.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        n_queries = X.shape[0]
+        dist = np.full((n_queries, n_neighbors), np.inf)
+        ind = np.full((n_queries, n_neighbors), -1, dtype=np.intp)
+        for tree in self.trees_:
+            leaves = tree[3]
+            leaf_of = self._query_leaves(tree, X)
+            order = np.argsort(leaf_of, kind="stable")
+            bounds = np.flatnonzero(np.diff(leaf_of[order])) + 1
+            for queries in np.split(order, bounds):
+                if len(queries) == 0:
+                    continue
+                candidates = leaves[leaf_of[queries[0]]]
+                candidates_dist = np.sqrt(
+                    np.maximum(
+                        _squared_distances(X[queries], self._fit_X[candidates]), 0
+                    )
+                )
+                dist[queries], ind[queries] = _merge_neighbors(
+                    dist[queries],
+                    ind[queries],
+                    candidates_dist,
+                    np.broadcast_to(candidates, candidates_dist.shape),
+                    n_neighbors,
+                )
+        return dist, ind
+
+
+def _squared_distances(X, Y):
+    return np.sum(X**2, axis=1)[:, None] - 2 * X @ Y.T + np.sum(Y**2, axis=1)[None, :]
+
+
+def _merge_neighbors(dist, ind, new_dist, new_ind, n_neighbors):
+    """Keep the `n_neighbors` closest distinct neighbors of each row."""
+    all_dist = np.concatenate([dist, new_dist], axis=1)
+    all_ind = np.concatenate([ind, new_ind], axis=1)
+    # the same sample can be found in several trees
+    order = np.argsort(all_ind, axis=1, kind="stable")
+    sorted_ind = np.take_along_axis(all_ind, order, axis=1)
+    duplicated = np.zeros_like(sorted_ind, dtype=bool)
+    duplicated[:, 1:] = (sorted_ind[:, 1:] == sorted_ind[:, :-1]) & (
+        sorted_ind[:, 1:] >= 0
+    )
+    sorted_dist = np.take_along_axis(all_dist, order, axis=1)
+    sorted_dist[duplicated] = np.inf
+    sorted_ind[duplicated] = -1
+    best = np.argsort(sorted_dist, axis=1, kind="stable")[:, :n_neighbors]
+    return (
+        np.take_along_axis(sorted_dist, best, axis=1),
+        np.take_along_axis(sorted_ind, best, axis=1),
+    )
@@ -18,6 +18,7 @@ from sklearn.utils.metadata_routing import (
     get_routing_for_object,
 )
 from sklearn.utils.metaestimators import available_if
+from sklearn.utils.parallel import Parallel, delayed
 from sklearn.utils.validation import check_is_fitted
 
 from skada._utils import (
@@ -26,7 +27,13 @@ from skada._utils import (
     _remove_masked,
     _route_params
 )
-from skada.utils import check_X_domain, check_X_y_domain, extract_source_indices
+from skada.utils import (
+    DomainIndex,
+    _as_domain_index,
+    check_X_domain,
+    check_X_y_domain,
+    extract_source_indices,
+)
 
 
 def _estimator_has(attr, base_attr_name='base_estimator'):
@@ -208,6 +215,7 @@ class BaseSelector(BaseEstimator, _DAMetadataRequesterMixin):
         self.base_estimator.set_params(**kwargs)
         self._is_final = False
         self._is_transformer = hasattr(base_estimator, 'transform')
+        self._warm_start = False
 
     def get_metadata_routing(self):
         return (
@@ -414,7 +422,12 @@ class Shared(BaseSelector):
         routing_request = getattr(routing, routing_method)
         routed_params = self._prepare_routing(routing_request, X_container, params)
         X, y, routed_params = self._remove_masked(X, y, routed_params)
-        estimator = clone(self.base_estimator)
+        if self._warm_start and hasattr(self, 'base_estimator_'):
+            # continue the training of the fitted estimator, which has its
+            # own warm_start parameters set (see CircularValidation)
+            estimator = self.base_estimator_
+        else:
+            estimator = clone(self.base_estimator)
         output = getattr(estimator, routing_method)(X, y, **routed_params)
         self.base_estimator_ = estimator
         self.routing_ = routing
@@ -433,7 +446,56 @@ class Shared(BaseSelector):
         return output
 
 
+def _call_on_domain(
+    estimator, method_name, X, y, params, idx, return_estimator=False
+):
+    # X and the parameters are sliced in the worker so that joblib shares
+    # the full arrays (memory mapped with processes) instead of pickling
+    # a copy of each domain
+    method = getattr(estimator, method_name)
+    X_domain = X[idx]
+    domain_params = {k: v[idx] for k, v in params.items()}
+    if y is None:
+        output = method(X_domain, **domain_params)
+    else:
+        output = method(X_domain, y[idx], **domain_params)
+    # the fitted estimator is only sent back from the workers when fitting
+    if return_estimator:
+        return estimator, output
+    return output
+
+
 class PerDomain(BaseSelector):
+    """Fits a separate copy of the base estimator for each domain.
+
+    Parameters
+    ----------
+    base_estimator : BaseEstimator
+        The estimator cloned and fitted on each domain.
+    domain_n_jobs : int, default=None
+        Number of jobs used to fit (and call) the estimators of the different
+        domains in parallel. ``None`` means 1 unless in a
+        :obj:`joblib.parallel_backend` context. The outputs are merged in the
+        order of the samples whatever the number of jobs. The parameters of
+        the base estimator, possibly including `n_jobs`, are exposed on the
+        selector, hence the prefix.
+    **kwargs : dict
+        Parameters of the base estimator.
+    """
+
+    def __init__(self, base_estimator: BaseEstimator, domain_n_jobs=None, **kwargs):
+        super().__init__(base_estimator, **kwargs)
+        self.domain_n_jobs = domain_n_jobs
+
+    def get_params(self, deep=True):
+        params = super().get_params(deep=deep)
+        params['domain_n_jobs'] = self.domain_n_jobs
+        return params
+
+    def set_params(self, base_estimator=None, **kwargs):
+        if 'domain_n_jobs' in kwargs:
+            self.domain_n_jobs = kwargs.pop('domain_n_jobs')
+        return super().set_params(base_estimator=base_estimator, **kwargs)
 
     def get_estimator(self, domain_label: int) -> BaseEstimator:
         """Provides access to the fitted estimator based on the domain label."""
@@ -452,15 +514,26 @@ class PerDomain(BaseSelector):
         routing_request = getattr(routing, method_name)
         routed_params = self._prepare_routing(routing_request, X_container, params)
         X, y, routed_params = self._remove_masked(X, y, routed_params)
+        domain_index = DomainIndex(sample_domain)
+        domain_labels = domain_index.domains
+        domain_indices = [domain_index.indices[label] for label in domain_labels]
+        results = Parallel(n_jobs=self.domain_n_jobs)(
+            delayed(_call_on_domain)(
+                clone(self.base_estimator),
+                method_name,
+                X,
+                y,
+                routed_params,
+                idx,
+                return_estimator=True,
+            )
+            for idx in domain_indices
+        )
         estimators, outputs = {}, {}
-        for domain_label in np.unique(sample_domain):
-            idx, = np.where(sample_domain == domain_label)
-            estimator = clone(self.base_estimator)
-            outputs[domain_label] = (idx, getattr(estimator, method_name)(
-                X[idx],
-                y[idx] if y is not None else None,
-                **{k: v[idx] for k, v in routed_params.items()}
-            ))
+        for domain_label, idx, (estimator, output) in zip(
+            domain_labels, domain_indices, results
+        ):
+            outputs[domain_label] = (idx, output)
             estimators[domain_label] = estimator
         self.estimators_ = estimators
         self.routing_ = routing
@@ -473,7 +546,7 @@ class PerDomain(BaseSelector):
             domain_outputs = self._fit('fit_transform', X_container, y=y, **params)
             output = _merge_domain_outputs(len(X_container), domain_outputs, allow_containers=True)
         else:
-            self._fit(X_container, y, **params)
+            self._fit('fit', X_container, y, **params)
             X, y, method_params = X_container.merge_out(y, **params)
             transform_params = _route_params(self.routing_.transform, method_params, self)
             # the output of the transform call is already merged into a single ndarray
@@ -485,27 +558,27 @@ class PerDomain(BaseSelector):
         request = getattr(self.routing_, method_name)
         routed_params = self._prepare_routing(request, {}, params)
         # xxx(okachaiev): use check_*_domain to derive default domain labels
-        sample_domain = params['sample_domain']
-        domain_outputs = {}
+        domain_index = DomainIndex(params['sample_domain'])
+        domain_labels = domain_index.domains
         # test if default target domain and unique target during fit and replace label
-        for domain_label in np.unique(sample_domain):
+        for domain_label in domain_labels:
             # xxx(okachaiev): fail if unknown domain is given
-            try:
-                method = getattr(self.estimators_[domain_label], method_name)
-            except KeyError:
+            if domain_label not in self.estimators_:
                 raise ValueError(
                     f"Domain label {domain_label} is not present in the "
                     "fitted estimators."
                 )
-            idx, = np.where(sample_domain == domain_label)
-            X_domain = X[idx]
-            y_domain = y[idx] if y is not None else None
-            domain_params = {k: v[idx] for k, v in routed_params.items()}
-            if y is None:
-                domain_output = method(X_domain, **domain_params)
-            else:
-                domain_output = method(X_domain, y_domain, **domain_params)
-            domain_outputs[domain_label] = (idx, domain_output)
+        domain_indices = [domain_index.indices[label] for label in domain_labels]
+        results = Parallel(n_jobs=self.domain_n_jobs)(
+            delayed(_call_on_domain)(
+                self.estimators_[domain_label], method_name, X, y, routed_params, idx
+            )
+            for domain_label, idx in zip(domain_labels, domain_indices)
+        )
+        domain_outputs = {
+            domain_label: (idx, output)
+            for domain_label, idx, output in zip(domain_labels, domain_indices, results)
+        }
         return _merge_domain_outputs(X.shape[0], domain_outputs)
 
 
@@ -656,12 +729,16 @@ class SelectSourceTarget(BaseSelector):
         
     def _fit(self, method_name, X_container, y=None, **params):
         X, y, params = X_container.merge_out(y, **params)
+        # the domain labels are scanned once for the checks and the masks
+        domain_index = _as_domain_index(params.get('sample_domain'))
         if y is not None:
-            X, y, sample_domain = check_X_y_domain(X, y, sample_domain=params.get('sample_domain'))
+            X, y, sample_domain = check_X_y_domain(X, y, sample_domain=domain_index)
         else:
-            X, sample_domain = check_X_domain(X, sample_domain=params.get('sample_domain'))
+            X, sample_domain = check_X_domain(X, sample_domain=domain_index)
         params['sample_domain'] = sample_domain
-        source_masks = extract_source_indices(sample_domain)
+        source_masks = extract_source_indices(
+            sample_domain if domain_index is None else domain_index
+        )
         estimators, outputs = {}, {}
         target_estimator = self.target_estimator if self.target_estimator is not None else self.source_estimator
         for domain_type, base_estimator, domain_masks in [
@@ -702,12 +779,16 @@ class SelectSourceTarget(BaseSelector):
 
     def _route_to_estimator(self, method_name, X, y=None, **params):
         check_is_fitted(self)
+        # the domain labels are scanned once for the checks and the masks
+        domain_index = _as_domain_index(params.get('sample_domain'))
         if y is not None:
-            X, y, sample_domain = check_X_y_domain(X, y, sample_domain=params.get('sample_domain'))
+            X, y, sample_domain = check_X_y_domain(X, y, sample_domain=domain_index)
         else:
-            X, sample_domain = check_X_domain(X, sample_domain=params.get('sample_domain'))
+            X, sample_domain = check_X_domain(X, sample_domain=domain_index)
         params['sample_domain'] = sample_domain
-        source_masks = extract_source_indices(sample_domain)
+        source_masks = extract_source_indices(
+            sample_domain if domain_index is None else domain_index
+        )
         outputs = {}
         for domain_label, domain_masks in [('source', source_masks), ('target', ~source_masks)]:
             domain_estimator = self.estimators_[domain_label]
@@ -227,6 +227,13 @@ class CDANModule(DomainAwareModule):
         Maximum size of the input for the domain classifier.
         4096 is the largest number of units in typical deep network
         according to [1]_.
+    random_state : int, Generator instance or None, default=42
+        Determines random number generation for the random multilinear
+        map, which is created at the first forward pass and kept for the
+        rest of the training.
+    fused : bool, default=False
+        If True, the module is run once on the whole batch during the
+        training instead of separately on the source and target samples.
 
     References
     ----------
@@ -241,13 +248,58 @@ class CDANModule(DomainAwareModule):
         domain_classifier,
         max_features=4096,
         random_state=42,
+        fused=False,
     ):
-        super().__init__(base_module, layer_name, domain_classifier)
+        super().__init__(base_module, layer_name, domain_classifier, fused=fused)
         self.max_features = max_features
         self.random_state = random_state
+        self.random_layer_ = None
+
+    def get_params(self, deep=True):
+        params = super().get_params(deep=deep)
+        params["max_features"] = self.max_features
+        params["random_state"] = self.random_state
+        return params
+
+    def _get_random_layer(self, n_features, n_classes, device):
+        """Random multilinear map, or None if the full map is small enough."""
+        if n_features * n_classes <= self.max_features:
+            return None
+        input_dims = [n_features, n_classes]
+        if self.random_layer_ is None or self.random_layer_.input_dims != input_dims:
+            # registered as a submodule so that its matrices follow the
+            # device of the module
+            self.random_layer_ = _RandomLayer(
+                self.random_state,
+                input_dims=input_dims,
+                output_dim=self.max_features,
+            ).to(device)
+        return self.random_layer_
+
+    def _multilinear_map(self, y_pred, features):
+        """Input of the domain classifier."""
+        n_classes = y_pred.shape[1]
+        n_features = features.shape[1]
+        random_layer = self._get_random_layer(n_features, n_classes, features.device)
+        if random_layer is None:
+            multilinear_map = torch.bmm(y_pred.unsqueeze(2), features.unsqueeze(1))
+            return multilinear_map.view(-1, n_features * n_classes)
+        return random_layer.forward([features, y_pred])
 
     def forward(self, X, sample_domain=None, is_fit=False, return_features=False):
-        if is_fit:
+        if is_fit and self.fused:
+            y_pred = self.base_module_(X)
+            features = self.intermediate_layers[self.layer_name]
+            domain_pred = self.domain_classifier_(
+                self._multilinear_map(y_pred, features)
+            )
+            return (
+                y_pred,
+                domain_pred,
+                features,
+                sample_domain,
+            )
+        elif is_fit:
             source_idx = sample_domain >= 0
 
             X_t = X[~source_idx]
@@ -258,34 +310,9 @@ class CDANModule(DomainAwareModule):
             y_pred_t = self.base_module_(X_t)
             features_t = self.intermediate_layers[self.layer_name]
 
-            n_classes = y_pred_s.shape[1]
-            n_features = features_s.shape[1]
-            if n_features * n_classes > self.max_features:
-                random_layer = _RandomLayer(
-                    self.random_state,
-                    input_dims=[n_features, n_classes],
-                    output_dim=self.max_features,
-                )
-            else:
-                random_layer = None
-
             # Compute the input for the domain classifier
-            if random_layer is None:
-                multilinear_map = torch.bmm(
-                    y_pred_s.unsqueeze(2), features_s.unsqueeze(1)
-                )
-                multilinear_map_target = torch.bmm(
-                    y_pred_t.unsqueeze(2), features_t.unsqueeze(1)
-                )
-
-                multilinear_map = multilinear_map.view(-1, n_features * n_classes)
-                multilinear_map_target = multilinear_map_target.view(
-                    -1, n_features * n_classes
-                )
-
-            else:
-                multilinear_map = random_layer.forward([features_s, y_pred_s])
-                multilinear_map_target = random_layer.forward([features_t, y_pred_t])
+            multilinear_map = self._multilinear_map(y_pred_s, features_s)
+            multilinear_map_target = self._multilinear_map(y_pred_t, features_t)
 
             domain_pred_s = self.domain_classifier_(multilinear_map)
             domain_pred_t = self.domain_classifier_(multilinear_map_target)
@@ -418,17 +445,27 @@ class _RandomLayer(nn.Module):
     def __init__(self, random_state, input_dims, output_dim=4096):
         super().__init__()
         gen = check_generator(random_state)
+        self.input_dims = list(input_dims)
         self.output_dim = output_dim
-        self.random_matrix = [
-            torch.randn(size=(input_dims[i], output_dim), generator=gen)
-            for i in range(len(input_dims))
+        # non persistent buffers: they are moved with the module but are not
+        # part of its state dict, they are re-drawn from the random state
+        for i, input_dim in enumerate(self.input_dims):
+            self.register_buffer(
+                f"random_matrix_{i}",
+                torch.randn(size=(input_dim, output_dim), generator=gen),
+                persistent=False,
+            )
+
+    @property
+    def random_matrix(self):
+        return [
+            getattr(self, f"random_matrix_{i}") for i in range(len(self.input_dims))
         ]
 
     def forward(self, input_list):
-        device = input_list[0].device
         return_list = [
-            torch.mm(input_list[i], self.random_matrix[i].to(device))
-            for i in range(len(input_list))
+            torch.mm(input_list[i], random_matrix)
+            for i, random_matrix in enumerate(self.random_matrix)
         ]
         return_tensor = return_list[0] / math.pow(
             float(self.output_dim), 1.0 / len(input_list)
@@ -13,7 +13,7 @@ from skada.deep.base import (
     DomainBalancedDataLoader,
 )
 
-from .callbacks import ComputeSourceCentroids
+from .callbacks import ComputeSourceCentroids, IncrementalSourceCentroids
 from .losses import cdd_loss, dan_loss, deepcoral_loss
 
 
@@ -255,6 +255,7 @@ def CAN(
     class_threshold=3,
     sigmas=None,
     base_criterion=None,
+    incremental_centroids=False,
     **kwargs,
 ):
     """Contrastive Adaptation Network (CAN) domain adaptation method.
@@ -281,6 +282,11 @@ def CAN(
     base_criterion : torch criterion (class)
         The base criterion used to compute the loss with source
         labels. If None, the default is `torch.nn.CrossEntropyLoss`.
+    incremental_centroids : bool, default=False
+        If True, the source centroids and the target clustering are updated
+        from the features of the training batches with
+        :class:`~skada.deep.callbacks.IncrementalSourceCentroids`, instead of
+        being recomputed on the whole training set at each epoch.
 
     References
     ----------
@@ -292,6 +298,11 @@ def CAN(
     if base_criterion is None:
         base_criterion = torch.nn.CrossEntropyLoss()
 
+    if incremental_centroids:
+        centroids_callback = IncrementalSourceCentroids()
+    else:
+        centroids_callback = ComputeSourceCentroids()
+
     net = DomainAwareNet(
         module=DomainAwareModule,
         module__base_module=module,
@@ -305,7 +316,7 @@ def CAN(
             class_threshold=class_threshold,
             sigmas=sigmas,
         ),
-        callbacks=[ComputeSourceCentroids()],
+        callbacks=[centroids_callback],
         **kwargs,
     )
     return net
@@ -14,7 +14,7 @@ from sklearn.base import _clone_parametrized
 from sklearn.metrics import accuracy_score
 from skorch import NeuralNetClassifier
 
-from .utils import _register_forwards_hook
+from .utils import _IntermediateLayers, _register_forwards_hook
 
 from skada.base import _DAMetadataRequesterMixin
 from skada.utils import check_X_domain
@@ -166,6 +166,91 @@ class BaseDALoss(torch.nn.Module):
         pass
 
 
+class LazyDomainDataset(Dataset):
+    """Dataset adding the domain of the samples to a lazy dataset
+
+    The samples of the wrapped dataset are only loaded when they are
+    accessed, while the domains and the weights of the samples are kept
+    in arrays. The samples are returned as
+    ``({"X": X, "sample_domain": sample_domain}, y)``, as expected by
+    :class:`DomainAwareNet`.
+
+    Parameters
+    ----------
+    dataset : torch dataset
+        The dataset to wrap. Its samples should be ``(X, y)`` tuples.
+    sample_domain : array-like of shape (n_samples,)
+        The domain of each sample.
+    sample_weight : array-like of shape (n_samples,), default=None
+        The weight of each sample.
+    """
+
+    def __init__(self, dataset, sample_domain, sample_weight=None):
+        self.dataset = dataset
+        self.sample_domain = np.asarray(sample_domain).reshape(-1)
+        if len(self.sample_domain) != len(dataset):
+            raise ValueError(
+                f"sample_domain has {len(self.sample_domain)} elements but "
+                f"the dataset has {len(dataset)} samples."
+            )
+        if sample_weight is not None:
+            sample_weight = np.asarray(sample_weight, dtype=np.float32).reshape(-1)
+            if len(sample_weight) != len(dataset):
+                raise ValueError(
+                    f"sample_weight has {len(sample_weight)} elements but "
+                    f"the dataset has {len(dataset)} samples."
+                )
+        self.sample_weight = sample_weight
+
+    def __len__(self):
+        return len(self.sample_domain)
+
+    def __getitem__(self, idx):
+        X, y = self.dataset[idx]
+        X = {"X": X, "sample_domain": self.sample_domain[idx]}
+        if self.sample_weight is not None:
+            X["sample_weight"] = self.sample_weight[idx]
+        return X, y
+
+
+def _get_array_data(dataset):
+    """Get the dict of arrays backing a dataset, or None if it is lazy."""
+    X = getattr(dataset, "X", None)
+    if isinstance(X, Mapping) and "X" in X and "sample_domain" in X:
+        return X
+    return None
+
+
+def _get_sample_domain(dataset):
+    """Get the sample_domain of all the samples of a dataset.
+
+    The sample_domain is read directly from the data of the dataset when
+    it is available, to avoid loading every sample.
+    """
+    if isinstance(dataset, torch.utils.data.Subset):
+        return _get_sample_domain(dataset.dataset)[np.asarray(dataset.indices)]
+    if isinstance(dataset, LazyDomainDataset):
+        return dataset.sample_domain
+    X = getattr(dataset, "X", None)
+    if isinstance(X, Mapping) and "sample_domain" in X:
+        sample_domain = X["sample_domain"]
+        if torch.is_tensor(sample_domain):
+            sample_domain = to_numpy(sample_domain)
+        return np.asarray(sample_domain).reshape(-1)
+    return np.array(
+        [int(sample[0]["sample_domain"]) for sample in dataset], dtype=np.int64
+    )
+
+
+def _random_indices(indices, num_samples):
+    """Draw num_samples indices by concatenating random permutations."""
+    n_indices = len(indices)
+    if num_samples == 0 or n_indices == 0:
+        return indices[:0]
+    n_permutations = -(-num_samples // n_indices)
+    order = torch.cat([torch.randperm(n_indices) for _ in range(n_permutations)])
+    return indices[order[:num_samples]]
+
 
 class DomainBalancedSampler(Sampler):
     """Domain balanced sampler
@@ -184,12 +269,9 @@ class DomainBalancedSampler(Sampler):
 
     def __init__(self, dataset, batch_size, max_samples="max"):
         self.dataset = dataset
-        self.positive_indices = [
-            idx for idx, sample in enumerate(dataset) if sample[0]["sample_domain"] >= 0
-        ]
-        self.negative_indices = [
-            idx for idx, sample in enumerate(dataset) if sample[0]["sample_domain"] < 0
-        ]
+        sample_domain = _get_sample_domain(dataset)
+        self.positive_indices = torch.from_numpy(np.flatnonzero(sample_domain >= 0))
+        self.negative_indices = torch.from_numpy(np.flatnonzero(sample_domain < 0))
         self.num_samples_source = (
             len(self.positive_indices) - len(self.positive_indices) % batch_size
         )
@@ -205,27 +287,13 @@ class DomainBalancedSampler(Sampler):
         elif max_samples == "target":
             self.num_samples = self.num_samples_target
 
-
     def __iter__(self):
-        positive_sampler = torch.utils.data.sampler.RandomSampler(self.positive_indices)
-        negative_sampler = torch.utils.data.sampler.RandomSampler(self.negative_indices)
-
-        positive_iter = iter(positive_sampler)
-        negative_iter = iter(negative_sampler)
-
-        for _ in range(self.num_samples):
-            try:
-                pos_idx = self.positive_indices[next(positive_iter)]
-            except StopIteration:
-                positive_iter = iter(positive_sampler)
-                pos_idx = self.positive_indices[next(positive_iter)]
-            try:
-                neg_idx = self.negative_indices[next(negative_iter)]
-            except StopIteration:
-                negative_iter = iter(negative_sampler)
-                neg_idx = self.negative_indices[next(negative_iter)]
-            yield pos_idx
-            yield neg_idx
+        # source and target indices are reshuffled each time they are
+        # exhausted, and interleaved in the batches
+        positive_indices = _random_indices(self.positive_indices, self.num_samples)
+        negative_indices = _random_indices(self.negative_indices, self.num_samples)
+        indices = torch.stack([positive_indices, negative_indices], dim=1)
+        return iter(indices.view(-1).tolist())
 
     def __len__(self):
         return 2 * self.num_samples
@@ -293,28 +361,17 @@ class DomainOnlySampler(Sampler):
 
     def __init__(self, dataset, batch_size, domain_used="source"):
         self.dataset = dataset
+        if domain_used not in ("source", "target"):
+            raise ValueError(f"Unknown domain_used: {domain_used}")
+        sample_domain = _get_sample_domain(dataset)
         if domain_used == "source":
-            self.indices = [
-                idx for idx, sample in enumerate(dataset) if sample[0]["sample_domain"] >= 0
-            ]
-        elif domain_used == "target":
-            self.indices = [
-                idx for idx, sample in enumerate(dataset) if sample[0]["sample_domain"] < 0
-            ]
+            self.indices = torch.from_numpy(np.flatnonzero(sample_domain >= 0))
         else:
-            raise ValueError(f"Unknown domain_used: {domain_used}")
-        self.num_samples = (
-            len(self.indices) - len(self.indices) % batch_size
-        )
+            self.indices = torch.from_numpy(np.flatnonzero(sample_domain < 0))
+        self.num_samples = len(self.indices) - len(self.indices) % batch_size
 
     def __iter__(self):
-        sampler = torch.utils.data.sampler.RandomSampler(self.indices)
-
-        iterator = iter(sampler)
-
-        for _ in range(self.num_samples):
-            idx = self.indices[next(iterator)]
-            yield idx
+        return iter(_random_indices(self.indices, self.num_samples).tolist())
 
     def __len__(self):
         return self.num_samples
@@ -384,14 +441,20 @@ class DomainAwareModule(torch.nn.Module):
     domain_classifier : torch module, default=None
         A PyTorch :class:`~torch.nn.Module` used to classify the
         domain. Could be None.
+    fused : bool, default=False
+        If True, the module is run once on the whole batch during the
+        training. If False, it is run separately on the source and the
+        target samples, which keeps per-domain statistics in layers such
+        as BatchNorm.
     """
 
-    def __init__(self, base_module, layer_name, domain_classifier=None):
+    def __init__(self, base_module, layer_name, domain_classifier=None, fused=False):
         super(DomainAwareModule, self).__init__()
         self.base_module_ = base_module
         self.domain_classifier_ = domain_classifier
         self.layer_name = layer_name
-        self.intermediate_layers = {}
+        self.fused = fused
+        self.intermediate_layers = _IntermediateLayers()
         self._setup_hooks()
 
     def _setup_hooks(self):
@@ -404,6 +467,7 @@ class DomainAwareModule(torch.nn.Module):
             "base_module": self.base_module_,
             "layer_name": self.layer_name,
             "domain_classifier": self.domain_classifier_,
+            "fused": self.fused,
         }
 
     def __sklearn_clone__(self) -> torch.nn.Module:
@@ -419,7 +483,9 @@ class DomainAwareModule(torch.nn.Module):
         is_fit=False,
         return_features=False,
     ):
-        if is_fit:
+        if is_fit and self.fused:
+            return self._fused_forward(X, sample_domain, sample_weight)
+        elif is_fit:
             source_idx = sample_domain >= 0
 
             X_s = X[source_idx]
@@ -494,6 +560,40 @@ class DomainAwareModule(torch.nn.Module):
             else:
                 return self.base_module_(X, sample_weight=sample_weight)
 
+    def _fused_forward(self, X, sample_domain, sample_weight=None):
+        """Forward of the source and target samples in a single pass."""
+        if sample_weight is not None:
+            y_pred = self.base_module_(X, sample_weight=sample_weight)
+        else:
+            y_pred = self.base_module_(X)
+
+        if self.layer_name is not None:
+            features = self.intermediate_layers[self.layer_name]
+        else:
+            features = None
+
+        if self.domain_classifier_ is not None:
+            domain_pred = self.domain_classifier_(features)
+        else:
+            domain_pred = None
+
+        return (
+            y_pred,
+            domain_pred,
+            features,
+            sample_domain,
+        )
+
+
+def _check_lazy_domain(dataset, allow_source=False):
+    """Check the domains of a LazyDomainDataset before a prediction."""
+    n_sources = np.sum(dataset.sample_domain >= 0)
+    if not allow_source and n_sources > 0:
+        raise ValueError(
+            f"Number of sources provided is {n_sources} "
+            "and 'allow_source' is set to False"
+        )
+
 
 class DomainAwareNet(NeuralNetClassifier, _DAMetadataRequesterMixin):
     __metadata_request__fit = {"sample_weight": True}
@@ -628,7 +728,10 @@ class DomainAwareNet(NeuralNetClassifier, _DAMetadataRequesterMixin):
             The predicted class probabilities.
         """
         X, _ = self._prepare_input(X, sample_domain, sample_weight)
-        X['X'], X['sample_domain'] = check_X_domain(X['X'], sample_domain=X['sample_domain'], allow_nd=True, allow_source=allow_source)
+        if isinstance(X, LazyDomainDataset):
+            _check_lazy_domain(X, allow_source=allow_source)
+        else:
+            X['X'], X['sample_domain'] = check_X_domain(X['X'], sample_domain=X['sample_domain'], allow_nd=True, allow_source=allow_source)
 
         return super().predict_proba(X, **predict_params)
 
@@ -650,8 +753,9 @@ class DomainAwareNet(NeuralNetClassifier, _DAMetadataRequesterMixin):
             self.initialize()
 
         X, _ = self._prepare_input(X, None)
-        X, sample_domain = X["X"], X["sample_domain"]
-        X = torch.tensor(X) if not torch.is_tensor(X) else X
+        if not isinstance(X, LazyDomainDataset):
+            X = X["X"]
+            X = torch.tensor(X) if not torch.is_tensor(X) else X
 
         features_list = []
         for features in self.feature_iter(X, training=False):
@@ -659,6 +763,55 @@ class DomainAwareNet(NeuralNetClassifier, _DAMetadataRequesterMixin):
             features_list.append(to_numpy(features))
         return np.concatenate(features_list, 0)
 
+    def predict_proba_and_features(
+        self,
+        X: Union[Dict, torch.Tensor, np.ndarray, Dataset],
+        sample_domain: Union[torch.Tensor, np.ndarray] = None,
+        allow_source: bool = False,
+    ):
+        """
+        Predict class probabilities and extract features in a single pass.
+
+        Parameters:
+        -----------
+        X : dict, torch.Tensor, np.ndarray, or torch.utils.data.Dataset
+            The input data.
+        sample_domain : torch.Tensor or np.ndarray, optional
+            The domain of each sample (if not provided in X).
+        allow_source: bool = False,
+            Allow the presence of source domains.
+
+        Returns:
+        --------
+        np.ndarray
+            The predicted class probabilities.
+        np.ndarray
+            The extracted features.
+        """
+        if not self.initialized_:
+            self.initialize()
+
+        X, _ = self._prepare_input(X, sample_domain)
+        if isinstance(X, LazyDomainDataset):
+            _check_lazy_domain(X, allow_source=allow_source)
+        else:
+            X['X'], X['sample_domain'] = check_X_domain(
+                X['X'],
+                sample_domain=X['sample_domain'],
+                allow_nd=True,
+                allow_source=allow_source,
+            )
+
+        nonlin = self._get_predict_nonlinearity()
+        dataset = self.get_dataset(X)
+        y_probas, features_list = [], []
+        for batch in self.get_iterator(dataset, training=False):
+            y_proba, features = self.feature_eval_step(batch, training=False)
+            y_proba = y_proba[0] if isinstance(y_proba, tuple) else y_proba
+            y_probas.append(to_numpy(nonlin(y_proba)))
+            features_list.append(to_numpy(features))
+        return np.concatenate(y_probas, 0), np.concatenate(features_list, 0)
+
     def score(
         self,
         X: Union[Dict, torch.Tensor, np.ndarray],
@@ -692,7 +845,10 @@ class DomainAwareNet(NeuralNetClassifier, _DAMetadataRequesterMixin):
             The mean accuracy score.
         """
         X, _ = self._prepare_input(X, sample_domain, sample_weight)
-        X['X'], X['sample_domain'] = check_X_domain(X['X'], sample_domain=X['sample_domain'], allow_nd=True, allow_source=allow_source)
+        if isinstance(X, LazyDomainDataset):
+            _check_lazy_domain(X, allow_source=allow_source)
+        else:
+            X['X'], X['sample_domain'] = check_X_domain(X['X'], sample_domain=X['sample_domain'], allow_nd=True, allow_source=allow_source)
 
         return accuracy_score(y, self.predict(X, sample_domain, allow_source=allow_source), sample_weight=sample_weight)
 
@@ -801,6 +957,9 @@ class DomainAwareNet(NeuralNetClassifier, _DAMetadataRequesterMixin):
             if "X" not in X or "sample_domain" not in X:
                 raise ValueError("X should contain both 'X' and 'sample_domain' keys.")
             return X, None
+        elif isinstance(X, LazyDomainDataset):
+            # the samples are loaded by batches during the training
+            return X, None
         elif isinstance(X, Dataset):
             return self._process_dataset(X)
         else:
@@ -815,6 +974,11 @@ class DomainAwareNet(NeuralNetClassifier, _DAMetadataRequesterMixin):
         """
         Process a PyTorch Dataset into a dictionary format.
 
+        The arrays of the datasets backed by a dict of arrays, such as
+        :class:`skorch.dataset.Dataset`, are returned without copy. The
+        other datasets are loaded sample by sample, use
+        :class:`LazyDomainDataset` to keep them lazy.
+
         Parameters:
         -----------
         dataset : torch.utils.data.Dataset
@@ -832,6 +996,16 @@ class DomainAwareNet(NeuralNetClassifier, _DAMetadataRequesterMixin):
         ValueError
             If the dataset samples are not in the expected format.
         """
+        data = _get_array_data(dataset)
+        if data is not None:
+            result = {"X": data["X"], "sample_domain": data["sample_domain"]}
+            if data.get("sample_weight") is not None:
+                result["sample_weight"] = data["sample_weight"]
+            y = getattr(dataset, "y", None)
+            if torch.is_tensor(y):
+                y = to_numpy(y)
+            return result, y
+
         X, y, sample_domain, sample_weight = [], [], [], []
         has_y, has_sample_weight = False, False
         for sample in dataset:
@@ -70,4 +70,124 @@ class ComputeSourceCentroids(Callback):
         )
         target_kmeans.fit(features_t)
 
+        self.source_centroids_ = source_centroids
         net.criterion__adapt_criterion.target_kmeans = target_kmeans
+
+
+class IncrementalSourceCentroids(ComputeSourceCentroids):
+    """Callback to update the source centroids from the training batches.
+
+    The centroids of the normalized source features of each class are
+    computed on the whole training set at the first epoch only, as in
+    :class:`ComputeSourceCentroids`. Then the features computed during the
+    training forward passes are collected, and the centroids are updated
+    at the end of each epoch from their running means. The target
+    clustering is updated with a few spherical k-means iterations
+    initialized with the source centroids.
+
+    Parameters
+    ----------
+    momentum : float, default=0
+        Weight of the previous centroids in the update of the centroids.
+        If 0, the centroids are the means of the features of the last epoch.
+    max_iter : int, default=5
+        Number of spherical k-means iterations used to update the target
+        clustering at the end of each epoch.
+    """
+
+    def __init__(self, momentum=0.0, max_iter=5):
+        self.momentum = momentum
+        self.max_iter = max_iter
+
+    def initialize(self):
+        """Reset the centroids before the training."""
+        self.source_centroids_ = None
+        self._reset_features()
+        return self
+
+    def _reset_features(self):
+        self._sum_features_s = None
+        self._count_s = None
+        self._features_t = []
+
+    def on_epoch_begin(self, net, dataset_train=None, **kwargs):
+        """Compute the source centroids on the whole dataset at first epoch.
+
+        Parameters
+        ----------
+        net : NeuralNet
+            The neural network being trained.
+        dataset_train : Dataset, optional
+            The training dataset.
+        **kwargs : dict
+            Additional arguments passed to the callback.
+        """
+        if self.source_centroids_ is None:
+            super().on_epoch_begin(net, dataset_train=dataset_train, **kwargs)
+        self._reset_features()
+
+    def on_batch_end(self, net, batch=None, training=False, y_pred=None, **kwargs):
+        """Collect the features of the training batch.
+
+        Parameters
+        ----------
+        net : NeuralNet
+            The neural network being trained.
+        batch : tuple
+            The batch of data.
+        training : bool
+            Whether the batch is a training batch.
+        y_pred : tuple
+            The outputs of the module, with the features and sample_domain.
+        **kwargs : dict
+            Additional arguments passed to the callback.
+        """
+        if not training or not isinstance(y_pred, tuple):
+            return
+        _, _, features, sample_domain = y_pred
+        features = F.normalize(features.detach(), p=2, dim=1)
+        source_idx = sample_domain >= 0
+        y_s = torch.as_tensor(batch[1], device=features.device)[source_idx]
+        features_s = features[source_idx]
+
+        n_classes = len(self.source_centroids_)
+        mask = y_s < n_classes
+        if self._sum_features_s is None:
+            self._sum_features_s = torch.zeros_like(self.source_centroids_)
+            self._count_s = torch.zeros(n_classes, device=features.device)
+        self._sum_features_s.index_add_(0, y_s[mask], features_s[mask])
+        self._count_s += torch.bincount(y_s[mask], minlength=n_classes)
+        self._features_t.append(features[~source_idx])
+
+    def on_epoch_end(self, net, **kwargs):
+        """Update the source centroids and the target clustering.
+
+        Parameters
+        ----------
+        net : NeuralNet
+            The neural network being trained.
+        **kwargs : dict
+            Additional arguments passed to the callback.
+        """
+        if self._sum_features_s is None or len(self._features_t) == 0:
+            return
+        seen = self._count_s > 0
+        source_centroids = self.source_centroids_.clone()
+        source_centroids[seen] = self.momentum * source_centroids[seen] + (
+            1 - self.momentum
+        ) * self._sum_features_s[seen] / self._count_s[seen].unsqueeze(1)
+        features_t = torch.cat(self._features_t)
+
+        target_kmeans = SphericalKMeans(
+            n_clusters=len(source_centroids),
+            n_init=1,
+            max_iter=self.max_iter,
+            random_state=0,
+            centroids=source_centroids,
+            device=features_t.device,
+        )
+        target_kmeans.fit(features_t)
+
+        self.source_centroids_ = source_centroids
+        net.criterion__adapt_criterion.target_kmeans = target_kmeans
+        self._reset_features()
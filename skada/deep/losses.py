@@ -12,6 +12,7 @@ import ot
 import skorch  # noqa: F401
 import torch  # noqa: F401
 import torch.nn.functional as F
+from torch.autograd import Function
 from torch.nn.functional import mse_loss
 
 from skada.deep.base import BaseDALoss
@@ -128,15 +129,40 @@ def deepjdot_loss(
     return loss
 
 
+class _MultiGaussianKernel(Function):
+    """Sum of gaussian kernels computed from the pairwise distances.
+
+    The kernels are accumulated one sigma at a time, and recomputed in
+    the backward pass, so that the memory does not grow with the number
+    of sigmas.
+    """
+
+    @staticmethod
+    def forward(ctx, dist, sigmas):
+        kernel = torch.zeros_like(dist)
+        for sigma in sigmas:
+            kernel += torch.exp(-dist / sigma)
+        ctx.save_for_backward(dist, sigmas)
+        return kernel
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        dist, sigmas = ctx.saved_tensors
+        grad_dist = torch.zeros_like(dist) if ctx.needs_input_grad[0] else None
+        grad_sigmas = torch.zeros_like(sigmas) if ctx.needs_input_grad[1] else None
+        for i, sigma in enumerate(sigmas):
+            grad_kernel = grad_output * torch.exp(-dist / sigma)
+            if grad_dist is not None:
+                grad_dist -= grad_kernel / sigma
+            if grad_sigmas is not None:
+                grad_sigmas[i] = (grad_kernel * dist).sum() / sigma**2
+        return grad_dist, grad_sigmas
+
+
 def _gaussian_kernel(x, y, sigmas):
     """Computes multi gaussian kernel between each pair of the two vectors."""
-    sigmas = sigmas.view(sigmas.shape[0], 1)
-    beta = 1.0 / sigmas
     dist = torch.cdist(x, y)
-    dist_ = dist.view(1, -1)
-    s = torch.matmul(beta, dist_)
-
-    return torch.sum(torch.exp(-s), 0).view_as(dist)
+    return _MultiGaussianKernel.apply(dist, sigmas.to(dist.dtype))
 
 
 def _maximum_mean_discrepancy(x, y, kernel):
@@ -265,6 +291,9 @@ def cdd_loss(
     # Predict clusters for target samples
     cluster_labels_t = target_kmeans.predict(features_t)
 
+    # The clustering can have classes that are missing in the source batch
+    n_classes = max(n_classes, target_kmeans.cluster_centers_.shape[0])
+
     # Discard ambiguous target samples
     similarities = F.cosine_similarity(
         features_t.unsqueeze(1), target_kmeans.cluster_centers_.unsqueeze(0)
@@ -292,34 +321,29 @@ def cdd_loss(
     else:
         sigmas = torch.tensor(sigmas).to(features_s.device)
 
-    # Compute CDD
-    intraclass = 0
-    interclass = 0
-
-    for c1 in range(n_classes):
-        for c2 in range(c1, n_classes):
-            if valid_classes[c1] and valid_classes[c2]:
-                # Compute e1
-                kernel_ss = _gaussian_kernel(features_s, features_s, sigmas)
-                mask_c1_c1 = (y_s == c1).float()
-                e1 = (kernel_ss * mask_c1_c1).sum() / (mask_c1_c1.sum() ** 2)
-
-                # Compute e2
-                kernel_tt = _gaussian_kernel(features_t, features_t, sigmas)
-                mask_c2_c2 = (cluster_labels_t == c2).float()
-                e2 = (kernel_tt * mask_c2_c2).sum() / (mask_c2_c2.sum() ** 2)
-
-                # Compute e3
-                kernel_st = _gaussian_kernel(features_s, features_t, sigmas)
-                mask_c1 = (y_s == c1).float().unsqueeze(1)
-                mask_c2 = (cluster_labels_t == c2).float().unsqueeze(0)
-                mask_c1_c2 = mask_c1 * mask_c2
-                e3 = (kernel_st * mask_c1_c2).sum() / (mask_c1_c2.sum() ** 2)
-
-                if c1 == c2:
-                    intraclass += e1 + e2 - 2 * e3
-                else:
-                    interclass += e1 + e2 - 2 * e3
+    # Compute CDD, the kernels are only computed once and the mean
+    # kernel values between the classes are obtained with one-hot matrices
+    kernel_ss = _gaussian_kernel(features_s, features_s, sigmas)
+    kernel_tt = _gaussian_kernel(features_t, features_t, sigmas)
+    kernel_st = _gaussian_kernel(features_s, features_t, sigmas)
+
+    classes = torch.arange(n_classes, device=features_s.device)
+    one_hot_s = (y_s.unsqueeze(1) == classes).to(kernel_ss.dtype)
+    one_hot_t = (cluster_labels_t.unsqueeze(1) == classes).to(kernel_tt.dtype)
+    count_s = one_hot_s.sum(dim=0)
+    count_t = one_hot_t.sum(dim=0)
+
+    e1 = ((kernel_ss @ one_hot_s) * one_hot_s).sum(dim=0) / count_s.clamp(min=1) ** 2
+    e2 = ((kernel_tt @ one_hot_t) * one_hot_t).sum(dim=0) / count_t.clamp(min=1) ** 2
+    count_st = torch.outer(count_s, count_t)
+    e3 = (one_hot_s.T @ kernel_st @ one_hot_t) / count_st.clamp(min=1)
+    discrepancy = e1.unsqueeze(1) + e2.unsqueeze(0) - 2 * e3
+
+    valid_classes = valid_classes & (count_s > 0)
+    valid_pairs = valid_classes.unsqueeze(1) & valid_classes.unsqueeze(0)
+    same_class = torch.eye(n_classes, dtype=torch.bool, device=features_s.device)
+    intraclass = discrepancy[valid_pairs & same_class].sum()
+    interclass = discrepancy[valid_pairs & ~same_class].sum()
 
     cdd = (intraclass / len(valid_classes)) - (
         interclass / (len(valid_classes) ** 2 - len(valid_classes))
@@ -114,6 +114,68 @@ def test_cdan(domain_classifier, domain_criterion, num_feature, max_feature, n_c
     assert history[0]["train_loss"] > history[-1]["train_loss"]
 
 
+def test_cdan_random_layer():
+    n_samples = 20
+    dataset = make_shifted_datasets(
+        n_samples_source=n_samples,
+        n_samples_target=n_samples,
+        shift="concept_drift",
+        noise=0.1,
+        random_state=42,
+        return_dataset=True,
+    )
+    method = CDAN(
+        ToyModule2D(),
+        reg=1,
+        num_features=10,
+        n_classes=2,
+        max_features=10,
+        layer_name="dropout",
+        batch_size=10,
+        max_epochs=2,
+        train_split=None,
+    )
+    X, y, sample_domain = dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    method.fit(X.astype(np.float32), y, sample_domain)
+
+    # the random layer is created once and kept during the training
+    random_layer = method.module_.random_layer_
+    assert random_layer is not None
+    random_matrix = random_layer.random_matrix
+    assert [m.shape for m in random_matrix] == [(10, 10), (2, 10)]
+    method.module_(
+        torch.tensor(X.astype(np.float32)),
+        sample_domain=torch.tensor(sample_domain),
+        is_fit=True,
+    )
+    assert method.module_.random_layer_ is random_layer
+    assert random_layer.random_matrix[0] is random_matrix[0]
+
+    # its buffers follow the module but are not saved with the parameters
+    assert not any("random_matrix" in key for key in method.module_.state_dict())
+
+    # the fused forward uses the same random layer on the whole batch
+    module = method.module_
+    module.eval()
+    params = module.get_params()
+    assert params["max_features"] == 10
+    with torch.no_grad():
+        split_output = module(
+            torch.tensor(X.astype(np.float32)),
+            sample_domain=torch.tensor(sample_domain),
+            is_fit=True,
+        )
+        module.fused = True
+        fused_output = module(
+            torch.tensor(X.astype(np.float32)),
+            sample_domain=torch.tensor(sample_domain),
+            is_fit=True,
+        )
+    assert module.random_layer_ is random_layer
+    for split_tensor, fused_tensor in zip(split_output, fused_output):
+        assert torch.allclose(split_tensor, fused_tensor, atol=1e-6)
+
+
 def test_missing_num_features():
     with pytest.raises(ValueError):
         DANN(
@@ -21,9 +21,10 @@ from skada.deep.base import (
     DomainBalancedSampler,
     DomainOnlyDataLoader,
     DomainOnlySampler,
+    LazyDomainDataset,
 )
 from skada.deep.losses import TestLoss
-from skada.deep.modules import ToyModule2D
+from skada.deep.modules import DomainClassifier, ToyModule2D
 
 
 def test_domainawaremodule_features_differ_between_domains():
@@ -88,6 +89,52 @@ def test_domainawaremodule_features_differ_between_domains():
     ), "Features of source and target domains are too similar."
 
 
+def test_domainawaremodule_fused():
+    n_samples = 20
+    dataset = make_shifted_datasets(
+        n_samples_source=n_samples,
+        n_samples_target=n_samples,
+        shift="concept_drift",
+        noise=0.1,
+        random_state=42,
+        return_dataset=True,
+    )
+    X, y, sample_domain = dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    X = torch.tensor(X.astype(np.float32))
+    sample_domain = torch.tensor(sample_domain)
+
+    module = DomainAwareModule(
+        ToyModule2D(), "dropout", DomainClassifier(num_features=10)
+    )
+    module.eval()
+    fused_module = module.__sklearn_clone__()
+    fused_module.fused = True
+    fused_module.load_state_dict(module.state_dict())
+    fused_module.eval()
+    assert fused_module.get_params()["fused"]
+
+    # in eval mode both forwards give the same outputs
+    with torch.no_grad():
+        split_output = module(X, sample_domain=sample_domain, is_fit=True)
+        fused_output = fused_module(X, sample_domain=sample_domain, is_fit=True)
+    for split_tensor, fused_tensor in zip(split_output, fused_output):
+        assert torch.allclose(split_tensor, fused_tensor, atol=1e-6)
+
+    method = DomainAwareNet(
+        DomainAwareModule,
+        module__base_module=ToyModule2D(),
+        module__layer_name="dropout",
+        module__fused=True,
+        iterator_train=DomainBalancedDataLoader,
+        criterion=DomainAwareCriterion(torch.nn.CrossEntropyLoss(), TestLoss()),
+        batch_size=10,
+        max_epochs=2,
+        train_split=None,
+    )
+    method.fit(X.numpy(), y, sample_domain=sample_domain.numpy())
+    assert method.module_.fused
+
+
 def test_domainawaretraining():
     module = ToyModule2D()
     module.eval()
@@ -250,6 +297,64 @@ def test_domainawaretraining():
         )
 
 
+def test_process_dataset():
+    n_samples = 20
+    dataset = make_shifted_datasets(
+        n_samples_source=n_samples,
+        n_samples_target=n_samples,
+        shift="concept_drift",
+        noise=0.1,
+        random_state=42,
+        return_dataset=True,
+    )
+    X, y, sample_domain = dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    X = X.astype(np.float32)
+    X_test, y_test, sample_domain_test = dataset.pack_test(as_targets=["t"])
+    X_test = X_test.astype(np.float32)
+
+    method = DomainAwareNet(
+        DomainAwareModule(ToyModule2D(), "dropout"),
+        iterator_train=DomainBalancedDataLoader,
+        criterion=DomainAwareCriterion(torch.nn.CrossEntropyLoss(), TestLoss()),
+        batch_size=10,
+        max_epochs=2,
+        train_split=None,
+    )
+
+    # the arrays of a skorch dataset are not copied
+    sample_weight = np.ones(len(X), dtype=np.float32)
+    X_dict = {"X": X, "sample_domain": sample_domain, "sample_weight": sample_weight}
+    X_processed, y_processed = method._process_dataset(Dataset(X_dict, y))
+    assert X_processed["X"] is X
+    assert X_processed["sample_domain"] is sample_domain
+    assert X_processed["sample_weight"] is sample_weight
+    assert y_processed is y
+
+    # a lazy dataset is kept as it is
+    torch_dataset = torch.utils.data.TensorDataset(torch.tensor(X), torch.tensor(y))
+    X_lazy, y_lazy = LazyDomainDataset(
+        torch_dataset, sample_domain, sample_weight=sample_weight
+    )[0]
+    assert X_lazy["sample_domain"] == sample_domain[0]
+    assert X_lazy["sample_weight"] == 1
+    assert int(y_lazy) == y[0]
+
+    lazy_dataset = LazyDomainDataset(torch_dataset, sample_domain)
+    method.fit(lazy_dataset, None)
+
+    lazy_dataset_test = LazyDomainDataset(
+        torch.utils.data.TensorDataset(torch.tensor(X_test), torch.tensor(y_test)),
+        sample_domain_test,
+    )
+    y_pred = method.predict(lazy_dataset_test)
+    assert np.array_equal(y_pred, method.predict(X_test, sample_domain_test))
+    assert method.predict_features(lazy_dataset_test).shape == (len(X_test), 10)
+    with pytest.raises(ValueError, match="'allow_source' is set to False"):
+        method.predict(lazy_dataset)
+    with pytest.raises(ValueError, match="sample_domain has"):
+        LazyDomainDataset(lazy_dataset.dataset, sample_domain[:-1])
+
+
 def test_return_features():
     num_features = 10
     module = ToyModule2D(num_features=num_features)
@@ -291,6 +396,12 @@ def test_return_features():
     _, features = method.feature_infer(X_test_dict)
     assert features.shape == (X_test.shape[0], num_features)
 
+    # Test the probabilities and the features predicted in the same pass
+    sample_domain_test = -np.ones(len(X_test), dtype=int)
+    proba, features = method.predict_proba_and_features(X_test, sample_domain_test)
+    assert np.allclose(proba, method.predict_proba(X_test, sample_domain_test))
+    assert np.allclose(features, method.predict_features(torch.tensor(X_test)))
+
 
 @pytest.mark.parametrize(
     "max_samples",
@@ -330,6 +441,49 @@ def test_domain_balanced_sampler(max_samples):
         assert len(sampler) == 2 * min(n_samples_source, n_samples_target)
 
 
+def test_domain_sampler_indices():
+    n_samples = 20
+    dataset = make_shifted_datasets(
+        n_samples_source=2 * n_samples,
+        n_samples_target=n_samples,
+        shift="concept_drift",
+        noise=0.1,
+        random_state=42,
+        return_dataset=True,
+    )
+    X, y, sample_domain = dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    X_dict = {"X": X.astype(np.float32), "sample_domain": sample_domain}
+
+    class NoGetItemDataset(Dataset):
+        def __getitem__(self, i):
+            raise AssertionError("The samplers should not load the samples")
+
+    dataset = NoGetItemDataset(X_dict, y)
+    source_indices = np.flatnonzero(sample_domain >= 0)
+    target_indices = np.flatnonzero(sample_domain < 0)
+
+    sampler = DomainBalancedSampler(dataset, 10, max_samples="max")
+    indices = np.array(list(sampler))
+    assert len(indices) == len(sampler)
+    # source and target samples are interleaved
+    assert np.all(sample_domain[indices[::2]] >= 0)
+    assert np.all(sample_domain[indices[1::2]] < 0)
+    # each source sample is drawn once, the target ones are reshuffled
+    assert np.array_equal(np.sort(indices[::2]), source_indices)
+    assert set(indices[1::2]) == set(target_indices)
+
+    sampler = DomainOnlySampler(dataset, 10, domain_used="target")
+    indices = np.array(list(sampler))
+    assert len(indices) == len(sampler)
+    assert len(np.unique(indices)) == len(indices)
+    assert np.all(sample_domain[indices] < 0)
+
+    # subsets of a dataset are supported
+    subset = torch.utils.data.Subset(dataset, target_indices[:10])
+    sampler = DomainOnlySampler(subset, 10, domain_used="target")
+    assert np.array_equal(np.sort(list(sampler)), np.arange(10))
+
+
 def test_domain_balanced_dataloader():
     n_samples = 20
     dataset = make_shifted_datasets(
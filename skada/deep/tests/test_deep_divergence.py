@@ -5,13 +5,16 @@
 # License: BSD 3-Clause
 import pytest
 
-pytest.importorskip("torch")
+torch = pytest.importorskip("torch")
 
 import numpy as np
 
 from skada.datasets import make_shifted_datasets
 from skada.deep import CAN, DAN, DeepCoral
+from skada.deep.callbacks import IncrementalSourceCentroids
+from skada.deep.losses import _gaussian_kernel, _MultiGaussianKernel, cdd_loss
 from skada.deep.modules import ToyModule2D
+from skada.deep.utils import SphericalKMeans
 
 
 @pytest.mark.parametrize(
@@ -149,3 +152,124 @@ def test_can(sigmas, distance_threshold, class_threshold):
 
     history = method.history_
     assert history[0]["train_loss"] > history[-1]["train_loss"]
+
+
+def test_cdd_loss():
+    rng = torch.Generator().manual_seed(0)
+    n_classes = 3
+    y_s = torch.randint(0, n_classes, (30,), generator=rng)
+    features_s = torch.randn(30, 3, generator=rng)
+    features_t = torch.randn(40, 3, generator=rng)
+    sigmas = torch.tensor([0.5, 1.0])
+
+    # the kernel is the sum of the gaussian kernels of each sigma
+    kernel = _gaussian_kernel(features_s, features_t, sigmas)
+    dist = torch.cdist(features_s, features_t)
+    expected_kernel = sum(torch.exp(-dist / sigma) for sigma in sigmas)
+    assert torch.allclose(kernel, expected_kernel)
+    assert torch.autograd.gradcheck(
+        _MultiGaussianKernel.apply,
+        (
+            dist[:5, :4].double().requires_grad_(),
+            sigmas.double().requires_grad_(),
+        ),
+    )
+
+    # the loss is the contrastive domain discrepancy between the classes
+    target_kmeans = SphericalKMeans(n_clusters=n_classes, random_state=0)
+    target_kmeans.fit(features_t)
+    loss = cdd_loss(
+        y_s,
+        features_s,
+        features_t,
+        target_kmeans=target_kmeans,
+        sigmas=[0.5, 1.0],
+        distance_threshold=1.0,
+        class_threshold=1,
+    )
+
+    cluster_labels_t = target_kmeans.predict(features_t)
+    discrepancy = torch.zeros(n_classes, n_classes)
+    for c1 in range(n_classes):
+        for c2 in range(n_classes):
+            X_s = features_s[y_s == c1]
+            X_t = features_t[cluster_labels_t == c2]
+            discrepancy[c1, c2] = (
+                _gaussian_kernel(X_s, X_s, sigmas).mean()
+                + _gaussian_kernel(X_t, X_t, sigmas).mean()
+                - 2 * _gaussian_kernel(X_s, X_t, sigmas).mean()
+            )
+    intraclass = discrepancy.diagonal().sum()
+    interclass = discrepancy.sum() - intraclass
+    expected_loss = intraclass / n_classes - interclass / (n_classes**2 - n_classes)
+    assert torch.allclose(loss, expected_loss, atol=1e-5)
+
+    # the classes of the clustering missing in the source batch are skipped
+    y_s_missing = y_s % (n_classes - 1)
+    assert (cluster_labels_t == n_classes - 1).any()
+    loss = cdd_loss(
+        y_s_missing,
+        features_s,
+        features_t,
+        target_kmeans=target_kmeans,
+        sigmas=[0.5, 1.0],
+        distance_threshold=1.0,
+        class_threshold=1,
+    )
+    for c1 in range(n_classes):
+        for c2 in range(n_classes):
+            X_s = features_s[y_s_missing == c1]
+            X_t = features_t[cluster_labels_t == c2]
+            discrepancy[c1, c2] = (
+                _gaussian_kernel(X_s, X_s, sigmas).mean()
+                + _gaussian_kernel(X_t, X_t, sigmas).mean()
+                - 2 * _gaussian_kernel(X_s, X_t, sigmas).mean()
+            )
+    discrepancy = discrepancy[: n_classes - 1, : n_classes - 1]
+    intraclass = discrepancy.diagonal().sum()
+    interclass = discrepancy.sum() - intraclass
+    expected_loss = intraclass / n_classes - interclass / (n_classes**2 - n_classes)
+    assert torch.isfinite(loss)
+    assert torch.allclose(loss, expected_loss, atol=1e-5)
+
+
+def test_can_incremental_centroids():
+    n_samples = 10
+    dataset = make_shifted_datasets(
+        n_samples_source=n_samples,
+        n_samples_target=n_samples,
+        shift="concept_drift",
+        noise=0.1,
+        random_state=42,
+        return_dataset=True,
+    )
+    method = CAN(
+        ToyModule2D(),
+        reg=0.01,
+        layer_name="dropout",
+        batch_size=10,
+        max_epochs=3,
+        train_split=None,
+        incremental_centroids=True,
+    )
+    callback = method.callbacks[0]
+    assert isinstance(callback, IncrementalSourceCentroids)
+
+    n_calls = []
+    predict_features = method.predict_features
+
+    def counted_predict_features(X):
+        n_calls.append(len(X))
+        return predict_features(X)
+
+    method.predict_features = counted_predict_features
+
+    X, y, sample_domain = dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    method.fit(X.astype(np.float32), y, sample_domain)
+
+    # the features are only predicted on the whole dataset at first epoch
+    assert len(n_calls) == 2
+    assert callback.source_centroids_.shape == (2, 10)
+    target_kmeans = method.criterion__adapt_criterion.target_kmeans
+    assert target_kmeans.cluster_centers_.shape == (2, 10)
+    assert target_kmeans.n_iter_ <= callback.max_iter
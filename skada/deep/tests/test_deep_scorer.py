@@ -2,6 +2,8 @@
 #
 # License: BSD 3-Clause
 
+from copy import deepcopy
+
 import numpy as np
 import pytest
 import torch
@@ -17,6 +19,7 @@ from skada.metrics import (
     DeepEmbeddedValidation,
     ImportanceWeightedScorer,
     MixValScorer,
+    MultiMetricScorer,
     PredictionEntropyScorer,
     SoftNeighborhoodDensity,
 )
@@ -29,6 +32,7 @@ from skada.metrics import (
         PredictionEntropyScorer(),
         SoftNeighborhoodDensity(),
         CircularValidation(),
+        CircularValidation(warm_start=True),
         MixValScorer(),
         ImportanceWeightedScorer(),
     ],
@@ -143,6 +147,55 @@ def test_scorer_with_nd_features(scorer, da_dataset):
     assert np.all(~np.isnan(scores)), "all scores are computed"
 
 
+def test_circular_validation_warm_start(da_dataset, monkeypatch):
+    X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    X = X.astype(np.float32)
+
+    estimator = DeepCoral(
+        ToyModule2D(proba=True),
+        reg=1,
+        layer_name="dropout",
+        batch_size=10,
+        max_epochs=10,
+        train_split=None,
+        optimizer__momentum=0.9,
+    )
+    estimator.fit(X, y, sample_domain=sample_domain)
+
+    backward_nets = []
+    fit = type(estimator).fit
+
+    def record_fit(net, *args, **kwargs):
+        if net is not estimator:
+            backward_nets.append(
+                (
+                    net.warm_start,
+                    net.initialized_,
+                    net.initialized_ and deepcopy(net.optimizer_.state_dict()),
+                )
+            )
+        return fit(net, *args, **kwargs)
+
+    monkeypatch.setattr(type(estimator), "fit", record_fit)
+    CircularValidation()(estimator, X, y, sample_domain)
+    ((warm_start, _, _),) = backward_nets
+    assert not warm_start
+
+    # the warm started backward fit continues from the forward training
+    backward_nets.clear()
+    score = CircularValidation(warm_start=True)(estimator, X, y, sample_domain)
+    ((warm_start, initialized, optimizer_state),) = backward_nets
+    assert warm_start and initialized
+    forward_state = estimator.optimizer_.state_dict()["state"]
+    assert len(forward_state) > 0
+    for key, state in forward_state.items():
+        torch.testing.assert_close(
+            optimizer_state["state"][key]["momentum_buffer"], state["momentum_buffer"]
+        )
+    assert ~np.isnan(score)
+    assert not estimator.warm_start
+
+
 def test_dev_scorer_on_target_only(da_dataset):
     X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
     X_test, y_test, sample_domain_test = da_dataset.pack_test(as_targets=["t"])
@@ -210,3 +263,41 @@ def test_dev_exception_layer_name(da_dataset):
 
     with pytest.raises(ValueError, match="The layer_name of the estimator is not set."):
         DeepEmbeddedValidation()(estimator, X, y, sample_domain)
+
+
+def test_multi_metric_scorer_on_deepmodel(da_dataset, monkeypatch):
+    X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    X = X.astype(np.float32)
+
+    estimator = DeepCoral(
+        ToyModule2D(proba=True),
+        reg=1,
+        layer_name="dropout",
+        batch_size=10,
+        max_epochs=10,
+        train_split=None,
+    )
+    estimator.fit(X, y, sample_domain=sample_domain)
+
+    scorers = {
+        "entropy": PredictionEntropyScorer(),
+        "snd": SoftNeighborhoodDensity(),
+        "dev": DeepEmbeddedValidation(random_state=0, cache_size=0),
+    }
+    expected = {
+        name: scorer(estimator, X, y, sample_domain) for name, scorer in scorers.items()
+    }
+
+    n_calls = []
+    predict_proba_and_features = type(estimator).predict_proba_and_features
+
+    def count_calls(net, X, *args, **kwargs):
+        n_calls.append(len(X))
+        return predict_proba_and_features(net, X, *args, **kwargs)
+
+    monkeypatch.setattr(type(estimator), "predict_proba_and_features", count_calls)
+    scores = MultiMetricScorer(scorers)(estimator, X, y, sample_domain)
+    assert scores == pytest.approx(expected)
+    # the probabilities and the features are computed in the same pass, first
+    # on the target samples, then on the source samples for DEV
+    assert n_calls == [np.sum(sample_domain < 0), np.sum(sample_domain >= 0)]
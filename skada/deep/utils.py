@@ -9,11 +9,31 @@ from torch.nn.functional import cosine_similarity
 from sklearn.utils.validation import check_is_fitted
 
 
-def _get_intermediate_layers(intermediate_layers, layer_name):
-    def hook(model, input, output):
-        intermediate_layers[layer_name] = output.flatten(start_dim=1)
+class _IntermediateLayers(dict):
+    """Outputs of the hooked layers of a module.
 
-    return hook
+    They are only valid for the last forward pass, so they are dropped
+    when the module is copied or pickled. The copies of the module and of
+    its hooks still share the same (empty) dict.
+    """
+
+    def __reduce__(self):
+        return type(self), ()
+
+
+class _IntermediateLayerHook:
+    """Forward hook storing the flattened output of a layer.
+
+    It is a class rather than a closure so that the modules holding it
+    can be pickled, and thus deep copied.
+    """
+
+    def __init__(self, intermediate_layers, layer_name):
+        self.intermediate_layers = intermediate_layers
+        self.layer_name = layer_name
+
+    def __call__(self, model, input, output):
+        self.intermediate_layers[self.layer_name] = output.flatten(start_dim=1)
 
 
 def _register_forwards_hook(module, intermediate_layers, layer_names):
@@ -25,7 +45,7 @@ def _register_forwards_hook(module, intermediate_layers, layer_names):
     for layer_name, layer_module in module.named_modules():
         if layer_name in layer_names:
             layer_module.register_forward_hook(
-                _get_intermediate_layers(intermediate_layers, layer_name)
+                _IntermediateLayerHook(intermediate_layers, layer_name)
             )
 
 
@@ -8,16 +8,19 @@
 import warnings
 from abc import abstractmethod
 from copy import deepcopy
+from pickle import PicklingError, UnpicklingError
 
 import numpy as np
+from joblib import hash as joblib_hash
+from sklearn import get_config
 from sklearn.base import BaseEstimator, clone
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import balanced_accuracy_score, check_scoring
 from sklearn.model_selection import train_test_split
-from sklearn.neighbors import KernelDensity
+from sklearn.neighbors import KernelDensity, NearestNeighbors
+from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import LabelEncoder, Normalizer
-from sklearn.utils import check_random_state
-from sklearn.utils.extmath import softmax
+from sklearn.utils import check_random_state, gen_batches
 from sklearn.utils.metadata_routing import _MetadataRequester, get_routing_for_object
 
 from ._utils import (
@@ -26,7 +29,11 @@ from ._utils import (
     Y_Type,
     _check_y_masking,
     _find_y_type,
+    _fingerprint,
+    _LRUCache,
+    _transform_by_batch,
 )
+from .base import BaseSelector, Shared
 from .utils import check_X_y_domain, extract_source_indices, source_target_split
 
 
@@ -37,12 +44,106 @@ class _BaseDomainAwareScorer(_MetadataRequester):
     __metadata_request__score = {"sample_domain": True}
 
     @abstractmethod
-    def _score(self, estimator, X, y, sample_domain=None, **params):
-        pass
+    def _score(self, estimator, X, y, sample_domain=None, predictions=None, **params):
+        """Score of the estimator.
+
+        `predictions`, given by :class:`MultiMetricScorer`, holds the outputs
+        of the estimator on the validated X, shared by several scorers.
+        """
 
     def __call__(self, estimator, X, y=None, sample_domain=None, **params):
         return self._score(estimator, X, y, sample_domain=sample_domain, **params)
 
+    def _predict(
+        self, method, estimator, X, sample_domain, rows, predictions=None, **params
+    ):
+        """Output of the `method` of the estimator on the `rows` of X."""
+        if predictions is None:
+            return getattr(estimator, method)(
+                X[rows], sample_domain=sample_domain[rows], **params
+            )
+        return predictions.get(method, rows)
+
+
+class _SharedPredictions:
+    """Outputs of a fitted estimator on the samples of a split.
+
+    Each output is only computed on the rows requested by the scorers of a
+    :class:`MultiMetricScorer`, once per row, and shared by all of them.
+    """
+
+    def __init__(self, estimator, X, sample_domain, **params):
+        self.estimator = estimator
+        self.X = X
+        self.sample_domain = sample_domain
+        self.params = params
+        self._outputs = {}
+        self._computed = {}
+
+    def get(self, method, rows=slice(None), compute=None):
+        """Output of `method` on the `rows` of X.
+
+        `compute(idx)`, if given, returns the output on the samples `idx`
+        instead of the method of the estimator.
+        """
+        n_samples = self.X.shape[0]
+        requested = np.zeros(n_samples, dtype=bool)
+        requested[rows] = True
+        if compute is None and method in ("predict_proba", "predict_features"):
+            if hasattr(self.estimator, "predict_proba_and_features"):
+                # the deep models predict and extract the features in one pass
+                missing = requested & ~(
+                    self._is_computed("predict_proba")
+                    & self._is_computed("predict_features")
+                )
+                if missing.any():
+                    idx = _missing_index(missing)
+                    outputs = self.estimator.predict_proba_and_features(
+                        self.X[idx],
+                        sample_domain=self.sample_domain[idx],
+                        allow_source=True,
+                    )
+                    for name, output in zip(
+                        ("predict_proba", "predict_features"), outputs
+                    ):
+                        self._store(name, missing, output)
+                return self._outputs[method][rows]
+
+        missing = requested & ~self._is_computed(method)
+        if missing.any():
+            idx = _missing_index(missing)
+            if compute is not None:
+                output = compute(idx)
+            else:
+                output = getattr(self.estimator, method)(
+                    self.X[idx],
+                    sample_domain=self.sample_domain[idx],
+                    allow_source=True,
+                    **self.params,
+                )
+            self._store(method, missing, output)
+        return self._outputs[method][rows]
+
+    def _is_computed(self, method):
+        if method not in self._computed:
+            return np.zeros(self.X.shape[0], dtype=bool)
+        return self._computed[method]
+
+    def _store(self, method, missing, output):
+        output = np.asarray(output)
+        if method not in self._outputs:
+            self._outputs[method] = np.empty(
+                (missing.shape[0],) + output.shape[1:], dtype=output.dtype
+            )
+            self._computed[method] = np.zeros(missing.shape[0], dtype=bool)
+        self._outputs[method][missing] = output
+        self._computed[method] |= missing
+
+
+def _missing_index(missing):
+    """Index of the missing rows, a slice when all of them are missing."""
+    return slice(None) if missing.all() else np.flatnonzero(missing)
+
 
 class SupervisedScorer(_BaseDomainAwareScorer):
     """Compute score on supervised dataset.
@@ -68,7 +169,14 @@ class SupervisedScorer(_BaseDomainAwareScorer):
         self._sign = 1 if greater_is_better else -1
 
     def _score(
-        self, estimator, X, y=None, sample_domain=None, target_labels=None, **params
+        self,
+        estimator,
+        X,
+        y=None,
+        sample_domain=None,
+        target_labels=None,
+        predictions=None,
+        **params,
     ):
         scorer = check_scoring(estimator, self.scoring)
 
@@ -104,7 +212,21 @@ class ImportanceWeightedScorer(_BaseDomainAwareScorer):
         Whether `scorer` is a score function (default), meaning high is
         good, or a loss function, meaning low is good. In the latter case, the
         scorer object will sign-flip the outcome of the `scorer`.
-
+    rtol : float, default=0
+        Relative tolerance of the default KernelDensity estimator. A positive
+        value lets its tree-based algorithm approximate the densities, which
+        is much faster on large datasets. Ignored if `weight_estimator` is
+        not None.
+    cache_size : int, default=8
+        Maximum number of splits whose weights are cached. The weights are
+        cached by a hash of the source and target data, so that they are only
+        estimated once per split when several estimators are scored on the
+        same splits, e.g. in a hyperparameter search. The least recently
+        used weights are discarded first. If 0, nothing is cached.
+        The cache is not pickled: it is only shared by the calls made in
+        the same process, e.g. a search with `n_jobs=1` or a threading
+        backend. With process workers, each copy of the scorer starts with
+        an empty cache.
 
     Attributes
     ----------
@@ -125,11 +247,20 @@ class ImportanceWeightedScorer(_BaseDomainAwareScorer):
         weight_estimator=None,
         scoring=None,
         greater_is_better=True,
+        rtol=0,
+        cache_size=8,
     ):
         super().__init__()
         self.weight_estimator = weight_estimator
         self.scoring = scoring
         self._sign = 1 if greater_is_better else -1
+        self.rtol = rtol
+        self.cache_size = cache_size
+        self._weights_cache = _LRUCache()
+
+    def clear_cache(self):
+        """Remove all the cached weights."""
+        self._weights_cache.clear()
 
     def _fit(self, X_source, X_target):
         """Fit adaptation parameters.
@@ -150,14 +281,14 @@ class ImportanceWeightedScorer(_BaseDomainAwareScorer):
         """
         weight_estimator = self.weight_estimator
         if weight_estimator is None:
-            weight_estimator = KernelDensity()
+            weight_estimator = KernelDensity(rtol=self.rtol)
         self.weight_estimator_source_ = clone(weight_estimator)
         self.weight_estimator_target_ = clone(weight_estimator)
         self.weight_estimator_source_.fit(X_source)
         self.weight_estimator_target_.fit(X_target)
         return self
 
-    def _score(self, estimator, X, y, sample_domain=None, **params):
+    def _score(self, estimator, X, y, sample_domain=None, predictions=None, **params):
         scorer = check_scoring(estimator, self.scoring)
         if "sample_weight" not in get_routing_for_object(estimator).consumes(
             "score", ["sample_weight"]
@@ -178,16 +309,7 @@ class ImportanceWeightedScorer(_BaseDomainAwareScorer):
         X_source_reshaped = X_source.reshape(X_source.shape[0], -1)
         X_target_reshaped = X_target.reshape(X_target.shape[0], -1)
 
-        self._fit(X_source_reshaped, X_target_reshaped)
-        ws = self.weight_estimator_source_.score_samples(X_source_reshaped)
-        wt = self.weight_estimator_target_.score_samples(X_source_reshaped)
-        weights = np.exp(wt - ws)
-
-        if weights.sum() != 0:
-            weights /= weights.sum()
-        else:
-            warnings.warn("All weights are zero. Using uniform weights.")
-            weights = np.ones_like(weights) / len(weights)
+        weights = self._get_weights(X_source_reshaped, X_target_reshaped)
 
         source_idx = extract_source_indices(sample_domain)
         score = scorer(
@@ -202,6 +324,39 @@ class ImportanceWeightedScorer(_BaseDomainAwareScorer):
 
         return self._sign * score
 
+    def _get_weights(self, X_source, X_target):
+        """Importance weights of the source samples, cached by split."""
+        key = (
+            _fingerprint(X_source, X_target),
+            joblib_hash((self.weight_estimator, self.rtol)),
+        )
+        cached = self._weights_cache.get(key)
+        if cached is not None:
+            (
+                self.weight_estimator_source_,
+                self.weight_estimator_target_,
+                weights,
+            ) = cached
+            return weights.copy()
+
+        self._fit(X_source, X_target)
+        ws = self.weight_estimator_source_.score_samples(X_source)
+        wt = self.weight_estimator_target_.score_samples(X_source)
+        weights = np.exp(wt - ws)
+
+        if weights.sum() != 0:
+            weights /= weights.sum()
+        else:
+            warnings.warn("All weights are zero. Using uniform weights.")
+            weights = np.ones_like(weights) / len(weights)
+
+        self._weights_cache.set(
+            key,
+            (self.weight_estimator_source_, self.weight_estimator_target_, weights),
+            self.cache_size,
+        )
+        return weights
+
 
 class PredictionEntropyScorer(_BaseDomainAwareScorer):
     """Score based on the entropy of predictions on unsupervised dataset.
@@ -245,7 +400,7 @@ class PredictionEntropyScorer(_BaseDomainAwareScorer):
                 "Valid options are: 'none', 'mean', 'sum'."
             )
 
-    def _score(self, estimator, X, y, sample_domain=None, **params):
+    def _score(self, estimator, X, y, sample_domain=None, predictions=None, **params):
         if not hasattr(estimator, "predict_proba"):
             raise AttributeError(
                 "The estimator passed should have a 'predict_proba' method. "
@@ -253,15 +408,25 @@ class PredictionEntropyScorer(_BaseDomainAwareScorer):
             )
         X, y, sample_domain = check_X_y_domain(X, y, sample_domain, allow_nd=True)
         source_idx = extract_source_indices(sample_domain)
-        proba = estimator.predict_proba(
-            X[~source_idx], sample_domain=sample_domain[~source_idx], **params
+        proba = self._predict(
+            "predict_proba",
+            estimator,
+            X,
+            sample_domain,
+            ~source_idx,
+            predictions=predictions,
+            **params,
         )
-        if hasattr(estimator, "predict_log_proba"):
+        if not hasattr(estimator, "predict_log_proba"):
+            log_proba = np.log(proba + 1e-7)
+        elif predictions is not None:
+            # derived from the shared probabilities to avoid a second pass
+            with np.errstate(divide="ignore"):
+                log_proba = np.log(proba)
+        else:
             log_proba = estimator.predict_log_proba(
                 X[~source_idx], sample_domain=sample_domain[~source_idx], **params
             )
-        else:
-            log_proba = np.log(proba + 1e-7)
         infty_mask = np.isneginf(log_proba)
         entropy_per_sample = -proba * log_proba
         entropy_per_sample[infty_mask] = 0  # x*log(x) -> 0 as x -> 0
@@ -283,6 +448,12 @@ class SoftNeighborhoodDensity(_BaseDomainAwareScorer):
 
     See [19]_ for details.
 
+    The similarities are computed by chunks of target samples so that the
+    memory used does not exceed `working_memory`. For large target sets,
+    the similarities can be restricted to the nearest neighbors of each
+    sample, and the entropy can be averaged over a random subset of the
+    target samples.
+
     Parameters
     ----------
     T :  float
@@ -292,6 +463,34 @@ class SoftNeighborhoodDensity(_BaseDomainAwareScorer):
         Whether `scorer` is a score function (default), meaning high is
         good, or a loss function, meaning low is good. In the latter case, the
         scorer object will sign-flip the outcome of the `scorer`.
+    working_memory : int, default=None
+        The sought maximum memory in MiB for the chunks of the similarity
+        matrix. If None, the value of ``sklearn.get_config()['working_memory']``
+        is used.
+    n_neighbors : int, default=None
+        If not None, the softmax of each sample is only computed over the
+        similarities with its `n_neighbors` nearest neighbors, found with
+        :class:`~sklearn.neighbors.NearestNeighbors`.
+    max_samples : int or float, default=None
+        If not None, the entropy is averaged over a random subset of the
+        target samples. If int, the number of samples, if float, the
+        fraction of the target samples. The 95% confidence interval of
+        the score is stored in `confidence_interval_`.
+    random_state : int, RandomState instance or None, default=None
+        Determines the random subset of samples when `max_samples` is not
+        None.
+
+    Attributes
+    ----------
+    confidence_interval_ : tuple of float
+        The 95% confidence interval of the last score computed with
+        `max_samples`. It is only set on the scorer object that is called:
+        in :class:`~sklearn.model_selection.GridSearchCV` or
+        :func:`~sklearn.model_selection.cross_validate`, the scorer is
+        copied to the workers, so the attribute is not set or only holds
+        the interval of the last split scored in the same process. Call
+        the scorer directly on a fitted estimator to get the interval of
+        a given split.
 
     References
     ----------
@@ -300,12 +499,24 @@ class SoftNeighborhoodDensity(_BaseDomainAwareScorer):
             International Conference on Computer Vision, 2021.
     """
 
-    def __init__(self, T=0.05, greater_is_better=True):
+    def __init__(
+        self,
+        T=0.05,
+        greater_is_better=True,
+        working_memory=None,
+        n_neighbors=None,
+        max_samples=None,
+        random_state=None,
+    ):
         super().__init__()
         self.T = T
         self._sign = 1 if greater_is_better else -1
+        self.working_memory = working_memory
+        self.n_neighbors = n_neighbors
+        self.max_samples = max_samples
+        self.random_state = random_state
 
-    def _score(self, estimator, X, y, sample_domain=None, **params):
+    def _score(self, estimator, X, y, sample_domain=None, predictions=None, **params):
         if not hasattr(estimator, "predict_proba"):
             raise AttributeError(
                 "The estimator passed should have a 'predict_proba' method. "
@@ -314,17 +525,86 @@ class SoftNeighborhoodDensity(_BaseDomainAwareScorer):
 
         X, y, sample_domain = check_X_y_domain(X, y, sample_domain, allow_nd=True)
         source_idx = extract_source_indices(sample_domain)
-        proba = estimator.predict_proba(
-            X[~source_idx], sample_domain=sample_domain[~source_idx], **params
+        proba = self._predict(
+            "predict_proba",
+            estimator,
+            X,
+            sample_domain,
+            ~source_idx,
+            predictions=predictions,
+            **params,
         )
         proba = Normalizer(norm="l2").fit_transform(proba)
 
-        similarity_matrix = proba @ proba.T / self.T
-        np.fill_diagonal(similarity_matrix, -np.diag(similarity_matrix))
-        similarity_matrix = softmax(similarity_matrix)
+        n_samples = proba.shape[0]
+        if self.max_samples is None:
+            rows = np.arange(n_samples)
+        else:
+            if isinstance(self.max_samples, float):
+                n_rows = max(1, int(self.max_samples * n_samples))
+            else:
+                n_rows = min(self.max_samples, n_samples)
+            rng = check_random_state(self.random_state)
+            rows = np.sort(rng.choice(n_samples, n_rows, replace=False))
+
+        if self.n_neighbors is None:
+            entropy = self._chunked_entropy(proba, rows)
+        else:
+            entropy = self._neighbors_entropy(proba, rows)
+
+        score = np.mean(entropy)
+        if self.max_samples is not None:
+            # normal approximation with finite population correction
+            n_rows = len(rows)
+            correction = (n_samples - n_rows) / max(n_samples - 1, 1)
+            std = np.std(entropy, ddof=1) if n_rows > 1 else 0.0
+            half_width = 1.96 * std * np.sqrt(correction / n_rows)
+            self.confidence_interval_ = tuple(
+                sorted(self._sign * (score + np.array([-half_width, half_width])))
+            )
+        return self._sign * score
 
-        entropy = np.sum(-similarity_matrix * np.log(similarity_matrix), axis=1)
-        return self._sign * np.mean(entropy)
+    def _chunked_entropy(self, proba, rows):
+        """Entropy of the similarities of the rows, computed by chunks."""
+        working_memory = self.working_memory
+        if working_memory is None:
+            working_memory = get_config()["working_memory"]
+        # similarities, their exponential and their product
+        row_bytes = 3 * proba.shape[0] * proba.dtype.itemsize
+        chunk_n_rows = max(1, int(working_memory * 2**20 // row_bytes))
+
+        entropy = np.empty(len(rows))
+        for batch in gen_batches(len(rows), chunk_n_rows):
+            chunk_rows = rows[batch]
+            similarity = proba[chunk_rows] @ proba.T / self.T
+            similarity[np.arange(len(chunk_rows)), chunk_rows] *= -1
+            entropy[batch] = _softmax_entropy(similarity)
+        return entropy
+
+    def _neighbors_entropy(self, proba, rows):
+        """Entropy of the similarities of the rows with their neighbors."""
+        n_neighbors = min(self.n_neighbors, proba.shape[0] - 1)
+        nn = NearestNeighbors(n_neighbors=n_neighbors + 1).fit(proba)
+        distances, indices = nn.kneighbors(proba[rows])
+
+        # remove each sample from its own neighbors
+        is_self = indices == rows[:, None]
+        is_self[~is_self.any(axis=1), -1] = True
+        is_self &= np.cumsum(is_self, axis=1) == 1
+        distances = distances[~is_self].reshape(len(rows), n_neighbors)
+
+        # the rows of proba have unit norm
+        similarity = (1 - distances**2 / 2) / self.T
+        return _softmax_entropy(similarity)
+
+
+def _softmax_entropy(logits):
+    """Entropy of the softmax of each row of logits."""
+    logits_max = logits.max(axis=1, keepdims=True)
+    exp_logits = np.exp(logits - logits_max)
+    sum_exp = exp_logits.sum(axis=1)
+    log_sum_exp = np.log(sum_exp) + logits_max[:, 0]
+    return log_sum_exp - np.sum(exp_logits * logits, axis=1) / sum_exp
 
 
 class DeepEmbeddedValidation(_BaseDomainAwareScorer):
@@ -348,6 +628,18 @@ class DeepEmbeddedValidation(_BaseDomainAwareScorer):
         Whether `scorer` is a score function (default), meaning high is
         good, or a loss function, meaning low is good. In the latter case, the
         scorer object will sign-flip the outcome of the `scorer`.
+    batch_size : int, default=None
+        Number of samples transformed at once when extracting the features
+        with a pipeline. If None, all the samples are transformed at once.
+        Deep models use their own batch size.
+    cache_size : int, default=8
+        Maximum number of fitted domain classifiers that are cached. They
+        are cached by a hash of the features of the split, so that the domain
+        classifier is fitted once when the same estimator is scored several
+        times on the same split. The least recently used classifiers are
+        discarded first. If 0, nothing is cached. As for
+        :class:`ImportanceWeightedScorer`, the cache is not pickled and is
+        only shared by the calls made in the same process.
 
     References
     ----------
@@ -362,6 +654,8 @@ class DeepEmbeddedValidation(_BaseDomainAwareScorer):
         loss_func=None,
         random_state=None,
         greater_is_better=False,
+        batch_size=None,
+        cache_size=8,
     ):
         super().__init__()
         self.domain_classifier = domain_classifier
@@ -370,6 +664,13 @@ class DeepEmbeddedValidation(_BaseDomainAwareScorer):
         )
         self.random_state = random_state
         self._sign = 1 if greater_is_better else -1
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self._domain_classifier_cache = _LRUCache()
+
+    def clear_cache(self):
+        """Remove all the cached domain classifiers."""
+        self._domain_classifier_cache.clear()
 
     def _no_reduc_log_loss(self, y, y_pred):
         return np.array(
@@ -377,6 +678,15 @@ class DeepEmbeddedValidation(_BaseDomainAwareScorer):
         )
 
     def _fit_adapt(self, features, features_target):
+        key = (
+            _fingerprint(features, features_target),
+            joblib_hash(self.domain_classifier),
+        )
+        domain_classifier_ = self._domain_classifier_cache.get(key)
+        if domain_classifier_ is not None:
+            self.domain_classifier_ = domain_classifier_
+            return self
+
         domain_classifier = self.domain_classifier
         if domain_classifier is None:
             domain_classifier = LogisticRegression()
@@ -385,24 +695,23 @@ class DeepEmbeddedValidation(_BaseDomainAwareScorer):
         self.domain_classifier_.fit(
             np.concatenate((features, features_target)), y_domain
         )
+        self._domain_classifier_cache.set(key, self.domain_classifier_, self.cache_size)
         return self
 
-    def _score(self, estimator, X, y, sample_domain=None, **kwargs):
+    def _score(self, estimator, X, y, sample_domain=None, predictions=None, **kwargs):
         if not hasattr(estimator, "predict_proba"):
             raise AttributeError(
                 "The estimator passed should have a 'predict_proba' method. "
                 f"The estimator {estimator!r} does not."
             )
 
+        is_deep = not isinstance(estimator, BaseEstimator)
         has_transform_method = False
 
-        if not isinstance(estimator, BaseEstimator):
+        if is_deep:
             # The estimator is a deep model
             if estimator.module_.layer_name is None:
                 raise ValueError("The layer_name of the estimator is not set.")
-
-            transformer = estimator.predict_features
-            has_transform_method = True
         else:
             # We need to find the last layer of the pipeline with a transform method
             pipeline_steps = list(enumerate(estimator.named_steps.items()))
@@ -416,7 +725,7 @@ class DeepEmbeddedValidation(_BaseDomainAwareScorer):
         def identity(x):
             return x
 
-        if not has_transform_method:
+        if not is_deep and not has_transform_method:
             # We use the input data as features
             transformer = identity
 
@@ -425,35 +734,54 @@ class DeepEmbeddedValidation(_BaseDomainAwareScorer):
         )
         source_idx = extract_source_indices(sample_domain)
         rng = check_random_state(self.random_state)
-        X_train, X_val, _, y_val, _, sample_domain_val = train_test_split(
-            X[source_idx],
-            y[source_idx],
-            sample_domain[source_idx],
-            test_size=0.33,
-            random_state=rng,
+        train_idx, val_idx = train_test_split(
+            np.flatnonzero(source_idx), test_size=0.33, random_state=rng
         )
-
-        features_train = transformer(X_train)
-        features_val = transformer(X_val)
-        features_target = transformer(X[~source_idx])
+        y_val = y[val_idx]
+
+        # The features of all the samples are extracted at once
+        if is_deep and predictions is not None:
+            features = predictions.get("predict_features")
+            y_pred = predictions.get("predict_proba", val_idx)
+        elif is_deep:
+            # the probabilities are predicted in the same forward pass
+            y_pred, features = estimator.predict_proba_and_features(
+                X, sample_domain=sample_domain, allow_source=True
+            )
+            y_pred = y_pred[val_idx]
+        else:
+            if predictions is not None:
+                features = predictions.get(
+                    "transform",
+                    compute=lambda idx: _transform_by_batch(
+                        transformer, X[idx], self.batch_size
+                    ),
+                )
+            else:
+                features = _transform_by_batch(transformer, X, self.batch_size)
+            y_pred = self._predict(
+                "predict_proba",
+                estimator,
+                X,
+                sample_domain,
+                val_idx,
+                predictions=predictions,
+                allow_source=True,
+            )
 
         # 2 cases:
-        # - features_train is a numpy array --> Do nothing
-        # - features_train is a torch.Tensor --> call detach().numpy()
-        if not isinstance(features_train, np.ndarray):
-            # The transformer comes from a deep model
-            # and returns a torch.Tensor
-            features_train = features_train.detach().numpy()
-            features_val = features_val.detach().numpy()
-            features_target = features_target.detach().numpy()
+        # - features is a numpy array --> Do nothing
+        # - features is a torch.Tensor --> call detach().numpy()
+        if not isinstance(features, np.ndarray):
+            features = features.detach().numpy()
+        features_train = features[train_idx]
+        features_val = features[val_idx]
+        features_target = features[~source_idx]
 
         self._fit_adapt(features_train, features_target)
         N_train, N_target = len(features_train), len(features_target)
         domain_pred = self.domain_classifier_.predict_proba(features_val)
         weights = (N_train / N_target) * domain_pred[:, :1] / domain_pred[:, 1:]
-        y_pred = estimator.predict_proba(
-            X_val, sample_domain=sample_domain_val, allow_source=True
-        )
 
         error = self._loss_func(y_val, y_pred)
         assert weights.shape[0] == error.shape[0]
@@ -522,6 +850,16 @@ class CircularValidation(_BaseDomainAwareScorer):
         Whether `scorer` is a score function (default), meaning high is
         good, or a loss function, meaning low is good. In the latter case, the
         scorer object will sign-flip the outcome of the `scorer`.
+    warm_start : bool, default=False
+        If True, the backward estimator is a copy of the fitted forward
+        estimator with all its `warm_start` parameters set to True, so that
+        the backward fit continues the forward training instead of
+        re-initializing it, e.g. the optimizer state of the deep models.
+        In a DA pipeline, the `Shared` steps whose base estimator has a
+        `warm_start` parameter continue from their fitted base estimator.
+        A ValueError is raised if the estimator has nothing to warm start.
+        If the target labels are predicted in fewer classes than the
+        source labels, the backward estimator is fitted from scratch.
 
     References
     ----------
@@ -534,6 +872,7 @@ class CircularValidation(_BaseDomainAwareScorer):
         self,
         source_scorer=balanced_accuracy_score,
         greater_is_better=True,
+        warm_start=False,
     ):
         super().__init__()
         if not callable(source_scorer):
@@ -544,8 +883,9 @@ class CircularValidation(_BaseDomainAwareScorer):
 
         self.source_scorer = source_scorer
         self._sign = 1 if greater_is_better else -1
+        self.warm_start = warm_start
 
-    def _score(self, estimator, X, y, sample_domain=None, **params):
+    def _score(self, estimator, X, y, sample_domain=None, predictions=None, **params):
         """
         Compute the score based on a circular validation strategy.
 
@@ -575,16 +915,13 @@ class CircularValidation(_BaseDomainAwareScorer):
                 "CircularValidation doesn't support semi-supervised DA"
             )
 
-        source_idx = extract_source_indices(sample_domain)
+        if self.warm_start:
+            _check_warm_start(estimator)
 
-        # TODO: Check if skorch works with deepcopy/clone
-        try:
-            backward_estimator = deepcopy(estimator)
-        except (TypeError, AttributeError):
-            backward_estimator = clone(estimator)
+        source_idx = extract_source_indices(sample_domain)
 
-        y_pred_target = estimator.predict(
-            X[~source_idx], sample_domain=sample_domain[~source_idx]
+        y_pred_target = self._predict(
+            "predict", estimator, X, sample_domain, ~source_idx, predictions=predictions
         )
 
         if len(np.unique(y_pred_target)) == 1:
@@ -602,6 +939,7 @@ class CircularValidation(_BaseDomainAwareScorer):
             )
         else:
             y_type = _find_y_type(y[source_idx])
+            warm_start = self.warm_start
 
             if y_type == Y_Type.DISCRETE:
                 # We need to re-encode the target labels
@@ -612,6 +950,18 @@ class CircularValidation(_BaseDomainAwareScorer):
                 le.fit(y_pred_target)
                 y_pred_target = le.transform(y_pred_target)
 
+                n_classes = len(np.unique(y[source_idx]))
+                if warm_start and len(le.classes_) != n_classes:
+                    # the forward solution is fitted on more classes
+                    warnings.warn(
+                        f"The target labels are predicted in {len(le.classes_)} "
+                        f"of the {n_classes} classes, the backward estimator is "
+                        "fitted from scratch and warm_start is ignored."
+                    )
+                    warm_start = False
+
+            backward_estimator = _backward_estimator(estimator, warm_start)
+
             backward_sample_domain = -sample_domain
 
             backward_y = np.zeros_like(y)
@@ -637,6 +987,91 @@ class CircularValidation(_BaseDomainAwareScorer):
         return self._sign * score
 
 
+def _set_warm_start(estimator):
+    """Set all the `warm_start` parameters of estimator to True.
+
+    Returns False if estimator has no `warm_start` parameter.
+    """
+    names = [
+        name
+        for name in estimator.get_params()
+        if name == "warm_start" or name.endswith("__warm_start")
+    ]
+    estimator.set_params(**{name: True for name in names})
+    return len(names) > 0
+
+
+def _check_warm_start(estimator):
+    """Check that the backward fit of estimator can be warm started."""
+    if not isinstance(estimator, Pipeline):
+        steps = [estimator]
+    else:
+        steps = [step for _, step in estimator.steps]
+    can_warm_start = False
+    for step in steps:
+        if step is None or step == "passthrough":
+            continue
+        base_estimator = step
+        if isinstance(step, BaseSelector):
+            base_estimator = step.base_estimator
+        if not any(
+            name == "warm_start" or name.endswith("__warm_start")
+            for name in base_estimator.get_params()
+        ):
+            continue
+        if isinstance(step, BaseSelector) and not isinstance(step, Shared):
+            raise ValueError(
+                f"The {type(step).__name__} selector clones its estimators on "
+                "fit and can not be warm started. Use a Shared selector or "
+                "set warm_start=False."
+            )
+        can_warm_start = True
+    if not can_warm_start:
+        raise ValueError(
+            f"The estimator {estimator!r} has no warm_start parameter. "
+            "Set warm_start=False."
+        )
+
+
+def _backward_estimator(estimator, warm_start):
+    """Copy of estimator to fit on the predicted target labels."""
+    # TODO: Check if skorch works with deepcopy/clone
+    try:
+        backward_estimator = deepcopy(estimator)
+    except (TypeError, AttributeError, PicklingError, UnpicklingError):
+        backward_estimator = clone(estimator)
+        # the fitted parameters are lost with clone
+        if warm_start and not _load_fitted_net_state(backward_estimator, estimator):
+            warnings.warn(
+                "The estimator can not be copied, the backward estimator "
+                "is fitted from scratch and warm_start is ignored."
+            )
+            warm_start = False
+
+    if warm_start:
+        _set_warm_start(backward_estimator)
+        if isinstance(backward_estimator, Pipeline):
+            for _, step in backward_estimator.steps:
+                # the Shared selectors continue from their fitted base estimator
+                if isinstance(step, Shared) and hasattr(step, "base_estimator_"):
+                    step._warm_start = _set_warm_start(step.base_estimator_)
+    return backward_estimator
+
+
+def _load_fitted_net_state(net, fitted_net):
+    """Load the module and optimizer states of a fitted skorch net in its clone.
+
+    Returns False if the estimators are not skorch nets.
+    """
+    if not (hasattr(fitted_net, "module_") and hasattr(fitted_net, "optimizer_")):
+        return False
+    net.initialize()
+    net.module_.load_state_dict(fitted_net.module_.state_dict())
+    # the optimizer keeps the given state tensors, which must not be shared
+    net.optimizer_.load_state_dict(deepcopy(fitted_net.optimizer_.state_dict()))
+    return True
+
+
 class MixValScorer(_BaseDomainAwareScorer):
     """
     MixVal scorer for unsupervised domain adaptation.
@@ -701,7 +1136,9 @@ class MixValScorer(_BaseDomainAwareScorer):
         if self.ice_type not in ["both", "intra", "inter"]:
             raise ValueError("ice_type must be 'both', 'intra', or 'inter'")
 
-    def _score(self, estimator, X, y=None, sample_domain=None, **params):
+    def _score(
+        self, estimator, X, y=None, sample_domain=None, predictions=None, **params
+    ):
         """
         Compute the Interpolation Consistency Evaluation (ICE) score.
 
@@ -736,7 +1173,9 @@ class MixValScorer(_BaseDomainAwareScorer):
         rand_idx = rng.permutation(X_target.shape[0])
 
         # Get predictions for target samples
-        labels_a = estimator.predict(X_target, sample_domain=sample_domain[~source_idx])
+        labels_a = self._predict(
+            "predict", estimator, X, sample_domain, ~source_idx, predictions=predictions
+        )
         labels_b = labels_a[rand_idx]
 
         # Intra-cluster and inter-cluster mixup
@@ -782,3 +1221,71 @@ class MixValScorer(_BaseDomainAwareScorer):
             ice_score = ice_diff
 
         return self._sign * ice_score
+
+
+class MultiMetricScorer(_BaseDomainAwareScorer):
+    """Compute several scores sharing the outputs of the estimator.
+
+    The predictions, probabilities and features of the estimator are only
+    computed on the samples needed by the scorers, once per sample and per
+    call, and reused by all the scorers. It returns a dict of scores, so
+    it can be passed as `scoring` to
+    :func:`~sklearn.model_selection.cross_validate` or
+    :class:`~sklearn.model_selection.GridSearchCV` (with `refit` set to
+    the name of one of the scores).
+
+    The outputs are shared by :class:`PredictionEntropyScorer`,
+    :class:`SoftNeighborhoodDensity`, :class:`DeepEmbeddedValidation`,
+    :class:`CircularValidation` and :class:`MixValScorer`. The other
+    scorers are called as usual.
+
+    Parameters
+    ----------
+    scorers : dict
+        Mapping of the score names to the scorers, with signature
+        ``scorer(estimator, X, y, sample_domain=None)``.
+    """
+
+    def __init__(self, scorers):
+        super().__init__()
+        self.scorers = scorers
+
+    def _score(self, estimator, X, y, sample_domain=None, predictions=None, **params):
+        """
+        Compute the scores of all the scorers.
+
+        Parameters
+        ----------
+        estimator : object
+            A trained estimator.
+        X : array-like
+            The input samples.
+        y : array-like
+            The labels, masked for the target samples.
+        sample_domain : array-like, default=None
+            Domain labels for each sample.
+
+        Returns
+        -------
+        scores : dict
+            The score of each scorer, with the same keys as `scorers`.
+        """
+        X, y, sample_domain = check_X_y_domain(X, y, sample_domain, allow_nd=True)
+        predictions = _SharedPredictions(estimator, X, sample_domain, **params)
+
+        scores = {}
+        for name, scorer in self.scorers.items():
+            if isinstance(scorer, _BaseDomainAwareScorer):
+                scores[name] = scorer._score(
+                    estimator,
+                    X,
+                    y,
+                    sample_domain=sample_domain,
+                    predictions=predictions,
+                    **params,
+                )
+            else:
+                scores[name] = scorer(
+                    estimator, X, y, sample_domain=sample_domain, **params
+                )
+        return scores
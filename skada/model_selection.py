@@ -25,7 +25,12 @@ except ImportError:
 from sklearn.utils.metadata_routing import _MetadataRequester
 from sklearn.utils.validation import check_array
 
-from .utils import check_X_domain, extract_domains_indices, extract_source_indices
+from .utils import (
+    _as_domain_index,
+    check_X_domain,
+    extract_domains_indices,
+    extract_source_indices,
+)
 
 
 class SplitSampleDomainRequesterMixin(_MetadataRequester):
@@ -141,8 +146,11 @@ class SourceTargetShuffleSplit(BaseDomainAwareShuffleSplit):
         self._default_test_size = 0.1
 
     def _iter_indices(self, X, y=None, sample_domain=None):
-        X, sample_domain = check_X_domain(X, sample_domain, allow_nd=True)
-        indices = extract_source_indices(sample_domain)
+        domain_index = _as_domain_index(sample_domain)
+        X, sample_domain = check_X_domain(X, domain_index, allow_nd=True)
+        indices = extract_source_indices(
+            sample_domain if domain_index is None else domain_index
+        )
         (source_idx,) = np.where(indices)
         (target_idx,) = np.where(~indices)
         n_source_samples = _num_samples(source_idx)
@@ -259,8 +267,11 @@ class LeaveOneDomainOut(SplitSampleDomainRequesterMixin):
                 yield split_idx[train_idx], split_idx[test_idx]
 
     def _iter_indices(self, X, y=None, sample_domain=None):
-        X, sample_domain = check_X_domain(X, sample_domain, allow_nd=True)
-        indices = extract_source_indices(sample_domain)
+        domain_index = _as_domain_index(sample_domain)
+        X, sample_domain = check_X_domain(X, domain_index, allow_nd=True)
+        indices = extract_source_indices(
+            sample_domain if domain_index is None else domain_index
+        )
         (source_idx,) = np.where(indices)
         (target_idx,) = np.where(~indices)
         n_source_samples = _num_samples(source_idx)
@@ -541,9 +552,11 @@ class DomainShuffleSplit(BaseDomainAwareShuffleSplit):
             raise ValueError("under_sampling should be between 0 and 1")
 
     def _iter_indices(self, X, y=None, sample_domain=None):
-        X, sample_domain = check_X_domain(X, sample_domain, allow_nd=True)
+        domain_index = _as_domain_index(sample_domain)
+        X, sample_domain = check_X_domain(X, domain_index, allow_nd=True)
         domain_source_idx_dict, domain_target_idx_dict = extract_domains_indices(
-            sample_domain, split_source_target=True
+            sample_domain if domain_index is None else domain_index,
+            split_source_target=True,
         )
         rng = check_random_state(self.random_state)
         for _ in range(self.n_splits):
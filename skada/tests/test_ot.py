@@ -3,13 +3,21 @@
 # License: BSD 3-Clause
 
 import numpy as np
+import ot
+import pytest
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LogisticRegression, Ridge
 from sklearn.preprocessing import OneHotEncoder, StandardScaler
 from sklearn.svm import SVC
 
 from skada import JDOTClassifier, JDOTRegressor, make_da_pipeline
-from skada._ot import get_jdot_class_cost_matrix, get_tgt_loss_jdot_class
+from skada._ot import (
+    _get_minibatches,
+    _solve_ot,
+    get_jdot_class_cost_matrix,
+    get_tgt_loss_jdot_class,
+    solve_jdot_regression,
+)
 from skada.metrics import PredictionEntropyScorer
 from skada.utils import source_target_split
 
@@ -41,6 +49,91 @@ def test_JDOTRegressor(da_reg_dataset):
         jdot = JDOTRegressor(StandardScaler())
 
 
+def test_JDOTRegressor_minibatch(da_reg_dataset):
+    X, y, sample_domain = da_reg_dataset.pack(as_sources=["s"], as_targets=["t"])
+    rng = np.random.default_rng(42)
+    w = rng.uniform(size=(X.shape[0],))
+    Xs, Xt, ys, yt = source_target_split(X, y, sample_domain=sample_domain)
+
+    jdot = JDOTRegressor(Ridge(), alpha=0.1, batch_size=32, random_state=0)
+    jdot.fit(X, y, sample_weight=w, sample_domain=sample_domain)
+    ypred = jdot.predict(Xt)
+    assert ypred.shape[0] == Xt.shape[0]
+
+    # the sparse plan has the target weights as marginal
+    plan = jdot.sol_.sparse_plan
+    assert plan.shape == (Xs.shape[0], Xt.shape[0])
+    wt = w[sample_domain < 0]
+    assert np.allclose(np.asarray(plan.sum(axis=0)).ravel(), wt / wt.sum())
+    assert np.isclose(plan.sum(), 1)
+
+    # a single batch gives the exact solution
+    jdot_exact = JDOTRegressor(Ridge(), alpha=0.1)
+    jdot_exact.fit(X, y, sample_domain=sample_domain)
+    jdot_batch = JDOTRegressor(Ridge(), alpha=0.1, batch_size=X.shape[0])
+    jdot_batch.fit(X, y, sample_domain=sample_domain)
+    assert np.allclose(jdot_exact.predict(Xt), jdot_batch.predict(Xt))
+    assert np.allclose(jdot_exact.lst_loss_ot_, jdot_batch.lst_loss_ot_)
+
+
+@pytest.mark.parametrize("n_source, n_target", [(5, 200), (200, 5)])
+def test_JDOTRegressor_minibatch_imbalanced(n_source, n_target):
+    rng = np.random.default_rng(0)
+    Xs = rng.normal(size=(n_source, 2))
+    ys = Xs[:, 0] + 0.1 * rng.normal(size=n_source)
+    Xt = rng.normal(size=(n_target, 2)) + 1
+
+    batches = _get_minibatches(n_source, n_target, 20, np.random.RandomState(0))
+    assert len(batches) == 10
+    assert all(len(idx_s) > 0 and len(idx_t) > 0 for idx_s, idx_t in batches)
+
+    for reg in [None, 1e-1]:
+        estimator, lst_loss_ot, lst_loss, sol = solve_jdot_regression(
+            Ridge(), Xs, ys, Xt, batch_size=20, reg=reg, random_state=0
+        )
+        plan = sol.sparse_plan
+        assert np.all(np.isfinite(lst_loss_ot))
+        assert np.all(np.isfinite(plan.data))
+        # the sparse plan keeps the marginals
+        assert np.allclose(np.asarray(plan.sum(axis=0)).ravel(), 1 / n_target)
+        if reg is None:
+            assert np.allclose(np.asarray(plan.sum(axis=1)).ravel(), 1 / n_source)
+
+
+def test_JDOT_entropic_warmstart(da_reg_dataset, da_multiclass_dataset):
+    X, y, sample_domain = da_reg_dataset.pack(as_sources=["s"], as_targets=["t"])
+    Xs, Xt, ys, yt = source_target_split(X, y, sample_domain=sample_domain)
+
+    res = solve_jdot_regression(Ridge(), Xs, ys, Xt, alpha=0.1, reg=0.1, log=True)
+    estimator, lst_loss_ot, lst_loss_tgt_labels, sol, log = res
+    assert len(log["ot_times"]) == len(lst_loss_ot)
+    assert len(log["fit_times"]) == len(lst_loss_ot)
+    assert np.allclose(sol.plan.sum(axis=0), 1 / Xt.shape[0])
+
+    # the warm start of the previous iteration is the solution of the problem
+    M = ot.dist(Xs, Xt)
+    a = np.ones(Xs.shape[0]) / Xs.shape[0]
+    b = np.ones(Xt.shape[0]) / Xt.shape[0]
+    sol_cold = _solve_ot(M / M.mean(), a, b, reg=0.1)
+    sol_warm = _solve_ot(
+        M / M.mean(), a, b, reg=0.1, warmstart=sol_cold.log["warmstart"]
+    )
+    assert sol_warm.log["niter"] < sol_cold.log["niter"]
+    assert np.allclose(sol_warm.plan, sol_cold.plan, atol=1e-7)
+
+    jdot = JDOTRegressor(Ridge(), alpha=0.1, reg=0.1, batch_size=32)
+    jdot.fit(X, y, sample_domain=sample_domain)
+    assert len(jdot.log_["ot_times"]) == len(jdot.lst_loss_ot_)
+    assert jdot.predict(Xt).shape[0] == Xt.shape[0]
+
+    X, y, sample_domain = da_multiclass_dataset.pack(as_sources=["s"], as_targets=["t"])
+    Xs, Xt, ys, yt = source_target_split(X, y, sample_domain=sample_domain)
+    jdot = JDOTClassifier(LogisticRegression(), alpha=0.1, reg=0.1)
+    jdot.fit(X, y, sample_domain=sample_domain)
+    assert jdot.predict(Xt).shape[0] == Xt.shape[0]
+    assert len(jdot.log_["fit_times"]) == len(jdot.lst_loss_ot_)
+
+
 def test_JDOTRegressor_pipeline(da_reg_dataset):
     X, y, sample_domain = da_reg_dataset.pack(as_sources=["s"], as_targets=["t"])
     Xs, Xt, ys, yt = source_target_split(X, y, sample_domain=sample_domain)
@@ -122,6 +215,24 @@ def test_JDOTClassifier(da_multiclass_dataset, da_binary_dataset):
         setattr(LogisticRegression, "predict_log_proba", lp)
 
 
+def test_JDOTClassifier_minibatch(da_multiclass_dataset):
+    X, y, sample_domain = da_multiclass_dataset.pack(as_sources=["s"], as_targets=["t"])
+    Xs, Xt, ys, yt = source_target_split(X, y, sample_domain=sample_domain)
+
+    jdot = JDOTClassifier(LogisticRegression(), alpha=0.1, batch_size=32)
+    jdot.fit(X, y, sample_domain=sample_domain)
+    ypred = jdot.predict(Xt)
+    assert ypred.shape[0] == Xt.shape[0]
+    assert jdot.sol_.sparse_plan.shape == (Xs.shape[0], Xt.shape[0])
+
+    # a single batch gives the exact solution
+    jdot_exact = JDOTClassifier(LogisticRegression(), alpha=0.1)
+    jdot_exact.fit(X, y, sample_domain=sample_domain)
+    jdot_batch = JDOTClassifier(LogisticRegression(), alpha=0.1, batch_size=X.shape[0])
+    jdot_batch.fit(X, y, sample_domain=sample_domain)
+    assert np.allclose(jdot_exact.predict_proba(Xt), jdot_batch.predict_proba(Xt))
+
+
 def test_jdot_class_cost_matrix(da_multiclass_dataset):
     X, y, sample_domain = da_multiclass_dataset.pack(as_sources=["s"], as_targets=["t"])
 
@@ -156,6 +267,39 @@ def test_jdot_class_cost_matrix(da_multiclass_dataset):
         M = get_jdot_class_cost_matrix(Ys, Xt, est, metric="bad_metric")
 
 
+def test_jdot_class_cost_matrix_blocked(da_multiclass_dataset):
+    X, y, sample_domain = da_multiclass_dataset.pack(as_sources=["s"], as_targets=["t"])
+    Xs, Xt, ys, yt = source_target_split(X, y, sample_domain=sample_domain)
+
+    rng = np.random.default_rng(42)
+    Ys = OneHotEncoder().fit_transform(ys[:, None]).toarray()
+    Ys_soft = rng.dirichlet(np.ones(Ys.shape[1]), size=Ys.shape[0])
+
+    est = LogisticRegression().fit(Xs, ys)
+    Yt_pred = est.predict_log_proba(Xt)
+    for Y in [Ys, Ys_soft]:
+        M_ref = -np.sum(Y[:, None, :] * Yt_pred[None, :, :], 2)
+        M = get_jdot_class_cost_matrix(Y, Xt, est)
+        assert np.allclose(M, M_ref)
+
+    est = SVC().fit(Xs, ys)
+    Yt_pred = est.decision_function(Xt)
+    for Y in [Ys, Ys_soft]:
+        M_ref = np.maximum(0, 1 - (2 * Y[:, None, :] - 1) * Yt_pred[None, :, :]).sum(2)
+        for chunk_size in [None, 7]:
+            M = get_jdot_class_cost_matrix(
+                Y, Xt, est, metric="hinge", chunk_size=chunk_size
+            )
+            assert np.allclose(M, M_ref)
+
+    M_ref = get_jdot_class_cost_matrix(Ys, Xt, est, metric="hinge")
+    M = get_jdot_class_cost_matrix(Ys, Xt, est, metric="hinge", dtype=np.float32)
+    assert M.dtype == np.float32
+    assert np.allclose(M, M_ref, atol=1e-4)
+    M = get_jdot_class_cost_matrix(Ys, Xt, None, dtype=np.float32)
+    assert M.dtype == np.float32
+
+
 def test_jdot_class_tgt_loss(da_multiclass_dataset):
     X, y, sample_domain = da_multiclass_dataset.pack(as_sources=["s"], as_targets=["t"])
 
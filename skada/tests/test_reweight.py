@@ -8,6 +8,8 @@
 import numpy as np
 import pytest
 from sklearn.linear_model import LogisticRegression, Ridge
+from sklearn.metrics.pairwise import rbf_kernel
+from sklearn.model_selection import KFold
 from sklearn.preprocessing import StandardScaler
 from sklearn.utils import check_random_state
 
@@ -76,6 +78,9 @@ from skada.utils import source_target_split
             ),
             LogisticRegression().set_fit_request(sample_weight=True),
         ),
+        NearestNeighborReweight(
+            laplace_smoothing=True, algorithm="rp_forest", random_state=0
+        ),
         make_da_pipeline(
             KMMReweightAdapter(gamma=0.1),
             LogisticRegression().set_fit_request(sample_weight=True),
@@ -84,11 +89,15 @@ from skada.utils import source_target_split
         KMMReweight(eps=0.1),
         KMMReweight(solver="frank-wolfe"),
         KMMReweight(solver="scipy"),
+        KMMReweight(solver="admm"),
+        KMMReweight(approximation="nystroem", n_components=50, random_state=0),
+        KMMReweight(approximation="rff", n_components=50, random_state=0),
         make_da_pipeline(
             MMDTarSReweightAdapter(gamma=1.0),
             LogisticRegression().set_fit_request(sample_weight=True),
         ),
         MMDTarSReweight(gamma=1.0),
+        MMDTarSReweight(gamma=1.0, solver="admm"),
     ],
 )
 def test_reweight_estimator(estimator, da_dataset):
@@ -214,6 +223,11 @@ def _base_test_new_X_adapt(estimator, da_dataset):
         (KLIEPReweightAdapter(gamma=[0.1, 1, "auto", "scale"], random_state=42)),
         (KMMReweightAdapter(gamma=0.1, smooth_weights=True)),
         (KMMReweightAdapter(gamma=0.1, smooth_weights=True)),
+        (
+            KMMReweightAdapter(
+                gamma=0.1, smooth_weights=True, approximation="nystroem", random_state=0
+            )
+        ),
         (MMDTarSReweightAdapter(gamma=1.0)),
         (MMDTarSReweightAdapter(gamma=1.0)),
     ],
@@ -251,9 +265,159 @@ def test_reweight_warning(da_dataset):
         estimator.fit(X_train, y_train, sample_domain=sample_domain)
 
 
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_KLIEPReweight_batched_cross_validation(da_dataset, n_jobs):
+    X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    X_source, X_target = source_target_split(X, sample_domain=sample_domain)
+    gammas = [0.01, 0.1, 1.0, 10.0]
+    estimator = KLIEPReweightAdapter(gamma=gammas, cv=3, random_state=0, n_jobs=n_jobs)
+    best_gamma = estimator._likelihood_cross_validation(gammas, X_source, X_target)
+
+    # same selection as solving each (gamma, fold) problem independently
+    log_liks = []
+    for gamma in gammas:
+        log_lik = []
+        for train, test in KFold(n_splits=3).split(X_target):
+            alpha, centers = estimator._weights_optimization(
+                gamma, X_source, X_target[train]
+            )
+            weights = rbf_kernel(X_target[test], centers, gamma=gamma) @ alpha
+            log_lik.append(np.mean(np.log(weights + np.finfo(float).eps)))
+        log_liks.append(np.mean(log_lik))
+    assert best_gamma == gammas[np.argmax(log_liks)]
+
+
+@pytest.mark.parametrize(
+    "estimator",
+    [
+        DensityReweightAdapter(),
+        GaussianReweightAdapter(),
+        DiscriminatorReweightAdapter(),
+        KLIEPReweightAdapter(gamma=1.0, random_state=42),
+    ],
+)
+def test_batched_compute_weights(estimator, da_dataset, tmp_path):
+    X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    # interleave source and target samples over the batches
+    rng = check_random_state(0)
+    order = rng.permutation(X.shape[0])
+    X, sample_domain = X[order], sample_domain[order]
+    estimator.fit(X, sample_domain=sample_domain)
+    weights = estimator.compute_weights(X, sample_domain=sample_domain)
+
+    estimator.set_params(batch_size=7)
+    assert np.allclose(
+        weights, estimator.compute_weights(X, sample_domain=sample_domain)
+    )
+
+    # memory-mapped array and preallocated buffer
+    X_mmap = np.memmap(tmp_path / "X.dat", dtype=X.dtype, mode="w+", shape=X.shape)
+    X_mmap[:] = X
+    out = np.empty(X.shape[0])
+    weights_mmap = estimator.compute_weights(
+        X_mmap, sample_domain=sample_domain, out=out
+    )
+    assert weights_mmap is out
+    assert np.allclose(weights, out)
+
+    # generator of batches
+    batches = (
+        (X[start : start + 11], sample_domain[start : start + 11])
+        for start in range(0, X.shape[0], 11)
+    )
+    assert np.allclose(weights, estimator.compute_weights_batches(batches))
+
+    with pytest.raises(ValueError, match="`out` has"):
+        estimator.compute_weights(X, sample_domain=sample_domain, out=np.empty(3))
+
+
+def test_batched_compute_weights_not_supported(da_dataset):
+    X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    estimator = KMMReweightAdapter(gamma=0.1).fit(X, sample_domain=sample_domain)
+    assert not hasattr(estimator, "compute_weights_batches")
+
+
+def test_NearestNeighborReweight_index_cache(da_dataset):
+    X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    X_source, X_target = source_target_split(X, sample_domain=sample_domain)
+    estimator = NearestNeighborReweightAdapter(n_neighbors=3, weights="distance")
+    estimator.fit(X, sample_domain=sample_domain)
+    weights = estimator.compute_weights(X, sample_domain=sample_domain)
+
+    # the index fitted on the same source data is reused
+    assert estimator._get_estimator(X_source) is estimator.estimator_
+    # new source data are fitted once and cached
+    new_estimator = estimator._get_estimator(X_source + 1)
+    assert new_estimator is not estimator.estimator_
+    assert estimator._get_estimator(X_source + 1) is new_estimator
+
+    estimator.set_params(batch_size=7, n_jobs=2)
+    assert np.allclose(
+        weights, estimator.compute_weights(X, sample_domain=sample_domain)
+    )
+
+
+@pytest.mark.parametrize("n_neighbors, weights", [(1, "uniform"), (3, "distance")])
+def test_NearestNeighborReweight_rp_forest(da_dataset, n_neighbors, weights):
+    X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    exact = NearestNeighborReweightAdapter(n_neighbors=n_neighbors, weights=weights)
+    exact.fit(X, sample_domain=sample_domain)
+    # with leaves larger than the dataset, the search is exact
+    estimator = NearestNeighborReweightAdapter(
+        n_neighbors=n_neighbors,
+        weights=weights,
+        algorithm="rp_forest",
+        leaf_size=X.shape[0],
+        batch_size=10,
+        n_jobs=2,
+        random_state=0,
+    )
+    estimator.fit(X, sample_domain=sample_domain)
+    assert np.allclose(
+        exact.compute_weights(X, sample_domain=sample_domain),
+        estimator.compute_weights(X, sample_domain=sample_domain),
+    )
+
+    # approximate search
+    estimator.set_params(leaf_size=5, n_trees=5)
+    estimator.fit(X, sample_domain=sample_domain)
+    approx_weights = estimator.compute_weights(X, sample_domain=sample_domain)
+    assert approx_weights.shape == (X.shape[0],)
+    assert np.all(approx_weights >= 0)
+
+    with pytest.raises(ValueError, match="euclidean"):
+        NearestNeighborReweightAdapter(algorithm="rp_forest", p=1).fit(
+            X, sample_domain=sample_domain
+        )
+
+
 def test_KMMReweight_kernel_error():
     with pytest.raises(ValueError, match="got 'hello'"):
         KMMReweightAdapter(kernel="hello")
+    with pytest.raises(ValueError, match="got 'hello'"):
+        KMMReweightAdapter(approximation="hello")
+    with pytest.raises(ValueError, match="got 'linear'"):
+        KMMReweightAdapter(kernel="linear", approximation="rff")
+
+
+@pytest.mark.parametrize("approximation", ["nystroem", "rff"])
+def test_KMMReweight_approximation(approximation):
+    X, y, sample_domain = make_shifted_datasets(
+        n_samples_source=20,
+        n_samples_target=20,
+        noise=0.1,
+        random_state=42,
+    )
+    exact = KMMReweightAdapter(gamma=1.0)
+    exact.fit(X, sample_domain=sample_domain)
+    estimator = KMMReweightAdapter(
+        gamma=1.0, approximation=approximation, n_components=200, random_state=0
+    )
+    estimator.fit(X, sample_domain=sample_domain)
+
+    assert estimator.weighted_source_features_.shape[0] <= 200
+    assert estimator.source_weights_.shape == exact.source_weights_.shape
+    assert np.corrcoef(estimator.source_weights_, exact.source_weights_)[0, 1] > 0.8
 
 
 # KMMReweight.adapt behavior should be the same when smooth weights is True or
@@ -5,6 +5,8 @@
 #
 # License: BSD 3-Clause
 
+import pickle
+
 import numpy as np
 import pytest
 from sklearn.dummy import DummyClassifier, DummyRegressor
@@ -15,6 +17,7 @@ from sklearn.svm import SVC
 
 from skada import (
     DensityReweightAdapter,
+    PerDomain,
     SubspaceAlignmentAdapter,
     make_da_pipeline,
 )
@@ -24,6 +27,7 @@ from skada.metrics import (
     DeepEmbeddedValidation,
     ImportanceWeightedScorer,
     MixValScorer,
+    MultiMetricScorer,
     PredictionEntropyScorer,
     SoftNeighborhoodDensity,
     SupervisedScorer,
@@ -168,6 +172,82 @@ def test_prediction_entropy_scorer_reduction(da_dataset):
         scorer._score(estimator, X, y, sample_domain=sample_domain)
 
 
+def test_importance_weighted_scorer_cache(da_dataset):
+    X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    estimator = make_da_pipeline(
+        DensityReweightAdapter(),
+        LogisticRegression()
+        .set_fit_request(sample_weight=True)
+        .set_score_request(sample_weight=True),
+    )
+    estimator.fit(X, y, sample_domain=sample_domain)
+
+    scorer = ImportanceWeightedScorer(cache_size=1)
+    score = scorer(estimator, X, y, sample_domain=sample_domain)
+    weight_estimator = scorer.weight_estimator_source_
+
+    # the weights of the same split are not estimated again
+    assert scorer(estimator, X.copy(), y, sample_domain=sample_domain) == score
+    assert scorer.weight_estimator_source_ is weight_estimator
+
+    # only the last split is kept
+    scorer(estimator, X[1:], y[1:], sample_domain=sample_domain[1:])
+    assert len(scorer._weights_cache) == 1
+    scorer(estimator, X, y, sample_domain=sample_domain)
+    assert scorer.weight_estimator_source_ is not weight_estimator
+
+    # the cache is not copied with the scorer
+    assert len(pickle.loads(pickle.dumps(scorer))._weights_cache) == 0
+    scorer.clear_cache()
+    assert len(scorer._weights_cache) == 0
+
+    # the cache size is read when the cache is used
+    scorer.cache_size = 0
+    scorer(estimator, X, y, sample_domain=sample_domain)
+    assert len(scorer._weights_cache) == 0
+
+    no_cache_scorer = ImportanceWeightedScorer(cache_size=0)
+    assert no_cache_scorer(estimator, X, y, sample_domain=sample_domain) == score
+    assert len(no_cache_scorer._weights_cache) == 0
+
+    approximate_scorer = ImportanceWeightedScorer(rtol=1e-4)
+    assert approximate_scorer(
+        estimator, X, y, sample_domain=sample_domain
+    ) == pytest.approx(score, rel=1e-3)
+
+
+def test_soft_neighborhood_density_approximations(da_dataset):
+    X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    estimator = make_da_pipeline(
+        DensityReweightAdapter(),
+        LogisticRegression().set_fit_request(sample_weight=True),
+    )
+    estimator.fit(X, y, sample_domain=sample_domain)
+    n_target = np.sum(sample_domain < 0)
+
+    score = SoftNeighborhoodDensity()(estimator, X, y, sample_domain=sample_domain)
+
+    # the chunks of the similarity matrix do not change the score
+    scorer = SoftNeighborhoodDensity(working_memory=0.001)
+    assert scorer(estimator, X, y, sample_domain=sample_domain) == pytest.approx(score)
+
+    # with all the neighbors, only the similarity to the sample itself is lost
+    scorer = SoftNeighborhoodDensity(n_neighbors=n_target - 1)
+    assert scorer(estimator, X, y, sample_domain=sample_domain) == pytest.approx(
+        score, rel=1e-6
+    )
+    scorer = SoftNeighborhoodDensity(n_neighbors=5)
+    assert np.isfinite(scorer(estimator, X, y, sample_domain=sample_domain))
+
+    scorer = SoftNeighborhoodDensity(max_samples=0.5, random_state=0)
+    score_subsample = scorer(estimator, X, y, sample_domain=sample_domain)
+    low, high = scorer.confidence_interval_
+    assert low <= score_subsample <= high
+    scorer = SoftNeighborhoodDensity(max_samples=n_target)
+    assert scorer(estimator, X, y, sample_domain=sample_domain) == pytest.approx(score)
+    assert scorer.confidence_interval_ == pytest.approx((score, score))
+
+
 def test_circular_validation(da_dataset):
     X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
     _, unmasked_y, _ = da_dataset.pack_test(as_targets=["t"])
@@ -228,6 +308,50 @@ def test_circular_validation(da_dataset):
     assert ~np.isnan(score), "the score is computed"
 
 
+def test_circular_validation_warm_start(da_dataset, monkeypatch):
+    X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    estimator = make_da_pipeline(
+        SubspaceAlignmentAdapter(n_components=2), LogisticRegression(tol=1e-8)
+    )
+    estimator.fit(X, y, sample_domain=sample_domain)
+
+    score = CircularValidation()(estimator, X, y, sample_domain=sample_domain)
+
+    # the backward fit continues from the fitted forward classifier
+    backward_fits = []
+    fit = LogisticRegression.fit
+
+    def record_fit(self, X, y, **params):
+        backward_fits.append((self.warm_start, hasattr(self, "coef_")))
+        return fit(self, X, y, **params)
+
+    monkeypatch.setattr(LogisticRegression, "fit", record_fit)
+    scorer = CircularValidation(warm_start=True)
+    assert scorer(estimator, X, y, sample_domain=sample_domain) == pytest.approx(score)
+    assert backward_fits == [(True, True)]
+    assert not estimator[-1].base_estimator.warm_start
+    assert not estimator[-1].base_estimator_.warm_start
+    monkeypatch.setattr(LogisticRegression, "fit", fit)
+
+    # the selectors cloning their estimators can not be warm started
+    per_domain = make_da_pipeline(
+        SubspaceAlignmentAdapter(n_components=2), PerDomain(LogisticRegression())
+    )
+    with pytest.raises(ValueError, match="can not be warm started"):
+        scorer(per_domain, X, y, sample_domain=sample_domain)
+    no_warm_start = make_da_pipeline(SubspaceAlignmentAdapter(n_components=2), SVC())
+    with pytest.raises(ValueError, match="has no warm_start parameter"):
+        scorer(no_warm_start, X, y, sample_domain=sample_domain)
+
+    # the estimators that can not be copied are fitted from scratch
+    def fail_deepcopy(self, memo):
+        raise TypeError("can not be copied")
+
+    monkeypatch.setattr(type(estimator), "__deepcopy__", fail_deepcopy, raising=False)
+    with pytest.warns(UserWarning, match="warm_start is ignored"):
+        assert scorer(estimator, X, y, sample_domain=sample_domain) == score
+
+
 def test_deep_embedding_validation_no_transform(da_dataset):
     # Test that the scorer runs
     # even if the adapter does not have a `transform` method
@@ -249,6 +373,29 @@ def test_deep_embedding_validation_no_transform(da_dataset):
     assert np.all(~np.isnan(scores)), "all scores are computed"
 
 
+def test_deep_embedding_validation_cache(da_dataset):
+    X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    estimator = make_da_pipeline(
+        SubspaceAlignmentAdapter(n_components=2), LogisticRegression()
+    )
+    estimator.fit(X, y, sample_domain=sample_domain)
+
+    scorer = DeepEmbeddedValidation(random_state=0)
+    score = scorer(estimator, X, y, sample_domain=sample_domain)
+    domain_classifier = scorer.domain_classifier_
+
+    # the domain classifier of the same split is not fitted again
+    assert scorer(estimator, X, y, sample_domain=sample_domain) == score
+    assert scorer.domain_classifier_ is domain_classifier
+    scorer.clear_cache()
+    assert scorer(estimator, X, y, sample_domain=sample_domain) == score
+    assert scorer.domain_classifier_ is not domain_classifier
+
+    # the features can be extracted by chunks
+    scorer = DeepEmbeddedValidation(random_state=0, batch_size=7, cache_size=0)
+    assert scorer(estimator, X, y, sample_domain=sample_domain) == pytest.approx(score)
+
+
 def test_mixval_scorer(da_dataset):
     X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
     estimator = make_da_pipeline(
@@ -392,3 +539,61 @@ def test_scorer_with_nd_input(scorer, da_dataset):
 
     assert scores.shape[0] == 3, "evaluate 3 splits"
     assert np.all(~np.isnan(scores)), "all scores are computed"
+
+
+def test_multi_metric_scorer(da_dataset, monkeypatch):
+    X, y, sample_domain = da_dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    estimator = make_da_pipeline(
+        SubspaceAlignmentAdapter(n_components=2),
+        LogisticRegression().set_score_request(sample_weight=True),
+    )
+    estimator.fit(X, y, sample_domain=sample_domain)
+
+    scorers = {
+        "entropy": PredictionEntropyScorer(),
+        "snd": SoftNeighborhoodDensity(),
+        "dev": DeepEmbeddedValidation(random_state=0, cache_size=0),
+        "circular": CircularValidation(),
+        "mixval": MixValScorer(random_state=0),
+    }
+    expected = {
+        name: scorer(estimator, X, y, sample_domain=sample_domain)
+        for name, scorer in scorers.items()
+    }
+
+    classifier = estimator[-1].base_estimator_
+    n_calls = []
+    for method in ["predict", "predict_proba"]:
+
+        def count_calls(self, X, method=method, original=getattr(classifier, method)):
+            if self is classifier:
+                n_calls.append((method, len(X)))
+            return original.__func__(self, X)
+
+        monkeypatch.setattr(LogisticRegression, method, count_calls)
+
+    scores = MultiMetricScorer(scorers)(estimator, X, y, sample_domain=sample_domain)
+    assert scores == pytest.approx(expected)
+    # the outputs are computed once on the target samples, and on the source
+    # validation samples of DEV, the other calls are on the mixed samples
+    n_target = np.sum(sample_domain < 0)
+    n_val = int(np.ceil(0.33 * np.sum(sample_domain >= 0)))
+    assert sorted(n for method, n in n_calls if method == "predict_proba") == sorted(
+        [n_target, n_val]
+    )
+    assert n_calls.count(("predict", n_target)) == 1
+
+    # the scorers that do not share the outputs are called as usual
+    scorers["iw"] = ImportanceWeightedScorer()
+
+    cv = ShuffleSplit(n_splits=3, test_size=0.3, random_state=0)
+    results = cross_validate(
+        estimator,
+        X,
+        y,
+        cv=cv,
+        params={"sample_domain": sample_domain},
+        scoring=MultiMetricScorer(scorers),
+    )
+    for name in scorers:
+        assert results[f"test_{name}"].shape[0] == 3, "evaluate 3 splits"
@@ -5,7 +5,8 @@
 
 import numpy as np
 import pytest
-from sklearn.base import BaseEstimator
+from joblib import parallel_backend
+from sklearn.base import BaseEstimator, clone
 from sklearn.datasets import make_regression
 from sklearn.linear_model import LogisticRegression
 from sklearn.preprocessing import StandardScaler
@@ -376,3 +377,46 @@ def test_source_target_selector_fails_on_missing_domain(da_multiclass_dataset):
 def test_source_target_selector_non_transformers():
     with pytest.raises(TypeError):
         SelectSourceTarget(StandardScaler(), SVC())
+
+
+@pytest.mark.parametrize("backend", ["threading", "loky"])
+def test_per_domain_selector_parallel(backend):
+    X, y, sample_domain = make_shifted_datasets(
+        n_samples_source=10,
+        n_samples_target=10,
+        shift="concept_drift",
+        noise=0.1,
+        random_state=42,
+    )
+    # several source and target domains
+    sample_domain = sample_domain * (1 + np.arange(X.shape[0]) % 3)
+
+    pipe = make_da_pipeline(
+        PerDomain(StandardScaler()), PerDomain(LogisticRegression())
+    )
+    pipe.fit(X, y, sample_domain=sample_domain)
+    X_transformed = pipe[:-1].transform(X, sample_domain=sample_domain)
+    y_proba = pipe.predict_proba(X, sample_domain=sample_domain)
+
+    pipe_parallel = make_da_pipeline(
+        PerDomain(StandardScaler(), domain_n_jobs=2),
+        PerDomain(LogisticRegression(), domain_n_jobs=2),
+    )
+    with parallel_backend(backend):
+        pipe_parallel.fit(X, y, sample_domain=sample_domain)
+        X_transformed_parallel = pipe_parallel[:-1].transform(
+            X, sample_domain=sample_domain
+        )
+        y_proba_parallel = pipe_parallel.predict_proba(X, sample_domain=sample_domain)
+
+    assert set(pipe_parallel[-1].estimators_) == set(np.unique(sample_domain))
+    assert np.allclose(X_transformed, X_transformed_parallel)
+    assert np.allclose(y_proba, y_proba_parallel)
+
+    # the parameter is kept by clone and set_params
+    selector = clone(PerDomain(LogisticRegression(C=0.1), domain_n_jobs=2))
+    assert selector.domain_n_jobs == 2
+    assert selector.base_estimator.C == 0.1
+    selector.set_params(domain_n_jobs=3, C=1.0)
+    assert selector.domain_n_jobs == 3
+    assert selector.base_estimator.C == 1.0
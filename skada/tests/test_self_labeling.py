@@ -5,6 +5,7 @@
 
 import numpy as np
 import pytest
+from sklearn.base import clone
 from sklearn.preprocessing import StandardScaler
 from sklearn.svm import SVC
 
@@ -87,3 +88,81 @@ def test_dasvm_estimator_predict_proba():
 
     with pytest.raises(AttributeError):
         clf_dasvm.predict_proba(X)
+
+
+def test_dasvm_warm_start():
+    X, y, sample_domain = make_shifted_datasets(
+        n_samples_source=20,
+        n_samples_target=20,
+        shift="covariate_shift",
+        noise=0.1,
+        label="binary",
+        random_state=0,
+    )
+    X, y, sample_domain = check_X_y_domain(X, y, sample_domain)
+    target_mask = sample_domain < 0
+
+    clf_dasvm = DASVMClassifier(k=3, save_estimators=True, save_indices=True).fit(
+        X, y, sample_domain=sample_domain
+    )
+    clf_dasvm_warm = DASVMClassifier(
+        k=3, save_estimators=True, save_indices=True, warm_start=True
+    ).fit(X, y, sample_domain=sample_domain)
+
+    Xs, Xt = X[~target_mask], X[target_mask]
+    ys = y[~target_mask]
+    n = Xs.shape[0]
+
+    def training_set(clf, i):
+        # `indices_*[0]` is the initial state, and `indices_*[i]` the state
+        # after round i - 1, on which the estimator of round i is fitted.
+        # The lists have one more entry than `estimators`, the state after
+        # the last round, and the last estimator is fitted on all the target
+        # samples (`indices_*[-1]`).
+        source_kept = ~clf.indices_source_deleted[i]
+        target_added = clf.indices_target_added[i]
+        ids = np.concatenate(
+            (np.flatnonzero(source_kept), n + np.flatnonzero(target_added))
+        )
+        X_train = np.concatenate((Xs[source_kept], Xt[target_added]))
+        y_train = np.concatenate(
+            (ys[source_kept], clf.estimators[i - 1].predict(Xt[target_added]))
+        )
+        return ids, X_train, y_train
+
+    n_rounds = len(clf_dasvm.estimators) - 1
+    assert len(clf_dasvm.indices_source_deleted) == n_rounds + 2
+    # without warm start, every round is fitted on its whole training set
+    for i in range(1, n_rounds):
+        ids, _, _ = training_set(clf_dasvm, i)
+        assert clf_dasvm.estimators[i].shape_fit_[0] == ids.shape[0]
+
+    # with warm start, the first round is the same and each next round is
+    # fitted on the support vectors of the previous round that are still in
+    # the training set, plus the samples new to the training set
+    n_rounds = len(clf_dasvm_warm.estimators) - 1
+    assert len(clf_dasvm_warm.indices_source_deleted) == n_rounds + 2
+    estimators = clf_dasvm_warm.estimators
+    assert np.allclose(
+        estimators[0].support_vectors_, clf_dasvm.estimators[0].support_vectors_
+    )
+    train_ids = fit_ids = np.arange(n)
+    n_dropped = 0
+    for i in range(1, n_rounds):
+        ids, X_train, y_train = training_set(clf_dasvm_warm, i)
+        support_ids = fit_ids[estimators[i - 1].support_]
+        keep = np.isin(ids, support_ids) | ~np.isin(ids, train_ids)
+        if np.unique(y_train[keep]).shape[0] < np.unique(y_train).shape[0]:
+            keep[:] = True
+        expected = clone(clf_dasvm_warm.base_estimator).fit(
+            X_train[keep], y_train[keep]
+        )
+        assert estimators[i].shape_fit_[0] == np.sum(keep)
+        assert np.allclose(estimators[i].support_vectors_, expected.support_vectors_)
+        n_dropped += ids.shape[0] - np.sum(keep)
+        train_ids, fit_ids = ids, ids[keep]
+    assert n_dropped > 0
+
+    assert clf_dasvm_warm.score(X[target_mask], y[target_mask]) >= (
+        clf_dasvm.score(X[target_mask], y[target_mask]) - 0.1
+    )
@@ -7,6 +7,7 @@
 
 import numpy as np
 import pytest
+import scipy.linalg
 from sklearn.linear_model import LogisticRegression
 from sklearn.neighbors import KNeighborsClassifier
 
@@ -26,7 +27,7 @@ from skada import (
     TransferSubspaceLearningAdapter,
     make_da_pipeline,
 )
-from skada.datasets import DomainAwareDataset
+from skada.datasets import DomainAwareDataset, make_shifted_datasets
 
 
 @pytest.mark.parametrize(
@@ -40,7 +41,14 @@ from skada.datasets import DomainAwareDataset
             TransferComponentAnalysisAdapter(n_components=1), LogisticRegression()
         ),
         TransferComponentAnalysis(n_components=1),
+        TransferComponentAnalysis(n_components=1, solver="lanczos", random_state=0),
+        TransferComponentAnalysis(
+            n_components=1, approximation="nystroem", random_state=0
+        ),
         TransferJointMatching(n_components=1, kernel="linear"),
+        TransferJointMatching(
+            n_components=1, kernel="linear", solver="lobpcg", random_state=0
+        ),
         make_da_pipeline(
             TransferJointMatchingAdapter(n_components=1, kernel="linear", verbose=True),
             LogisticRegression(),
@@ -90,9 +98,14 @@ def test_subspace_estimator(estimator, da_dataset):
         (TransferComponentAnalysisAdapter(), 5, 3, 3),
         (TransferComponentAnalysisAdapter(), 2, 3, 3),
         (TransferComponentAnalysisAdapter(), 2, 5, 4),
+        (TransferComponentAnalysisAdapter(solver="lanczos"), 5, 3, 3),
+        (TransferComponentAnalysisAdapter(solver="lanczos"), 2, 5, 4),
+        (TransferComponentAnalysisAdapter(approximation="nystroem"), 5, 3, 3),
+        (TransferComponentAnalysisAdapter(approximation="nystroem"), 2, 5, 4),
         (TransferJointMatchingAdapter(), 5, 3, 3),
         (TransferJointMatchingAdapter(), 2, 3, 3),
         (TransferJointMatchingAdapter(), 2, 5, 4),
+        (TransferJointMatchingAdapter(solver="lobpcg"), 5, 3, 3),
         pytest.param(
             TransferSubspaceLearningAdapter(),
             5,
@@ -143,6 +156,9 @@ def test_subspace_default_n_components(adapter, n_samples, n_features, n_compone
 @pytest.mark.parametrize(
     "adapter, param_name, param_value",
     [
+        (TransferComponentAnalysisAdapter, "solver", "wrong_solver"),
+        (TransferComponentAnalysisAdapter, "approximation", "rff"),
+        (TransferJointMatchingAdapter, "solver", "wrong_solver"),
         pytest.param(
             TransferSubspaceLearning,
             "base_method",
@@ -166,3 +182,124 @@ def test_subspace_default_n_components(adapter, n_samples, n_features, n_compone
 def test_instantiation_wrong_params(adapter, param_name, param_value):
     with pytest.raises(ValueError):
         adapter(**{param_name: param_value})
+
+
+def test_tca_lanczos_solver():
+    X, _, sample_domain = make_shifted_datasets(
+        n_samples_source=5, n_samples_target=5, random_state=0
+    )
+    n_samples = X.shape[0]
+    mu = 0.5
+    adapter = TransferComponentAnalysisAdapter(
+        n_components=3, mu=mu, solver="lanczos", random_state=0
+    ).fit(X, sample_domain=sample_domain)
+
+    # dense generalized eigenvalue problem KHK w = lambda (I + mu KLK) w
+    K = adapter.K_
+    n_source = np.sum(sample_domain >= 0)
+    n_target = n_samples - n_source
+    e = np.concatenate(
+        (np.full(n_source, 1 / n_source), np.full(n_target, -1 / n_target))
+    )
+    H = np.identity(n_samples) - 1 / n_samples
+    KLK = K @ np.outer(e, e) @ K
+    _, eigvects = scipy.linalg.eigh(K @ H @ K, np.identity(n_samples) + mu * KLK)
+    eigvects = eigvects[:, ::-1][:, :3]
+    eigvects /= np.linalg.norm(eigvects, axis=0)
+    np.testing.assert_allclose(
+        np.abs(np.sum(eigvects * adapter.eigvects_, axis=0)), 1, rtol=1e-6
+    )
+
+    # the Nystroem approximation is exact with all the samples as landmarks
+    adapter_nystroem = TransferComponentAnalysisAdapter(
+        n_components=3,
+        mu=mu,
+        approximation="nystroem",
+        n_landmarks=n_samples,
+        random_state=0,
+    ).fit(X, sample_domain=sample_domain)
+    assert not hasattr(adapter_nystroem, "K_")
+    np.testing.assert_allclose(
+        np.abs(np.sum(eigvects * adapter_nystroem.eigvects_, axis=0)), 1, rtol=1e-6
+    )
+    X_adapt = adapter.transform(X, sample_domain=sample_domain, allow_source=True)
+    X_adapt_nystroem = adapter_nystroem.transform(
+        X, sample_domain=sample_domain, allow_source=True
+    )
+    np.testing.assert_allclose(np.abs(X_adapt), np.abs(X_adapt_nystroem), atol=1e-6)
+
+
+def test_tjm_lobpcg_solver():
+    X, _, sample_domain = make_shifted_datasets(
+        n_samples_source=10, n_samples_target=10, random_state=0
+    )
+    adapter = TransferJointMatchingAdapter(n_components=2, tradeoff=0.1).fit(
+        X, sample_domain=sample_domain
+    )
+    adapter_lobpcg = TransferJointMatchingAdapter(
+        n_components=2, tradeoff=0.1, solver="lobpcg", random_state=0
+    ).fit(X, sample_domain=sample_domain)
+
+    # generalized eigenvalue problem of the first iteration
+    K = adapter._get_kernel_matrix(adapter.X_source_, adapter.X_target_)
+    n_samples = K.shape[0]
+    n_source = adapter.X_source_.shape[0]
+    e = np.concatenate(
+        (
+            np.full(n_source, 1 / n_source),
+            np.full(n_samples - n_source, -1 / (n_samples - n_source)),
+        )
+    )
+    H = np.identity(n_samples) - 1 / n_samples
+    B = K @ np.outer(e, e) @ K / (e @ e) + 0.1 * np.identity(n_samples)
+    C = K @ H @ K + 1e-10 * np.identity(n_samples)
+
+    phi = np.diag(adapter.A_.T @ B @ adapter.A_)
+    A = adapter_lobpcg.A_
+    np.testing.assert_allclose(A.T @ C @ A, np.identity(2), atol=1e-6)
+    np.testing.assert_allclose(np.diag(A.T @ B @ A), phi, rtol=1e-3)
+    residuals = np.linalg.norm(B @ A - C @ A * np.diag(A.T @ B @ A), axis=0)
+    assert np.all(residuals < 1e-8)
+
+
+@pytest.mark.parametrize(
+    "adapter",
+    [
+        TransferComponentAnalysisAdapter(n_components=2, solver="lanczos"),
+        TransferJointMatchingAdapter(n_components=2, solver="lobpcg"),
+    ],
+)
+def test_kernel_subspace_transform_landmarks(adapter):
+    X, _, sample_domain = make_shifted_datasets(
+        n_samples_source=10, n_samples_target=10, random_state=0
+    )
+    X_test, _, sample_domain_test = make_shifted_datasets(
+        n_samples_source=10, n_samples_target=10, random_state=1
+    )
+    adapter.set_params(random_state=0)
+    X_adapt = adapter.fit(X, sample_domain=sample_domain).transform(
+        X_test, sample_domain=sample_domain_test, allow_source=True
+    )
+    n_samples = X.shape[0]
+    assert adapter.transform_landmarks_.shape == X.shape
+
+    # transforming by batches does not change the output
+    adapter.set_params(batch_size=7)
+    np.testing.assert_allclose(
+        adapter.transform(X_test, sample_domain=sample_domain_test, allow_source=True),
+        X_adapt,
+    )
+
+    adapter.set_params(n_transform_landmarks=n_samples // 2)
+    adapter.fit(X, sample_domain=sample_domain)
+    assert adapter.transform_landmarks_.shape == (n_samples // 2, X.shape[1])
+    assert adapter.transform_coef_.shape == (n_samples // 2, 2)
+    X_adapt_landmarks = adapter.transform(
+        X_test, sample_domain=sample_domain_test, allow_source=True
+    )
+    assert X_adapt_landmarks.shape == X_adapt.shape
+    np.testing.assert_allclose(
+        np.abs(X_adapt_landmarks),
+        np.abs(X_adapt),
+        atol=1e-2 * np.abs(X_adapt).max(),
+    )
@@ -5,6 +5,7 @@
 
 import numpy as np
 import pytest
+from scipy.sparse.linalg import aslinearoperator
 from sklearn.utils import check_random_state
 
 from skada._utils import (
@@ -14,6 +15,8 @@ from skada._utils import (
 )
 from skada.datasets import make_dataset_from_moons_distribution
 from skada.utils import (
+    _QP_SOLVERS,
+    DomainIndex,
     check_X_domain,
     check_X_y_domain,
     extract_domains_indices,
@@ -21,6 +24,7 @@ from skada.utils import (
     frank_wolfe,
     per_domain_split,
     qp_solve,
+    register_qp_solver,
     source_target_merge,
     source_target_split,
     torch_minimize,
@@ -419,6 +423,48 @@ def test_extract_domains_indices():
     ), "domain_target_idx_dict shape mismatch"
 
 
+def test_domain_index():
+    rng = np.random.RandomState(0)
+    sample_domain = rng.choice([3, 1, -1, -2], size=100)
+    X = rng.randn(100, 2)
+
+    domain_index = DomainIndex(sample_domain)
+    np.testing.assert_array_equal(domain_index.domains, [-2, -1, 1, 3])
+    np.testing.assert_array_equal(
+        domain_index.counts, [np.sum(sample_domain == d) for d in [-2, -1, 1, 3]]
+    )
+    for domain, idx in domain_index.indices.items():
+        np.testing.assert_array_equal(idx, np.flatnonzero(sample_domain == domain))
+    np.testing.assert_array_equal(domain_index.source_mask, sample_domain >= 0)
+    np.testing.assert_array_equal(domain_index.target_mask, sample_domain < 0)
+    assert domain_index.n_sources == 2
+    assert domain_index.n_targets == 2
+    # the user array is neither modified nor frozen
+    assert sample_domain.flags.writeable
+
+    # the utils accept the index in place of the domain labels
+    X_source, X_target = source_target_split(X, sample_domain=domain_index)
+    np.testing.assert_array_equal(X_source, X[sample_domain >= 0])
+    np.testing.assert_array_equal(X_target, X[sample_domain < 0])
+    sources, targets = per_domain_split(X, sample_domain=domain_index)
+    assert set(sources) == {1, 3}
+    assert set(targets) == {-1, -2}
+    source_idx, target_idx = extract_domains_indices(
+        domain_index, split_source_target=True
+    )
+    assert set(source_idx) == {1, 3}
+    assert set(target_idx) == {-1, -2}
+    _, sample_domain_checked = check_X_domain(X, domain_index)
+    assert sample_domain_checked is domain_index.sample_domain
+    np.testing.assert_array_equal(sample_domain_checked, sample_domain)
+
+    # the source masks are writable copies
+    source_mask = extract_source_indices(domain_index)
+    assert source_mask.flags.writeable
+    assert source_mask is not domain_index.source_mask
+    assert extract_source_indices(sample_domain).flags.writeable
+
+
 def test_source_target_merge():
     # Test simple source-target merge with 2 domains
     X_source = np.array([[1, 2], [3, 4], [5, 6]])
@@ -652,6 +698,88 @@ def test_qp_solve_frank_wolfe():
         qp_solve(Q, c, A=A2, b=np.array([1.0, -2.0]), solver="frank-wolfe")
 
 
+def test_qp_solve_admm():
+    Q = np.array([[2.0, 0.5], [0.5, 1.0]])
+    c = np.array([1.0, 1.0])
+
+    Aeq = np.array([[1.0, 1.0]])
+    beq = np.array([1.0])
+
+    A = -np.eye(2)
+    b = np.zeros(2)
+
+    lb = np.array([0.0, 0.0])
+    ub = np.array([0.0, 0.0])
+
+    sol1 = np.array([0.25, 0.75])
+    sol2 = -np.linalg.inv(Q) @ c
+
+    res = qp_solve(Q, c, Aeq=Aeq, beq=beq, lb=lb, solver="admm")
+    assert np.allclose(res[0], sol1, atol=1e-4)
+
+    res = qp_solve(Q, c, A, b, Aeq=Aeq, beq=beq, solver="admm")
+    assert np.allclose(res[0], sol1, atol=1e-4)
+
+    res = qp_solve(Q, c, solver="admm")
+    assert np.allclose(res[0], sol2, atol=1e-4)
+
+    res = qp_solve(Q, c, lb=lb, ub=ub, solver="admm")
+    assert np.allclose(res[0], np.zeros(2))
+
+    # matrix-free solve with a LinearOperator
+    res = qp_solve(aslinearoperator(Q), c, Aeq=Aeq, beq=beq, lb=lb, solver="admm")
+    assert np.allclose(res[0], sol1, atol=1e-4)
+
+    # low-rank solve with the factor Q = F F^T
+    Q_op = aslinearoperator(Q)
+    Q_op.factor = np.linalg.cholesky(Q)
+    res = qp_solve(Q_op, c, Aeq=Aeq, beq=beq, lb=lb, solver="admm")
+    assert np.allclose(res[0], sol1, atol=1e-4)
+
+    res = qp_solve(Q, c, Aeq=Aeq, beq=beq, lb=lb, solver="admm", log=True)
+    log = res[2]
+    assert log["converged"]
+    assert len(log["primal_residuals"]) == log["n_iter"]
+    assert len(log["times"]) == log["n_iter"]
+
+    # warm start from a previous solution
+    res_warm = qp_solve(
+        Q,
+        c,
+        Aeq=Aeq,
+        beq=beq,
+        lb=lb,
+        x0=res[0],
+        solver="admm",
+        solver_options=dict(y0=log["y"], rho=log["rho"]),
+        log=True,
+    )
+    assert np.allclose(res_warm[0], sol1, atol=1e-4)
+    assert res_warm[2]["n_iter"] < log["n_iter"]
+
+    with pytest.warns(UserWarning, match="ADMM did not converge"):
+        qp_solve(Q, c, Aeq=Aeq, beq=beq, lb=lb, max_iter=1, solver="admm")
+
+
+def test_register_qp_solver():
+    Q = np.array([[2.0, 0.5], [0.5, 1.0]])
+    c = np.array([1.0, 1.0])
+
+    with pytest.raises(ValueError, match="`solver` argument should be included"):
+        qp_solve(Q, c, solver="unknown")
+
+    @register_qp_solver("unconstrained")
+    def solve(Q, c, A, b, Aeq, beq, lb, ub, x0, tol, max_iter, verbose, log):
+        x = -np.linalg.solve(Q, c)
+        return x, (1 / 2) * x @ Q @ x + x @ c
+
+    try:
+        res = qp_solve(Q, c, solver="unconstrained")
+        assert np.allclose(res[0], -np.linalg.inv(Q) @ c)
+    finally:
+        _QP_SOLVERS.pop("unconstrained")
+
+
 def test_frank_wolfe():
     Q = np.array([[2.0, 0.5], [0.5, 1.0]])
     c = np.array([1.0, 1.0])
@@ -672,6 +800,14 @@ def test_frank_wolfe():
     x1 = frank_wolfe(jac, Aeq, clb=0.5, cub=1.0, max_iter=1000)
     assert np.allclose(x1, sol / 2, atol=1e-3)
 
+    x3, log = frank_wolfe(
+        jac, Aeq, clb=1.0, cub=1.0, max_iter=10000, tol=1e-6, log=True
+    )
+    assert np.allclose(x3, sol, atol=1e-3)
+    assert log["n_iter"] < 10000
+    assert log["gaps"][-1] <= 1e-6
+    assert len(log["times"]) == log["n_iter"]
+
 
 @pytest.mark.skipif(not torch, reason="PyTorch not installed")
 def test_torch_minimize():
@@ -3,11 +3,13 @@
 #
 # License: BSD 3-Clause
 
+import time
 import warnings
 from itertools import chain
 from typing import Optional, Sequence, Set
 
 import numpy as np
+from scipy.linalg import LinAlgError, cho_factor, cho_solve, lu_factor, lu_solve
 from scipy.optimize import LinearConstraint, minimize
 from sklearn.utils import check_array, check_consistent_length
 
@@ -23,6 +25,99 @@ from skada._utils import (
 )
 
 
+class DomainIndex:
+    """Per-domain indices of a `sample_domain` array computed in a single pass.
+
+    The domain labels are sorted once with a stable argsort, which gives the
+    (sorted) indices of the samples of every domain as contiguous slices of
+    the permutation. All the domain helpers of :mod:`skada.utils` accept a
+    `DomainIndex` in place of `sample_domain`, so that the labels validated
+    and split several times are only scanned once when the same index is
+    passed to all of them. The selectors and the domain-aware splitters
+    build it once per call.
+
+    Parameters
+    ----------
+    sample_domain : array-like of shape (n_samples,)
+        Array specifying the domain labels for each sample.
+
+    Attributes
+    ----------
+    sample_domain : array of shape (n_samples,)
+        The domain labels, as int32.
+    domains : array of shape (n_domains,)
+        Sorted unique domain labels.
+    counts : array of shape (n_domains,)
+        Number of samples of each domain.
+    indices : dict
+        Maps each domain label to the (sorted) indices of its samples.
+    source_mask : array of shape (n_samples,)
+        Boolean mask of the source samples.
+    target_mask : array of shape (n_samples,)
+        Boolean mask of the target samples.
+    """
+
+    def __init__(self, sample_domain):
+        checked = check_array(
+            sample_domain,
+            dtype=np.int32,
+            ensure_2d=False,
+            input_name='sample_domain'
+        )
+        if np.may_share_memory(checked, sample_domain):
+            checked = checked.copy()
+        sample_domain = checked
+        order = np.argsort(sample_domain, kind='stable')
+        order.setflags(write=False)
+        sorted_domain = sample_domain[order]
+        starts = np.flatnonzero(sorted_domain[1:] != sorted_domain[:-1]) + 1
+        starts = np.concatenate(([0], starts))
+
+        self.sample_domain = sample_domain
+        self.domains = sorted_domain[starts]
+        self.counts = np.diff(np.append(starts, sample_domain.shape[0]))
+        self.indices = dict(zip(self.domains, np.split(order, starts[1:])))
+        self.source_mask = sample_domain >= 0
+        self.target_mask = ~self.source_mask
+        # the cached arrays are shared between the callers
+        for array in (
+            self.sample_domain, self.domains, self.counts,
+            self.source_mask, self.target_mask
+        ):
+            array.setflags(write=False)
+
+    @property
+    def n_samples(self):
+        return self.sample_domain.shape[0]
+
+    @property
+    def source_domains(self):
+        return self.domains[self.domains >= 0]
+
+    @property
+    def target_domains(self):
+        return self.domains[self.domains < 0]
+
+    @property
+    def n_sources(self):
+        return self.source_domains.shape[0]
+
+    @property
+    def n_targets(self):
+        return self.target_domains.shape[0]
+
+    def __repr__(self):
+        return (f"DomainIndex(n_samples={self.n_samples}, "
+                f"domains={self.domains.tolist()})")
+
+
+def _as_domain_index(sample_domain):
+    """Index the domain labels once, or pass None and indices through."""
+    if sample_domain is None or isinstance(sample_domain, DomainIndex):
+        return sample_domain
+    return DomainIndex(sample_domain)
+
+
 def check_X_y_domain(
     X,
     y,
@@ -46,7 +141,7 @@ def check_X_y_domain(
         Input features
     y : array-like of shape (n_samples,)
         Target variable
-    sample_domain : array-like or None, optional (default=None)
+    sample_domain : array-like, DomainIndex or None, optional (default=None)
         Array specifying the domain labels for each sample.
     allow_source : bool, optional (default=True)
         Allow the presence of source domains.
@@ -76,6 +171,10 @@ def check_X_y_domain(
     y = check_array(y, force_all_finite=not allow_label_masks, ensure_2d=False, input_name='y')
     check_consistent_length(X, y)
 
+    domain_index = None
+    if isinstance(sample_domain, DomainIndex):
+        domain_index = sample_domain
+        sample_domain = domain_index.sample_domain
     if sample_domain is None and not allow_auto_sample_domain:
         raise ValueError("Either 'sample_domain' or 'allow_auto_sample_domain' "
                          "should be set")
@@ -91,12 +190,15 @@ def check_X_y_domain(
             mask = (np.isnan(y))
         sample_domain[mask] = _DEFAULT_TARGET_DOMAIN_LABEL
 
-    source_idx = extract_source_indices(sample_domain)
-
     # xxx(okachaiev): this needs to be re-written to accommodate for a
     # a new domain labeling convention without "intersections"
-    n_sources = np.unique(sample_domain[source_idx]).shape[0]
-    n_targets = np.unique(sample_domain[~source_idx]).shape[0]
+    if domain_index is None:
+        source_idx = extract_source_indices(sample_domain)
+        n_sources = np.unique(sample_domain[source_idx]).shape[0]
+        n_targets = np.unique(sample_domain[~source_idx]).shape[0]
+    else:
+        n_sources = domain_index.n_sources
+        n_targets = domain_index.n_targets
 
     if not allow_source and n_sources > 0:
         raise ValueError(f"Number of sources provided is {n_sources} "
@@ -136,7 +238,7 @@ def check_X_domain(
     ----------
     X : array-like of shape (n_samples, n_features)
         Input features.
-    sample_domain : array-like of shape (n_samples,)
+    sample_domain : array-like of shape (n_samples,) or DomainIndex
         Domain labels for each sample.
     allow_domains : set of int, optional (default=None)
         Set of allowed domain labels. If provided, only these domain labels are allowed.
@@ -162,6 +264,10 @@ def check_X_domain(
     """
     X = check_array(X, input_name='X', allow_nd=allow_nd)
 
+    domain_index = None
+    if isinstance(sample_domain, DomainIndex):
+        domain_index = sample_domain
+        sample_domain = domain_index.sample_domain
     if sample_domain is None and not allow_auto_sample_domain:
         raise ValueError("Either 'sample_domain' or 'allow_auto_sample_domain' "
                          "should be set")
@@ -173,18 +279,26 @@ def check_X_domain(
             _DEFAULT_TARGET_DOMAIN_ONLY_LABEL * np.ones(X.shape[0], dtype=np.int32)
         )
 
-    source_idx = extract_source_indices(sample_domain)
     check_consistent_length(X, sample_domain)
 
     if allow_domains is not None:
-        for domain in np.unique(sample_domain):
+        if domain_index is None:
+            domains = np.unique(sample_domain)
+        else:
+            domains = domain_index.domains
+        for domain in domains:
             # xxx(okachaiev): re-definition of the wildcards
             wildcard = np.inf if domain >= 0 else -np.inf
             if domain not in allow_domains and wildcard not in allow_domains:
                 raise ValueError(f"Unknown domain label '{domain}' given")
 
-    n_sources = np.unique(sample_domain[source_idx]).shape[0]
-    n_targets = np.unique(sample_domain[~source_idx]).shape[0]
+    if domain_index is None:
+        source_idx = extract_source_indices(sample_domain)
+        n_sources = np.unique(sample_domain[source_idx]).shape[0]
+        n_targets = np.unique(sample_domain[~source_idx]).shape[0]
+    else:
+        n_sources = domain_index.n_sources
+        n_targets = domain_index.n_targets
 
     if not allow_source and n_sources > 0:
         raise ValueError(f"Number of sources provided is {n_sources} "
@@ -207,7 +321,7 @@ def extract_source_indices(sample_domain):
 
     Parameters
     ----------
-    sample_domain : array-like of shape (n_samples,)
+    sample_domain : array-like of shape (n_samples,) or DomainIndex
         Array specifying the domain labels for each sample.
 
     Returns
@@ -215,6 +329,9 @@ def extract_source_indices(sample_domain):
     source_idx : array
         Boolean array indicating source indices.
     """
+    if isinstance(sample_domain, DomainIndex):
+        return sample_domain.source_mask.copy()
+
     sample_domain = check_array(
         sample_domain,
         dtype=np.int32,
@@ -232,7 +349,7 @@ def extract_domains_indices(sample_domain, split_source_target=False):
 
     Parameters
     ----------
-    sample_domain : array-like of shape (n_samples,)
+    sample_domain : array-like of shape (n_samples,) or DomainIndex
         Array specifying the domain labels for each sample.
     split_source_target : bool, optional (default=False)
         Whether to split the source and target domains.
@@ -247,19 +364,22 @@ def extract_domains_indices(sample_domain, split_source_target=False):
         - source_idx: keys >= 0
         - target_idx: keys < 0
     """
-    sample_domain = check_array(
-        sample_domain,
-        dtype=np.int32,
-        ensure_2d=False,
-        input_name='sample_domain'
-    )
+    if isinstance(sample_domain, DomainIndex):
+        domain_idx = dict(sample_domain.indices)
+    else:
+        sample_domain = check_array(
+            sample_domain,
+            dtype=np.int32,
+            ensure_2d=False,
+            input_name='sample_domain'
+        )
 
-    domain_idx = {}
+        domain_idx = {}
 
-    unique_domains = np.unique(sample_domain)
-    for domain in unique_domains:
-        source_idx = (sample_domain == domain)
-        domain_idx[domain] = np.flatnonzero(source_idx)
+        unique_domains = np.unique(sample_domain)
+        for domain in unique_domains:
+            source_idx = (sample_domain == domain)
+            domain_idx[domain] = np.flatnonzero(source_idx)
 
     if split_source_target:
         source_domain_idx = {k: v for k, v in domain_idx.items() if k >= 0}
@@ -282,7 +402,7 @@ def source_target_split(
         split. All arrays should have the same length except if None is given
         then a couple of None variables are returned to allow for optional
         sample_weight.
-    sample_domain : array-like of shape (n_samples,)
+    sample_domain : array-like of shape (n_samples,) or DomainIndex
         Array specifying the domain labels for each sample.
 
     Returns
@@ -295,10 +415,15 @@ def source_target_split(
 
     check_consistent_length(arrays)
 
-    source_idx = extract_source_indices(sample_domain)
+    if isinstance(sample_domain, DomainIndex):
+        source_idx = sample_domain.source_mask
+        target_idx = sample_domain.target_mask
+    else:
+        source_idx = extract_source_indices(sample_domain)
+        target_idx = ~source_idx
 
     return list(chain.from_iterable(
-        (a[source_idx], a[~source_idx]) if a is not None else (None, None)
+        (a[source_idx], a[target_idx]) if a is not None else (None, None)
         for a in arrays
     ))
 
@@ -314,10 +439,8 @@ def per_domain_split(
         split. All arrays should have the same length except if None is given
         then a couple of None variables are returned to allow for optional
         sample_weight.
-    sample_domain : array-like of shape (n_samples,)
+    sample_domain : array-like of shape (n_samples,) or DomainIndex
         Array specifying the domain labels for each sample.
-    split_source_target : bool, optional (default=False)
-        Whether to split the source and target domains.
 
     Returns
     -------
@@ -331,7 +454,10 @@ def per_domain_split(
 
     check_consistent_length(arrays)
 
-    domain_idx = extract_domains_indices(sample_domain, False)
+    if isinstance(sample_domain, DomainIndex):
+        domain_idx = sample_domain.indices
+    else:
+        domain_idx = extract_domains_indices(sample_domain, False)
 
     source_dict = {}
     target_dict = {}
@@ -571,9 +697,41 @@ def _merge_arrays(
     return output
 
 
+_QP_SOLVERS = {}
+
+
+def register_qp_solver(name, func=None):
+    """Register a solver that can be used in :func:`qp_solve`.
+
+    Can be used as a decorator. The solver is called as
+    ``func(Q, c, A, b, Aeq, beq, lb, ub, x0, tol, max_iter, verbose, log,
+    **solver_options)`` and should return ``(x, val)`` or ``(x, val, log)``
+    when `log` is True.
+
+    Parameters
+    ----------
+    name : str
+        Name of the solver, used as the `solver` argument of :func:`qp_solve`.
+    func : callable, optional
+        The solver. If None, a decorator registering the function is returned.
+
+    Returns
+    -------
+    func : callable
+        The registered solver (or the decorator if `func` is None).
+    """
+    def decorator(func):
+        _QP_SOLVERS[name] = func
+        return func
+
+    if func is None:
+        return decorator
+    return decorator(func)
+
+
 def qp_solve(Q, c=None, A=None, b=None, Aeq=None, beq=None,
              lb=None, ub=None, x0=None, tol=1e-6, max_iter=1000,
-             verbose=False, log=False, solver="scipy"):
+             verbose=False, log=False, solver="scipy", solver_options=None):
     r""" Solves a standard quadratic program
 
     Solve the following optimization problem:
@@ -618,8 +776,10 @@ def qp_solve(Q, c=None, A=None, b=None, Aeq=None, beq=None,
 
     Parameters
     ----------
-    Q : (d,d) ndarray, float64, optional
-        Quadratic cost matrix matrix
+    Q : (d,d) ndarray or LinearOperator, float64, optional
+        Quadratic cost matrix matrix. Only products `Q @ x` are used, so
+        a :class:`scipy.sparse.linalg.LinearOperator` can be given to avoid
+        materializing a large (possibly low-rank) matrix.
     c : (d,) ndarray, float64, optional
         Linear cost vector
     A : (n,d) ndarray, float64, optional
@@ -645,7 +805,11 @@ def qp_solve(Q, c=None, A=None, b=None, Aeq=None, beq=None,
     log : boolean, optional
         Return a dictionary with optim information in addition to x and val
     solver : str, optional default='scipy'
-        Available solvers : 'scipy', 'frank-wolfe'
+        Available solvers : 'scipy', 'frank-wolfe', 'admm' and the solvers
+        added with :func:`register_qp_solver`.
+    solver_options : dict, optional
+        Additional parameters given to the solver, e.g. the dual warm start
+        `y0` or the penalty `rho` of the 'admm' solver.
 
     Returns
     -------
@@ -656,19 +820,17 @@ def qp_solve(Q, c=None, A=None, b=None, Aeq=None, beq=None,
     log: dict
         Optional log output
     """
-    solver_list = ["scipy", "frank-wolfe"]
-
-    if solver == "scipy":
-        return _qp_solve_scipy(Q, c, A, b, Aeq, beq, lb, ub,
-                               x0, tol, max_iter, verbose, log)
-    elif solver == "frank-wolfe":
-        return _qp_solve_frank_wolfe(Q, c, A, b, Aeq, beq,
-                                     x0, max_iter)
-    else:
+    if solver not in _QP_SOLVERS:
         raise ValueError("`solver` argument should be included in %s,"
-                         " got '%s'" % (solver_list, str(solver)))
+                         " got '%s'" % (list(_QP_SOLVERS), str(solver)))
 
+    if solver_options is None:
+        solver_options = {}
+    return _QP_SOLVERS[solver](Q, c, A, b, Aeq, beq, lb, ub, x0, tol,
+                               max_iter, verbose, log, **solver_options)
 
+
+@register_qp_solver("scipy")
 def _qp_solve_scipy(Q, c=None, A=None, b=None, Aeq=None, beq=None,
                     lb=None, ub=None, x0=None, tol=1e-6, max_iter=1000,
                     verbose=False, log=False):
@@ -784,9 +946,11 @@ def _qp_solve_scipy(Q, c=None, A=None, b=None, Aeq=None, beq=None,
     return outputs
 
 
+@register_qp_solver("frank-wolfe")
 def _qp_solve_frank_wolfe(Q, c=None, A=None, b=None,
-                          Aeq=None, beq=None, x0=None,
-                          max_iter=1000):
+                          Aeq=None, beq=None, lb=None, ub=None,
+                          x0=None, tol=1e-6, max_iter=1000,
+                          verbose=False, log=False):
     r""" Solves a quadratic program with Frank-Wolfe algorithm
 
     Solve the following optimization problem:
@@ -825,10 +989,20 @@ def _qp_solve_frank_wolfe(Q, c=None, A=None, b=None,
         Linear equality constraint matrix .
     beq : (n,) ndarray, float64, optional
         Linear equality constraint vector.
+    lb : (d) ndarray, float64, optional
+        Ignored, the solution is always non-negative.
+    ub : (d) ndarray, float64, optional
+        Ignored.
     x0 : (d,) ndarray, float64, optional
         Initialization. Ones by default.
+    tol : float, optional
+        Tolerance on the Frank-Wolfe duality gap for termination.
     max_iter : int, optional
         Maximum number of iterations to perform.
+    verbose : boolean, optional
+        Print optimization information.
+    log : boolean, optional
+        Return a dictionary with optim information in addition to x and val
 
     Returns
     -------
@@ -836,6 +1010,8 @@ def _qp_solve_frank_wolfe(Q, c=None, A=None, b=None,
         Optimal solution x
     val: float
         optimal value of the objective (None if optimization error)
+    log: dict
+        Optional log output
     """
     if Aeq is not None and Aeq.shape[0] > 1:
         raise ValueError("`Aeq.shape[0]` must be equal to 1"
@@ -869,22 +1045,24 @@ def _qp_solve_frank_wolfe(Q, c=None, A=None, b=None,
             return Q @ x + c
 
     if Aeq is not None:
-        x = frank_wolfe(jac, Aeq[0], beq[0], beq[0],
-                        x0, max_iter)
+        c_fw, clb, cub = Aeq[0], beq[0], beq[0]
     elif A is not None:
         if A.shape[0] > 1:
-            x = frank_wolfe(jac, A[0], -b[1], b[0],
-                            x0, max_iter)
+            c_fw, clb, cub = A[0], -b[1], b[0]
         else:
-            x = frank_wolfe(jac, A[0], b[0], b[0],
-                            x0, max_iter)
+            c_fw, clb, cub = A[0], b[0], b[0]
     else:
         raise ValueError("`A` or `Aeq` must be given when"
                          " using the 'frank-wolfe' solver")
+    x, log_fw = frank_wolfe(jac, c_fw, clb, cub, x0, max_iter,
+                            tol=tol, verbose=verbose, log=True)
+    if log:
+        return x, func(x), log_fw
     return x, func(x)
 
 
-def frank_wolfe(jac, c, clb=1., cub=1., x0=None, max_iter=1000):
+def frank_wolfe(jac, c, clb=1., cub=1., x0=None, max_iter=1000,
+                tol=None, verbose=False, log=False):
     r"""Frank-Wolfe algorithm for convex programming
 
     Solve the following convex optimization problem:
@@ -908,30 +1086,301 @@ def frank_wolfe(jac, c, clb=1., cub=1., x0=None, max_iter=1000):
         Upper bound of the linear constraint.
     max_iter : int, optional, default=1000
         Maximum number of iterations to perform.
+    tol : float, optional, default=None
+        Tolerance on the Frank-Wolfe duality gap for termination.
+        If None, `max_iter` iterations are always performed.
+    verbose : boolean, optional, default=False
+        Print optimization information.
+    log : boolean, optional, default=False
+        Return a dictionary with optim information in addition to x.
 
     Returns
     -------
     x: (d,) ndarray
         Optimal solution x
+    log: dict
+        Optional log output
     """
     inv_c = 1. / c
 
     if x0 is None:
         x0 = inv_c * ((cub - clb) / 2) / c.shape[0]
 
-    x = x0
+    # the iterate is updated in place
+    x = np.array(x0, dtype=np.float64)
 
+    log_dict = {"n_iter": 0, "gaps": [], "times": []}
+    start = time.perf_counter()
     for k in range(1, max_iter+1):
         grad = jac(x)
         product = grad * inv_c
         index = np.argmin(product)
-        vect = np.zeros(c.shape[0])
+        # the vertex is only non-zero at `index`
         if product[index] >= 0:
-            vect[index] = inv_c[index] * clb
+            vertex = inv_c[index] * clb
         else:
-            vect[index] = inv_c[index] * cub
+            vertex = inv_c[index] * cub
+        gap = grad @ x - grad[index] * vertex
+
+        log_dict["n_iter"] = k
+        log_dict["gaps"].append(gap)
+        log_dict["times"].append(time.perf_counter() - start)
+        if verbose and (k % 100 == 1 or k == max_iter):
+            print(f"{k:5d}|{gap:12.6e}")
+        # x0 may be infeasible, the gap is only meaningful after one step
+        if tol is not None and k > 1 and gap <= tol:
+            break
+
         lr = 2. / (k + 1.)
-        x = (1 - lr) * x + lr * vect
+        x *= (1 - lr)
+        x[index] += lr * vertex
+
+    if log:
+        return x, log_dict
+    return x
+
+
+@register_qp_solver("admm")
+def _qp_solve_admm(Q, c=None, A=None, b=None, Aeq=None, beq=None,
+                   lb=None, ub=None, x0=None, tol=1e-6, max_iter=1000,
+                   verbose=False, log=False, y0=None, rho=0.1, sigma=1e-6,
+                   alpha=1.6, adaptive_rho_interval=25):
+    r""" Solves a standard quadratic program with ADMM
+
+    Solve the following optimization problem:
+
+    .. math::
+        \min_x \quad  \frac{1}{2}x^TQx + x^Tc
+
+
+        lb <= x <= ub
+
+        Ax <= b
+
+        A_{eq} x = b_{eq}
+
+    with the operator splitting of OSQP [1]_. The constraints are written
+    as :math:`l <= Cx <= u` and the iterations alternate between a linear
+    system in x and a projection on the box [l, u]. When `Q` is an ndarray
+    the linear system is factorized once (and again each time the penalty
+    is updated). When `Q` is a LinearOperator with a `factor` attribute F
+    such that Q = F F^T, the system is solved with the Woodbury identity.
+    Otherwise it is solved with warm-started conjugate gradients so that
+    only products `Q @ x` are needed.
+
+    Parameters
+    ----------
+    Q : (d,d) ndarray or LinearOperator, float64
+        Quadratic cost matrix matrix
+    c : (d,) ndarray, float64, optional
+        Linear cost vector
+    A : (n,d) ndarray, float64, optional
+        Linear inequality constraint matrix.
+    b : (n,) ndarray, float64, optional
+        Linear inequality constraint vector.
+    Aeq : (n,d) ndarray, float64, optional
+        Linear equality constraint matrix .
+    beq : (n,) ndarray, float64, optional
+        Linear equality constraint vector.
+    lb : (d) ndarray, float64, optional
+        Lower bound constraint, -np.inf if not provided.
+    ub : (d) ndarray, float64, optional
+        Upper bound constraint, np.inf if not provided.
+    x0 : (d,) ndarray, float64, optional
+        Primal warm start. Ones by default.
+    tol : float, optional
+        Absolute and relative tolerance on the primal and dual residuals.
+    max_iter : int, optional
+        Maximum number of iterations to perform.
+    verbose : boolean, optional
+        Print optimization information.
+    log : boolean, optional
+        Return a dictionary with optim information in addition to x and val
+    y0 : (m,) ndarray, float64, optional
+        Dual warm start, e.g. the `y` entry of the log of a previous call.
+        Zeros by default.
+    rho : float, optional
+        Initial penalty parameter, adapted during the iterations.
+    sigma : float, optional
+        Regularization of the linear system.
+    alpha : float, optional
+        Relaxation parameter in (0, 2).
+    adaptive_rho_interval : int, optional
+        Number of iterations between two updates of the penalty.
+
+    Returns
+    -------
+    x: (d,) ndarray
+        Optimal solution x
+    val: float
+        optimal value of the objective
+    log: dict
+        Optional log output
+
+    References
+    ----------
+    .. [1] B. Stellato, G. Banjac, P. Goulart, A. Bemporad and S. Boyd.
+           OSQP: an operator splitting solver for quadratic programs.
+           Mathematical Programming Computation, 2020.
+    """
+    start = time.perf_counter()
+    d = Q.shape[0]
+    c = np.zeros(d) if c is None else np.asarray(c, dtype=np.float64)
+
+    # constraints lower <= Cx <= upper with C = [I; A; Aeq], the identity
+    # block is only used if bounds are given and is never materialized
+    C_blocks, lower_blocks, upper_blocks = [], [], []
+    if A is not None:
+        C_blocks.append(A)
+        lower_blocks.append(np.full(A.shape[0], -np.inf))
+        upper_blocks.append(b)
+    if Aeq is not None:
+        C_blocks.append(Aeq)
+        lower_blocks.append(beq)
+        upper_blocks.append(beq)
+    C = np.vstack(C_blocks) if C_blocks else np.zeros((0, d))
+    has_bounds = lb is not None or ub is not None
+    if has_bounds:
+        lower_blocks.insert(0, np.full(d, -np.inf) if lb is None else lb)
+        upper_blocks.insert(0, np.full(d, np.inf) if ub is None else ub)
+    n_bounds = d if has_bounds else 0
+    lower = np.concatenate(lower_blocks) if lower_blocks else np.zeros(0)
+    upper = np.concatenate(upper_blocks) if upper_blocks else np.zeros(0)
+
+    def C_dot(x):
+        if has_bounds:
+            return np.concatenate([x, C @ x])
+        return C @ x
+
+    def CT_dot(v):
+        res = C.T @ v[n_bounds:]
+        if has_bounds:
+            res += v[:n_bounds]
+        return res
+
+    def get_rho_vec(rho):
+        rho_vec = np.full(lower.shape[0], rho)
+        rho_vec[(lower == -np.inf) & (upper == np.inf)] = 1e-6
+        rho_vec[lower == upper] = 1e3 * rho
+        return rho_vec
+
+    def get_linear_solver(rho_vec):
+        if Q_factor is not None:
+            # Woodbury identity on diag + U U^T with U = [F, C^T sqrt(rho)]
+            diag = sigma + (rho_vec[:n_bounds] if has_bounds else np.zeros(d))
+            U = np.hstack([Q_factor, C.T * np.sqrt(rho_vec[n_bounds:])])
+            inv_diag_U = U / diag[:, None]
+            small_factor = cho_factor(np.eye(U.shape[1]) + U.T @ inv_diag_U)
+
+            def solve(rhs, x_guess):
+                inv_diag_rhs = rhs / diag
+                return inv_diag_rhs - inv_diag_U @ cho_solve(
+                    small_factor, U.T @ inv_diag_rhs)
+            return solve
+
+        if isinstance(Q, np.ndarray):
+            M = Q + C.T @ (rho_vec[n_bounds:, None] * C)
+            M[np.diag_indices(d)] += sigma + (rho_vec[:n_bounds] if has_bounds else 0)
+            try:
+                factor = cho_factor(M)
+                return lambda rhs, x_guess: cho_solve(factor, rhs)
+            except LinAlgError:
+                factor = lu_factor(M)
+                return lambda rhs, x_guess: lu_solve(factor, rhs)
+
+        def matvec(v):
+            return Q @ v + sigma * v + CT_dot(rho_vec * C_dot(v))
+
+        return lambda rhs, x_guess: _conjugate_gradient(
+            matvec, rhs, x_guess, tol=min(1e-3, tol), max_iter=d
+        )
+
+    Q_factor = getattr(Q, "factor", None)
+
+    x = np.ones(d) if x0 is None else np.array(x0, dtype=np.float64)
+    z = np.clip(C_dot(x), lower, upper)
+    y = np.zeros(lower.shape[0]) if y0 is None else np.array(y0, dtype=np.float64)
+    rho_vec = get_rho_vec(rho)
+    solve = get_linear_solver(rho_vec)
+
+    log_dict = {"n_iter": 0, "converged": False, "primal_residuals": [],
+                "dual_residuals": [], "times": []}
+    if verbose:
+        print(f"{'It.':>5}|{'Primal res.':>12}|{'Dual res.':>12}|{'Rho':>12}")
+    for k in range(1, max_iter + 1):
+        x_tilde = solve(sigma * x - c + CT_dot(rho_vec * z - y), x)
+        z_tilde = C_dot(x_tilde)
+        x = alpha * x_tilde + (1 - alpha) * x
+        z_relaxed = alpha * z_tilde + (1 - alpha) * z
+        z = np.clip(z_relaxed + y / rho_vec, lower, upper)
+        y = y + rho_vec * (z_relaxed - z)
+
+        Cx, Qx, CTy = C_dot(x), Q @ x, CT_dot(y)
+        primal_res = _norm_inf(Cx - z)
+        dual_res = _norm_inf(Qx + c + CTy)
+        primal_scale = max(_norm_inf(Cx), _norm_inf(z))
+        dual_scale = max(_norm_inf(Qx), _norm_inf(CTy), _norm_inf(c))
+
+        log_dict["n_iter"] = k
+        log_dict["primal_residuals"].append(primal_res)
+        log_dict["dual_residuals"].append(dual_res)
+        log_dict["times"].append(time.perf_counter() - start)
+        if verbose and (k % adaptive_rho_interval == 1 or k == max_iter):
+            print(f"{k:5d}|{primal_res:12.6e}|{dual_res:12.6e}|{rho:12.6e}")
+
+        if (primal_res <= tol + tol * primal_scale and
+                dual_res <= tol + tol * dual_scale):
+            log_dict["converged"] = True
+            break
+
+        if k % adaptive_rho_interval == 0 and primal_res > 0 and dual_res > 0:
+            new_rho = rho * np.sqrt(
+                (primal_res / max(primal_scale, 1e-10)) /
+                (dual_res / max(dual_scale, 1e-10))
+            )
+            new_rho = np.clip(new_rho, 1e-6, 1e6)
+            if new_rho > 5 * rho or new_rho < rho / 5:
+                rho = new_rho
+                rho_vec = get_rho_vec(rho)
+                solve = get_linear_solver(rho_vec)
+
+    if not log_dict["converged"]:
+        warnings.warn("ADMM did not converge: maximum number of iterations "
+                      f"reached (primal residual {primal_res:.2e}, "
+                      f"dual residual {dual_res:.2e}).")
+
+    if has_bounds:
+        x = np.clip(x, lower[:d], upper[:d])
+    val = (1/2) * x @ (Q @ x) + x @ c
+
+    outputs = (x, val)
+    if log:
+        log_dict.update(y=y, z=z, rho=rho)
+        outputs += (log_dict,)
+    return outputs
+
+
+def _norm_inf(v):
+    return np.max(np.abs(v)) if v.size > 0 else 0.
+
+
+def _conjugate_gradient(matvec, b, x0, tol=1e-6, max_iter=1000):
+    """Solve `M x = b` for a symmetric positive definite M given by `matvec`."""
+    x = np.array(x0, dtype=np.float64)
+    r = b - matvec(x)
+    p = r.copy()
+    rr = r @ r
+    threshold = (tol * np.linalg.norm(b)) ** 2
+    for _ in range(max_iter):
+        if rr <= threshold:
+            break
+        Mp = matvec(p)
+        step = rr / (p @ Mp)
+        x += step * p
+        r -= step * Mp
+        rr_new = r @ r
+        p = r + (rr_new / rr) * p
+        rr = rr_new
     return x
 
 